@@ -0,0 +1,139 @@
+"""
+Load test for the fetch path (AuthClient -> UnstableAPIClient -> ApiDataService)
+against the local simulator server (dev/local_server.py), fully offline.
+
+Each scenario starts a fresh server with its page count, latency, fail
+rates, Retry-After and connection cap, fetches every page with
+fetch_all_to_df and reports:
+
+- pages_per_sec: successfully fetched pages per wall-clock second
+- p50_ms / p99_ms: page latency including retries and backoff (page_fetch spans)
+- wasted_requests: data requests that did not yield a page (errors, throttling)
+- peak_mb: peak Python heap allocated during the run (tracemalloc)
+
+    python -m benchmarks.api_load_test --pages 500 --max-in-flight 1 8 32 --output load.json
+"""
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+
+from dev.local_server import LocalApiServer
+from dev.unstable_api_simulator import SimulatorSettings
+from src.api.api_data_service import ApiDataService
+from src.api.auth_client import AuthClient
+from src.api.unstable_api_client import UnstableAPIClient
+from src.common.metrics import InMemorySink, Metrics
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+MB = 1024 * 1024
+
+# name -> LocalApiServer/SimulatorSettings overrides
+SCENARIOS = {
+    "clean": {},
+    "slow-tail": {"latency_sigma": 1.0},
+    "throttled": {"fail_rate_429": 0.1, "retry_after": 0.05},
+    "unavailable": {"fail_rate_503": 0.05, "retry_after": 0.05},
+    "capped": {"max_connections": 4, "retry_after": 0.05},
+}
+SETTINGS_FIELDS = ("total_pages", "page_size", "fail_rate_500", "fail_rate_429", "fail_rate_503")
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _quiet_logger():
+    logger = logging.getLogger("api_load_test")
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+    return logger
+
+
+def run_scenario(name, overrides, pages, page_size, latency, max_in_flight, trace_memory=True):
+    """Fetch every page of one simulated API and measure the run."""
+    options = {"total_pages": pages, "page_size": page_size, "fail_rate_500": 0.0, "fail_rate_429": 0.0}
+    options.update(overrides)
+    settings = SimulatorSettings(**{k: v for k, v in options.items() if k in SETTINGS_FIELDS})
+    server_options = {k: v for k, v in options.items() if k not in SETTINGS_FIELDS}
+    server_options.setdefault("latency", latency)
+
+    logger = _quiet_logger()
+    sink = InMemorySink()
+    metrics = Metrics(sinks=[sink])
+
+    with LocalApiServer(settings, **server_options) as server:
+        auth = AuthClient(server.auth_url, "test_user", "test_password", logger)
+        client = UnstableAPIClient(server.data_url, auth, logger, max_in_flight=max_in_flight, metrics=metrics)
+        storage = StorageDataService(InMemoryS3Client(logger), DataFormatService(), logger)
+        service = ApiDataService(client, storage, logger, metrics=metrics)
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        df = service.fetch_all_to_df(limit=page_size)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+        if trace_memory:
+            tracemalloc.stop()
+        server_stats = server.stats()
+        client.session.close()
+
+    latencies = [span["duration"] for span in sink.spans("page_fetch")]
+    return {
+        "scenario": name,
+        "max_in_flight": max_in_flight,
+        "pages": pages,
+        "rows": len(df),
+        "seconds": round(seconds, 3),
+        "pages_per_sec": round(client.successful_pages / seconds, 1),
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        "failed_pages": client.failed_pages,
+        "retries": client.retry_count,
+        "wasted_requests": server_stats["requests"] - client.successful_pages,
+        "server_rejected": server_stats["rejected"],
+        "peak_connections": server_stats["peak_connections"],
+        "peak_mb": round(peak / MB, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.01, help="Median server latency in seconds")
+    parser.add_argument("--max-in-flight", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--no-trace-memory", action="store_true", help="Skip tracemalloc (its overhead skews throughput)")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.scenarios:
+        for max_in_flight in args.max_in_flight:
+            result = run_scenario(
+                name, SCENARIOS[name], args.pages, args.page_size, args.latency, max_in_flight,
+                trace_memory=not args.no_trace_memory,
+            )
+            results.append(result)
+            print(
+                f"{name:<12} in_flight={max_in_flight:>3}  {result['pages_per_sec']:>8.1f} pages/s  "
+                f"p50={result['p50_ms']:>8.2f} ms  p99={result['p99_ms']:>8.2f} ms  "
+                f"wasted={result['wasted_requests']:>5}  peak={result['peak_mb']:>7.2f} MB"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Cold-import benchmark for the src package.
+
+Every module is imported in a fresh interpreter with `python -X importtime`,
+best of --repeat runs. The report gives the cumulative import time and the
+heavy third-party packages each import pulled in:
+
+    python -m benchmarks.import_time_benchmark --output imports.json
+    python -m benchmarks.import_time_benchmark --compare imports.json --tolerance 0.5
+
+Exits with status 1 if a module loads one of its DEFERRED packages (they
+must only be imported when first used), or, with --compare, if its import
+time regressed by more than --tolerance (fractional) against the baseline.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# module -> packages it must not import at module load
+DEFERRED = {
+    "src.main": ("pandas", "boto3", "tests"),
+    "src.common.metrics": ("pandas", "requests", "boto3"),
+    "src.common.logger.app_logger": ("pandas", "requests", "boto3"),
+    "src.api.auth_client": ("pandas", "numpy", "boto3", "botocore"),
+    "src.api.unstable_api_client": ("pandas", "numpy", "boto3", "asyncio"),
+    "src.api.api_data_service": ("pandas", "numpy", "pyarrow", "boto3"),
+    "src.storage.clients.s3_client": ("boto3", "pandas"),
+    "src.storage.clients.minio_client": ("boto3", "pandas"),
+    "src.storage.format.data_format_service": ("pandas", "pyarrow", "boto3"),
+    "src.storage.services.storage_data_service": ("pandas", "pyarrow", "boto3"),
+    "src.storage.loaders.postgres_loader": ("pandas", "psycopg", "psycopg_pool", "boto3"),
+}
+
+
+def measure_import(module):
+    """
+    Import module in a fresh interpreter.
+
+    Returns:
+        dict: {"module", "import_ms" (cumulative), "imported" (top-level package names)}
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    total_us = None
+    imported = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name == "package":  # header line
+            continue
+        imported.add(name.split(".")[0])
+        if name == module:
+            total_us = int(cumulative)
+    return {"module": module, "import_ms": round((total_us or 0) / 1000, 2), "imported": sorted(imported)}
+
+
+def run(modules, repeat):
+    results = []
+    for module in modules:
+        runs = [measure_import(module) for _ in range(repeat)]
+        best = min(runs, key=lambda result: result["import_ms"])
+        loaded = sorted(set(DEFERRED.get(module, ())) & set(best["imported"]))
+        results.append({"module": module, "import_ms": best["import_ms"], "deferred_loaded": loaded})
+    return results
+
+
+def compare(results, baseline_path, tolerance):
+    """Return a list of regression messages for imports slower than tolerance."""
+    with open(baseline_path) as f:
+        baseline = {r["module"]: r for r in json.load(f)["results"]}
+
+    regressions = []
+    for result in results:
+        before = baseline.get(result["module"])
+        if before and before["import_ms"]:
+            change = result["import_ms"] / before["import_ms"] - 1
+            if change > tolerance:
+                regressions.append(
+                    f"{result['module']}: {before['import_ms']:.1f} ms -> {result['import_ms']:.1f} ms (+{change:.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=list(DEFERRED))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+
+    results = run(args.modules, args.repeat)
+    for result in results:
+        print(f"{result['module']:<45} {result['import_ms']:>8.1f} ms  deferred loaded: {result['deferred_loaded'] or '-'}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+
+    failures = [
+        f"{result['module']} imports {', '.join(result['deferred_loaded'])} at load time"
+        for result in results if result["deferred_loaded"]
+    ]
+    if args.compare:
+        failures += compare(results, args.compare, args.tolerance)
+    for message in failures:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
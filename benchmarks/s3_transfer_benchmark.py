@@ -0,0 +1,93 @@
+"""
+Throughput benchmark for BaseS3Client multipart uploads and ranged downloads.
+
+Runs against local MinIO (see minio-postgres-compose.yml) by default:
+
+    python -m benchmarks.s3_transfer_benchmark --size-mb 256 --part-sizes-mb 5 8 16 64 --workers 8
+
+Use --in-memory to exercise the code path without a server.
+"""
+import argparse
+import json
+import logging
+import os
+import time
+
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.clients.minio_client import MinioClient
+
+MB = 1024 * 1024
+
+
+def make_client(args, logger):
+    if args.in_memory:
+        return InMemoryS3Client(logger)
+    return MinioClient(
+        logger=logger,
+        endpoint_url=args.endpoint_url,
+        access_key=args.access_key,
+        secret_key=args.secret_key,
+    )
+
+
+def run_case(client, bucket, data, part_size, workers):
+    """Upload and download data once with the given transfer settings."""
+    client.configure_transfers(part_size=part_size, max_workers=workers, multipart_threshold=part_size)
+    key = f"benchmarks/transfer-{part_size // MB}mb-{workers}w.bin"
+
+    start = time.perf_counter()
+    client.upload_bytes(bucket, key, data, content_type="application/octet-stream")
+    upload_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    downloaded = client.download_bytes(bucket, key)
+    download_seconds = time.perf_counter() - start
+
+    if len(downloaded) != len(data):
+        raise RuntimeError(f"Size mismatch for {key}: {len(downloaded)} != {len(data)}")
+
+    size_mb = len(data) / MB
+    return {
+        "part_size_mb": part_size // MB,
+        "workers": workers,
+        "size_mb": round(size_mb, 2),
+        "upload_mb_s": round(size_mb / upload_seconds, 2),
+        "download_mb_s": round(size_mb / download_seconds, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", default="http://localhost:9000")
+    parser.add_argument("--access-key", default="minioadmin")
+    parser.add_argument("--secret-key", default="minioadmin")
+    parser.add_argument("--bucket", default="benchmarks")
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("--part-sizes-mb", type=int, nargs="+", default=[5, 8, 16, 32, 64])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--in-memory", action="store_true", help="Use InMemoryS3Client instead of MinIO")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("s3_transfer_benchmark")
+    client = make_client(args, logger)
+    client.ensure_bucket(args.bucket)
+
+    data = os.urandom(args.size_mb * MB)
+    results = []
+    for part_size_mb in args.part_sizes_mb:
+        for workers in args.workers:
+            result = run_case(client, args.bucket, data, part_size_mb * MB, workers)
+            results.append(result)
+            print(
+                f"part={result['part_size_mb']:>3} MB  workers={result['workers']:>2}  "
+                f"upload={result['upload_mb_s']:>8.1f} MB/s  download={result['download_mb_s']:>8.1f} MB/s"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Serialization benchmark for DataFormatService codecs and StorageDataService.
+
+For every registered format it measures, on a synthetic frame:
+    - encode / decode time and throughput (MB/s of in-memory frame size)
+    - extra peak RSS while encoding / decoding (each in a fresh process) and
+      peak Python/numpy heap (tracemalloc; Arrow's own pool is not traced)
+    - encoded size and compression ratio
+and times an end-to-end upload_df / download_df against InMemoryS3Client.
+
+    python -m benchmarks.serialization_benchmark --rows 200000 --width 20 --output bench.json
+    python -m benchmarks.serialization_benchmark --compare bench.json --tolerance 0.25
+
+--compare exits with status 1 if any time metric regressed by more than
+--tolerance (fractional) against the given results file.
+"""
+import argparse
+import json
+import logging
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.synthetic import DTYPE_MIXES, make_frame
+
+MB = 1024 * 1024
+TIME_METRICS = ("encode_s", "decode_s", "upload_s", "download_s")
+
+
+def _peak_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (MB if sys.platform == "darwin" else 1024)
+
+
+def _best_of(repeat, func):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _peak_heap_mb(func):
+    """Peak Python/numpy heap allocated while func runs (tracemalloc; untimed)."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / MB
+    finally:
+        tracemalloc.stop()
+
+
+def run_codec_case(format, rows, width, mix, null_fraction, repeat):
+    """
+    Encode one format in its own process.
+
+    Returns:
+        tuple: (result dict, encoded bytes for run_decode_case)
+    """
+    from src.storage.format.data_format_service import DataFormatService
+
+    fmt = DataFormatService()
+    df = make_frame(rows, width, mix, null_fraction)
+    frame_mb = df.memory_usage(deep=True).sum() / MB
+    # Warm up so lazy imports (pyarrow, ...) don't count toward peak RSS
+    fmt.decode(fmt.encode(df.head(10), format), format)
+
+    rss_before = _peak_rss_mb()
+    encode_s, data = _best_of(repeat, lambda: fmt.encode(df, format))
+    rss_after_encode = _peak_rss_mb()
+
+    return {
+        "case": "codec",
+        "format": format,
+        "frame_mb": round(frame_mb, 3),
+        "encoded_mb": round(len(data) / MB, 3),
+        "ratio": round(frame_mb / max(len(data) / MB, 1e-9), 3),
+        "encode_s": round(encode_s, 5),
+        "encode_mb_s": round(frame_mb / encode_s, 2),
+        "encode_peak_rss_mb": round(rss_after_encode - rss_before, 2),
+        "encode_peak_heap_mb": round(_peak_heap_mb(lambda: fmt.encode(df, format)), 2),
+    }, data
+
+
+def run_decode_case(format, data, frame_mb, repeat):
+    """
+    Decode one format in a fresh process. ru_maxrss is a process-lifetime
+    high-water mark, so only a process that has done nothing bigger than
+    holding `data` attributes its RSS growth to decoding.
+    """
+    from src.storage.format.data_format_service import DataFormatService
+
+    fmt = DataFormatService()
+    fmt.decode(fmt.encode(make_frame(10, 2, "mixed", 0.0), format), format)
+
+    rss_before = _peak_rss_mb()
+    decode_s, _ = _best_of(repeat, lambda: fmt.decode(data, format))
+    rss_after_decode = _peak_rss_mb()
+
+    return {
+        "decode_s": round(decode_s, 5),
+        "decode_mb_s": round(frame_mb / decode_s, 2),
+        "decode_peak_rss_mb": round(rss_after_decode - rss_before, 2),
+        "decode_peak_heap_mb": round(_peak_heap_mb(lambda: fmt.decode(data, format)), 2),
+    }
+
+
+def run_storage_case(format, rows, width, mix, null_fraction, repeat):
+    """End-to-end upload_df / download_df against an in-process S3 stand-in."""
+    from src.storage.clients.memory_client import InMemoryS3Client
+    from src.storage.format.data_format_service import DataFormatService
+    from src.storage.services.storage_data_service import StorageDataService
+
+    logger = logging.getLogger("serialization_benchmark")
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("bench")
+    storage = StorageDataService(client, DataFormatService(), logger)
+    df = make_frame(rows, width, mix, null_fraction)
+    key = f"bench.{format}"
+    storage.upload_df(df.head(10), bucket="bench", key=key, format=format)
+    storage.download_df("bench", key, format=format)
+
+    rss_before = _peak_rss_mb()
+    upload_s, _ = _best_of(repeat, lambda: storage.upload_df(df, bucket="bench", key=key, format=format))
+    download_s, _ = _best_of(repeat, lambda: storage.download_df("bench", key, format=format))
+
+    return {
+        "case": "storage",
+        "format": format,
+        "upload_s": round(upload_s, 5),
+        "download_s": round(download_s, 5),
+        "peak_rss_mb": round(_peak_rss_mb() - rss_before, 2),
+    }
+
+
+def environment():
+    from importlib import metadata
+
+    versions = {}
+    for package in ("pandas", "pyarrow", "numpy"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"python": platform.python_version(), "platform": platform.platform(), "commit": commit, **versions}
+
+
+def compare(results, baseline_path, tolerance):
+    """Return a list of regression messages for time metrics worse than tolerance."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    previous = {(r["case"], r["format"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get((result["case"], result["format"]))
+        if not before:
+            continue
+        for metric in TIME_METRICS:
+            if metric in result and before.get(metric):
+                change = result[metric] / before[metric] - 1
+                if change > tolerance:
+                    regressions.append(
+                        f"{result['case']}/{result['format']} {metric}: "
+                        f"{before[metric]:.4f}s -> {result[metric]:.4f}s (+{change:.0%})"
+                    )
+    return regressions
+
+
+def main():
+    from src.storage.format.data_format_service import DataFormatService
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=12)
+    parser.add_argument("--mix", choices=sorted(DTYPE_MIXES), default="mixed")
+    parser.add_argument("--null-fraction", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--formats", nargs="+", default=sorted(DataFormatService().codecs))
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    params = (args.rows, args.width, args.mix, args.null_fraction, args.repeat)
+    results = []
+
+    # One process per measurement so the peak RSS of one doesn't mask another
+    for format in args.formats:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result, data = pool.submit(run_codec_case, format, *params).result()
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result.update(pool.submit(run_decode_case, format, data, result["frame_mb"], args.repeat).result())
+        results.append(result)
+        print(json.dumps(result))
+    for format in args.formats:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(run_storage_case, format, *params).result()
+        results.append(result)
+        print(json.dumps(result))
+
+    report = {
+        "environment": environment(),
+        "params": {
+            "rows": args.rows,
+            "width": args.width,
+            "mix": args.mix,
+            "null_fraction": args.null_fraction,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Deterministic synthetic DataFrames for benchmarks.
+"""
+import numpy as np
+import pandas as pd
+
+# Column kinds cycled through when building a frame
+DTYPE_MIXES = {
+    "numeric": ["int", "float"],
+    "strings": ["string", "category"],
+    "mixed": ["int", "float", "string", "timestamp", "category", "bool"],
+}
+
+
+def make_frame(rows=100_000, width=10, mix="mixed", null_fraction=0.05, seed=0):
+    """
+    Build a frame with `width` columns cycling through the kinds in DTYPE_MIXES[mix].
+
+    Args:
+        rows (int): Number of rows.
+        width (int): Number of columns.
+        mix (str): Key of DTYPE_MIXES.
+        null_fraction (float): Share of nulls injected into every column
+            except ints and bools (which can't hold NaN without changing dtype).
+        seed (int): RNG seed, so runs are comparable.
+
+    Returns:
+        pd.DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    kinds = DTYPE_MIXES[mix]
+    columns = {}
+
+    for i in range(width):
+        kind = kinds[i % len(kinds)]
+        name = f"{kind}_{i}"
+
+        if kind == "int":
+            columns[name] = rng.integers(0, 1_000_000, rows)
+        elif kind == "float":
+            columns[name] = _with_nulls(rng.normal(size=rows), null_fraction, rng)
+        elif kind == "string":
+            values = np.array([f"value-{n:08d}" for n in rng.integers(0, 10 * rows, rows)], dtype=object)
+            columns[name] = _with_nulls(values, null_fraction, rng)
+        elif kind == "category":
+            values = rng.choice(np.array(["red", "green", "blue", "yellow", "black"], dtype=object), rows)
+            columns[name] = pd.Categorical(_with_nulls(values, null_fraction, rng))
+        elif kind == "timestamp":
+            seconds = rng.integers(1_600_000_000, 1_700_000_000, rows)
+            values = pd.to_datetime(seconds, unit="s").to_numpy()
+            columns[name] = _with_nulls(values, null_fraction, rng)
+        elif kind == "bool":
+            columns[name] = rng.random(rows) < 0.5
+
+    return pd.DataFrame(columns)
+
+
+def _with_nulls(values, null_fraction, rng):
+    if not null_fraction:
+        return values
+    values = values.copy()
+    mask = rng.random(len(values)) < null_fraction
+    if values.dtype.kind == "M":
+        values[mask] = np.datetime64("NaT")
+    elif values.dtype.kind == "f":
+        values[mask] = np.nan
+    else:
+        values[mask] = None
+    return values
@@ -0,0 +1,262 @@
+"""
+In-process HTTP server that serves the Lambda simulators locally.
+
+    with LocalApiServer(SimulatorSettings(total_pages=200, fail_rate_429=0.05),
+                        latency=0.02, retry_after=0.1, max_connections=32) as server:
+        auth = AuthClient(server.auth_url, "test_user", "test_password", logger)
+        client = UnstableAPIClient(server.data_url, auth, logger, max_in_flight=16)
+
+Requests are turned into Lambda function-URL events and routed to
+lambda_auth_simulator (POST /login) and unstable_api_simulator (GET /data),
+so the client is exercised offline against the same handlers that are
+deployed. On top of the handlers the server adds latency, Retry-After on
+429/503 responses and a cap on concurrent connections.
+
+Run standalone with: python -m dev.local_server --pages 100 --port 8000
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from dev import lambda_auth_simulator, unstable_api_simulator
+from dev.unstable_api_simulator import SimulatorSettings
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class LocalApiServer:
+    """Threaded HTTP front end for the simulators, with load-shaping knobs."""
+
+    def __init__(
+        self,
+        settings=None,
+        latency=0.0,
+        latency_sigma=0.0,
+        retry_after=None,
+        max_connections=None,
+        host="127.0.0.1",
+        port=0,
+    ):
+        """
+        Args:
+            settings (SimulatorSettings, optional): Page count, page size and
+                fail rates of the data endpoint.
+            latency (float): Median seconds added to every /data response.
+            latency_sigma (float): Log-normal sigma of the latency (0 = fixed);
+                e.g. 0.5 gives a p99 of about 3x the median.
+            retry_after (float, optional): Retry-After seconds sent with 429/503.
+            max_connections (int, optional): Concurrent /data requests served;
+                excess requests are rejected immediately with a 503.
+            host (str): Bind address.
+            port (int): Bind port (0 picks a free one).
+        """
+        self.settings = settings or SimulatorSettings()
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.retry_after = retry_after
+        self.max_connections = max_connections
+        self.host = host
+        self.port = port
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._server = None
+        self._thread = None
+
+        # tracking fields (data endpoint only)
+        self.requests = 0
+        self.status_counts = {}
+        self.rejected = 0
+        self.peak_connections = 0
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    def start(self):
+        self._server = _Server((self.host, self.port), self._make_handler())
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def auth_url(self):
+        return f"{self.url}/login"
+
+    @property
+    def data_url(self):
+        return f"{self.url}/data"
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "status_counts": dict(sorted(self.status_counts.items())),
+                "rejected": self.rejected,
+                "peak_connections": self.peak_connections,
+            }
+
+    # ---------------------------------------------------------
+    # Request handling
+    # ---------------------------------------------------------
+    def _sample_latency(self):
+        if self.latency <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency
+        return random.lognormvariate(0, self.latency_sigma) * self.latency
+
+    def _enter(self):
+        with self._lock:
+            self.requests += 1
+            if self.max_connections is not None and self._active >= self.max_connections:
+                self.rejected += 1
+                return False
+            self._active += 1
+            self.peak_connections = max(self.peak_connections, self._active)
+            return True
+
+    def _exit(self):
+        with self._lock:
+            self._active -= 1
+
+    def _record(self, status):
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def handle(self, method, path, query, headers, body):
+        """
+        Serve one request through the simulators.
+
+        Returns:
+            tuple: (status, headers dict, body bytes)
+        """
+        event = {
+            "rawPath": path,
+            "requestContext": {"http": {"method": method}},
+            "headers": headers,
+            "queryStringParameters": query,
+            "body": body or None,
+        }
+        if path == "/login":
+            response = lambda_auth_simulator.lambda_handler(event, None)
+            return response["statusCode"], response.get("headers", {}), response["body"].encode("utf-8")
+
+        if not self._enter():
+            self._record(503)
+            return 503, self._throttle_headers(), json.dumps({"error": "Too many connections"}).encode("utf-8")
+        try:
+            delay = self._sample_latency()
+            if delay:
+                time.sleep(delay)
+            response = unstable_api_simulator.handle_event(event, self.settings)
+        finally:
+            self._exit()
+
+        status = response["statusCode"]
+        self._record(status)
+        response_headers = dict(response.get("headers", {}))
+        if status in (429, 503):
+            response_headers.update(self._throttle_headers())
+        return status, response_headers, response["body"].encode("utf-8")
+
+    def _throttle_headers(self):
+        return {"Retry-After": str(self.retry_after)} if self.retry_after is not None else {}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body go out as separate writes; without this,
+            # Nagle + delayed ACK add ~40 ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def _serve(self, method):
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length).decode("utf-8") if length else ""
+                status, headers, payload = server.handle(
+                    method, parsed.path, dict(parse_qsl(parsed.query)), dict(self.headers), body
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--fail-rate-500", type=float, default=0.0)
+    parser.add_argument("--fail-rate-429", type=float, default=0.0)
+    parser.add_argument("--fail-rate-503", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Median latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float)
+    parser.add_argument("--max-connections", type=int)
+    args = parser.parse_args()
+
+    settings = SimulatorSettings(
+        total_pages=args.pages,
+        page_size=args.page_size,
+        fail_rate_500=args.fail_rate_500,
+        fail_rate_429=args.fail_rate_429,
+        fail_rate_503=args.fail_rate_503,
+    )
+    server = LocalApiServer(
+        settings,
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        retry_after=args.retry_after,
+        max_connections=args.max_connections,
+        port=args.port,
+    ).start()
+    print(f"Serving {server.auth_url} and {server.data_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,24 @@ FAIL_RATE_500 = 0.2   # 20% chance
 FAIL_RATE_429 = 0.3   # 10% chance
 
 
+class SimulatorSettings:
+    """Per-server overrides of the API config above (see dev/local_server.py)."""
+
+    def __init__(
+        self,
+        total_pages=TOTAL_PAGES,
+        page_size=PAGE_SIZE,
+        fail_rate_500=FAIL_RATE_500,
+        fail_rate_429=FAIL_RATE_429,
+        fail_rate_503=0.0,
+    ):
+        self.total_pages = total_pages
+        self.page_size = page_size
+        self.fail_rate_500 = fail_rate_500
+        self.fail_rate_429 = fail_rate_429
+        self.fail_rate_503 = fail_rate_503
+
+
 # -------------------------------
 # Endpoint handlers
 # -------------------------------
@@ -41,7 +59,9 @@ def handle_login(body):
     }
 
 
-def handle_data(headers, query_params):
+def handle_data(headers, query_params, settings=None):
+    settings = settings or SimulatorSettings()
+
     # Auth check
     auth = headers.get("authorization") or headers.get("Authorization")
     if not auth or not auth.startswith("Bearer "):
@@ -49,19 +69,21 @@ def handle_data(headers, query_params):
 
     # Random failures
     r = random.random()
-    if r < FAIL_RATE_500:
+    if r < settings.fail_rate_500:
         return 500, {"error": "Server error"}
-    elif r < FAIL_RATE_500 + FAIL_RATE_429:
+    elif r < settings.fail_rate_500 + settings.fail_rate_429:
         return 429, {"error": "Rate limited"}
+    elif r < settings.fail_rate_500 + settings.fail_rate_429 + settings.fail_rate_503:
+        return 503, {"error": "Service unavailable"}
 
     # Paginated response
     page = int(query_params.get("page", 1))
-    if page > TOTAL_PAGES or page < 1:
+    if page > settings.total_pages or page < 1:
         return 404, {"error": "Page not found"}
 
-    data = [{"id": f"{page}-{i}", "value": random.randint(1, 100)} for i in range(PAGE_SIZE)]
+    data = [{"id": f"{page}-{i}", "value": random.randint(1, 100)} for i in range(settings.page_size)]
     response = {
-        "metadata": {"total_pages": TOTAL_PAGES},
+        "metadata": {"total_pages": settings.total_pages},
         "data": data
     }
     return 200, response
@@ -71,6 +93,11 @@ def handle_data(headers, query_params):
 # Lambda handler
 # -------------------------------
 def lambda_handler(event, context):
+    return handle_event(event)
+
+
+def handle_event(event, settings=None):
+    """Route one Lambda function-URL event; settings override the module config."""
     path = event.get("rawPath", "/")
     method = event.get("requestContext", {}).get("http", {}).get("method", "GET")
     headers = event.get("headers", {})
@@ -82,7 +109,7 @@ def lambda_handler(event, context):
         if path == "/login" and method == "POST":
             status, result = handle_login(body)
         elif path == "/data" and method == "GET":
-            status, result = handle_data(headers, query_params)
+            status, result = handle_data(headers, query_params, settings)
         else:
             status, result = 404, {"error": "Not found"}
 
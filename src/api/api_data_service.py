@@ -1,7 +1,14 @@
-import pandas as pd
+import itertools
+
 import requests
 from botocore.exceptions import ClientError
 
+from src.common.metrics import get_metrics
+from src.storage.format.codecs import as_arrow_table, conform_table, settled_columns, settled_tables
+
+# Pages sampled to settle the columns and schema before a streamed write opens
+STREAM_SCHEMA_SAMPLE_PAGES = 8
+
 
 class ApiDataService:
     """
@@ -9,39 +16,69 @@ class ApiDataService:
     Works with an API client (e.g., UnstableAPIClient) and StorageDataService.
     """
 
-    def __init__(self, api_client, storage_service, logger):
+    def __init__(self, api_client, storage_service, logger, schema_registry=None, endpoint=None, metrics=None):
         """
         Args:
             api_client: Instance of UnstableAPIClient or other API client.
             storage_service: Instance of StorageDataService.
             logger: Logger instance.
+            schema_registry (SchemaRegistry, optional): Cast every page to a
+                stable, compact schema for this endpoint (learned from the
+                first pages if none is registered yet).
+            endpoint (str, optional): Registry key; defaults to the API
+                client's base_url.
+            metrics (Metrics, optional): Records ingest and per-page
+                frame_build spans; defaults to the process-wide registry.
         """
         self.api_client = api_client
         self.storage = storage_service
         self.logger = logger
+        self.schema_registry = schema_registry
+        self.endpoint = endpoint or getattr(api_client, "base_url", None)
+        self.metrics = metrics or get_metrics()
 
-    def fetch_all_to_df(self, limit=1000):
+    def fetch_all_to_df(self, limit=1000, max_in_flight=None, engine="pandas", schema=None):
         """
         Fetch all pages from the API and return as a single DataFrame.
 
         Args:
             limit (int): Number of records per page.
+            max_in_flight (int, optional): Concurrent page requests
+                (defaults to the API client's setting).
+            engine (str): "pandas" builds a DataFrame per page and concatenates;
+                "arrow" builds record batches and converts to pandas once.
+            schema (pa.Schema, optional): Arrow schema for engine="arrow".
 
         Returns:
             pd.DataFrame
+
+        Raises:
+            ValueError: Unsupported engine.
         """
+        import pandas as pd
+
+        from src.api.schema_registry import unify_categories
+
+        if engine == "arrow":
+            table = self.fetch_all_to_table(limit=limit, max_in_flight=max_in_flight, schema=schema)
+            if table.num_rows == 0:
+                self.logger.warning("No data fetched from API.")
+                return pd.DataFrame()
+            return table.to_pandas()
+        if engine != "pandas":
+            raise ValueError(f"Unsupported engine: {engine}")
+
         frames = []
         try:
-            for page, result in self.api_client.iterate_all_pages(limit=limit):
-                if result and "data" in result:
-                    frames.append(pd.DataFrame(result["data"]))
-                else:
-                    self.logger.warning(f"Page {page} returned no data.")
+            for frame in self.iter_page_frames(limit=limit, max_in_flight=max_in_flight):
+                frames.append(frame)
         except (requests.RequestException, pd.errors.EmptyDataError, ValueError) as e:
             self.logger.error(f"Error fetching API data: {e}", exc_info=True)
 
         if frames:
             try:
+                if self.schema_registry is not None:
+                    unify_categories(frames)
                 return pd.concat(frames, ignore_index=True)
             except ValueError as e:
                 # e.g., if frames list contains empty DataFrames
@@ -51,7 +88,105 @@ class ApiDataService:
             self.logger.warning("No data fetched from API.")
             return pd.DataFrame()
 
-    def fetch_all_to_storage(self, bucket, key, format="csv", limit=1000):
+    def iter_page_frames(self, limit=1000, max_in_flight=None):
+        """
+        Lazily yield one DataFrame per successfully fetched page.
+
+        Args:
+            limit (int): Number of records per page.
+            max_in_flight (int, optional): Concurrent page requests.
+
+        Yields:
+            pd.DataFrame
+        """
+        frames = self._iter_raw_page_frames(limit, max_in_flight)
+        if self.schema_registry is None:
+            yield from frames
+            return
+
+        registry = self.schema_registry
+        if registry.get(self.endpoint) is None:
+            # Hold back the first pages until the schema is learned
+            sample = list(itertools.islice(frames, registry.sample_pages))
+            schema = registry.learn(self.endpoint, sample)
+            self.logger.info(f"Learned schema for {self.endpoint} from {len(sample)} pages: {schema}")
+            frames = itertools.chain(sample, frames)
+
+        for frame in frames:
+            yield registry.conform(self.endpoint, frame)
+
+    def _iter_raw_page_frames(self, limit, max_in_flight):
+        import pandas as pd
+
+        for page, result in self.api_client.iterate_all_pages(limit=limit, max_in_flight=max_in_flight):
+            if result and result.get("data"):
+                with self.metrics.span("frame_build", engine="pandas"):
+                    frame = pd.DataFrame(result["data"])
+                yield frame
+            else:
+                self.logger.warning("Page %s returned no data.", page)
+
+    # ---------------------------------------------------------
+    # Arrow path (no per-page pandas conversion)
+    # ---------------------------------------------------------
+    def iter_page_batches(self, limit=1000, max_in_flight=None, schema=None):
+        """
+        Lazily yield one pyarrow RecordBatch per successfully fetched page,
+        built directly from the parsed records.
+
+        Args:
+            limit (int): Number of records per page.
+            max_in_flight (int, optional): Concurrent page requests.
+            schema (pa.Schema, optional): Explicit schema; missing fields become
+                nulls and extra fields are dropped. Inferred per page if omitted,
+                so pages may disagree (see fetch_all_to_table, settled_tables).
+
+        Yields:
+            pa.RecordBatch
+        """
+        import pyarrow as pa
+
+        for page, result in self.api_client.iterate_all_pages(limit=limit, max_in_flight=max_in_flight):
+            if result and result.get("data"):
+                with self.metrics.span("frame_build", engine="arrow"):
+                    batch = pa.RecordBatch.from_pylist(result["data"], schema=schema)
+                yield batch
+            else:
+                self.logger.warning("Page %s returned no data.", page)
+
+    def fetch_all_to_table(self, limit=1000, max_in_flight=None, schema=None):
+        """
+        Fetch all pages into a single pyarrow Table.
+
+        Batches are appended as chunks, so no data is copied; with an inferred
+        schema, pages that disagree (e.g. an all-null column, int vs. float)
+        are promoted to a common schema.
+
+        Returns:
+            pa.Table
+        """
+        import pyarrow as pa
+
+        tables = [
+            pa.Table.from_batches([batch])
+            for batch in self.iter_page_batches(limit=limit, max_in_flight=max_in_flight, schema=schema)
+        ]
+        if not tables:
+            return (schema or pa.schema([])).empty_table()
+        return pa.concat_tables(tables, promote_options="permissive")
+
+    def fetch_all_to_storage(
+        self,
+        bucket,
+        key,
+        format="csv",
+        limit=1000,
+        max_in_flight=None,
+        stream=False,
+        part_size=None,
+        engine="pandas",
+        schema=None
+    ):
         """
         Fetch all API data and upload it to storage in the requested format.
 
@@ -60,9 +195,30 @@ class ApiDataService:
             key (str): Object path in storage.
             format (str): "csv", "json", or "parquet".
             limit (int): Number of records per page.
+            max_in_flight (int, optional): Concurrent page requests.
+            stream (bool): Encode pages as they arrive and push them through a
+                multipart upload instead of building the full DataFrame first.
+            part_size (int, optional): Multipart part size when streaming.
+            engine (str): "pandas" or "arrow". With "arrow", pages become record
+                batches and Parquet/Arrow formats are written without pandas.
+            schema (pa.Schema, optional): Arrow schema for engine="arrow".
         """
+        with self.metrics.span("ingest", attributes={"bucket": bucket, "key": key}, format=format, engine=engine):
+            self._fetch_all_to_storage(bucket, key, format, limit, max_in_flight, stream, part_size, engine, schema)
+
+    def _fetch_all_to_storage(self, bucket, key, format, limit, max_in_flight, stream, part_size, engine, schema):
+        import pandas as pd
+
+        if stream:
+            self._stream_to_storage(bucket, key, format, limit, max_in_flight, part_size, engine, schema)
+            return
+
+        if engine == "arrow":
+            self._arrow_to_storage(bucket, key, format, limit, max_in_flight, schema)
+            return
+
         try:
-            df = self.fetch_all_to_df(limit=limit)
+            df = self.fetch_all_to_df(limit=limit, max_in_flight=max_in_flight)
         except (requests.RequestException, pd.errors.EmptyDataError, ValueError) as e:
             self.logger.error(f"Failed to fetch API data: {e}", exc_info=True)
             return
@@ -76,3 +232,196 @@ class ApiDataService:
             self.logger.info(f"Uploaded API data to {bucket}/{key} as {format}.")
         except (ValueError, ClientError) as e:
             self.logger.error(f"Failed to upload data to storage: {e}", exc_info=True)
+
+    def _arrow_to_storage(self, bucket, key, format, limit, max_in_flight, schema):
+        try:
+            table = self.fetch_all_to_table(limit=limit, max_in_flight=max_in_flight, schema=schema)
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error(f"Failed to fetch API data: {e}", exc_info=True)
+            return
+
+        if table.num_rows == 0:
+            self.logger.warning("No data to upload to storage.")
+            return
+
+        try:
+            self.storage.upload_df(table, bucket=bucket, key=key, format=format)
+            self.logger.info(f"Uploaded API data to {bucket}/{key} as {format}.")
+        except (ValueError, ClientError) as e:
+            self.logger.error(f"Failed to upload data to storage: {e}", exc_info=True)
+
+    def _stream_to_storage(self, bucket, key, format, limit, max_in_flight, part_size, engine="pandas", schema=None):
+        """Streaming variant of fetch_all_to_storage; memory is bounded by a few pages."""
+        import pyarrow as pa
+
+        if engine == "arrow":
+            frames = self.iter_page_batches(limit=limit, max_in_flight=max_in_flight, schema=schema)
+        else:
+            frames = self.iter_page_frames(limit=limit, max_in_flight=max_in_flight)
+
+        try:
+            first = next(frames, None)
+        except (requests.RequestException, ValueError, pa.ArrowException) as e:
+            self.logger.error(f"Failed to fetch API data: {e}", exc_info=True)
+            return
+
+        if first is None:
+            self.logger.warning("No data to upload to storage.")
+            return
+
+        frames = itertools.chain([first], frames)
+        try:
+            if engine != "arrow" or schema is None:
+                # Fix columns (and, for Parquet/Arrow, promoted types) from a
+                # sample of pages, as fetch_all_to_df/fetch_all_to_table do
+                # from all of them; schema conflicts surface in the upload
+                settle = settled_tables if self.storage.fmt.get_codec(format).arrow_native else settled_columns
+                frames = settle(frames, sample_frames=STREAM_SCHEMA_SAMPLE_PAGES)
+            size = self.storage.upload_df_stream(
+                frames, bucket=bucket, key=key, format=format, part_size=part_size
+            )
+            self.logger.info(f"Streamed API data to {bucket}/{key} as {format} ({size} bytes).")
+        except (requests.RequestException, ValueError, ClientError, pa.ArrowException) as e:
+            # upload_stream has already aborted the multipart upload
+            self.logger.error(f"Failed to stream data to storage: {e}", exc_info=True)
+
+    def fetch_all_to_storage_resumable(
+        self,
+        bucket,
+        key,
+        checkpoint_store,
+        format="parquet",
+        limit=1000,
+        max_in_flight=None,
+        save_every=50,
+        cleanup_chunks=True,
+    ):
+        """
+        Fetch all API data page by page into chunk objects, recording progress
+        in a checkpoint, then compact the chunks into a single object.
+
+        Each page is written to "{key}.parts/page-NNNNNN.{format}" as soon as it
+        arrives. If the run dies (or pages exhaust their retries), calling this
+        again with the same checkpoint_store only fetches the missing pages.
+        Compaction streams the chunks into key once every page is present.
+
+        Args:
+            bucket (str): Storage bucket name.
+            key (str): Object path of the compacted result.
+            checkpoint_store: LocalCheckpointStore or S3CheckpointStore.
+            format (str): Format for the chunks and the final object.
+            limit (int): Number of records per page (must match earlier runs).
+            max_in_flight (int, optional): Concurrent page requests.
+            save_every (int): Persist the checkpoint every N completed pages.
+            cleanup_chunks (bool): Delete chunk objects after compaction.
+
+        Returns:
+            IngestionCheckpoint: Final state (check .failed / .compacted).
+
+        Raises:
+            ValueError: The checkpoint was created with a different limit/format.
+        """
+        checkpoint = checkpoint_store.load()
+        if checkpoint.limit not in (None, limit) or checkpoint.format not in (None, format):
+            raise ValueError(
+                f"Checkpoint was created with limit={checkpoint.limit}, format={checkpoint.format}; "
+                f"got limit={limit}, format={format}"
+            )
+        checkpoint.limit, checkpoint.format = limit, format
+
+        if checkpoint.compacted:
+            self.logger.info(f"{bucket}/{key} already compacted; nothing to do.")
+            return checkpoint
+
+        try:
+            if checkpoint.total_pages is None:
+                self._fetch_first_page_to_chunk(checkpoint, bucket, key, format, limit)
+
+            missing = checkpoint.missing_pages()
+            if missing:
+                self.logger.info(f"Fetching {len(missing)} of {checkpoint.total_pages} pages.")
+            since_save = 0
+            for page, result in self.api_client.iterate_pages(missing, limit=limit, max_in_flight=max_in_flight):
+                self._write_page_chunk(checkpoint, bucket, key, format, page, result)
+                since_save += 1
+                if since_save >= save_every:
+                    checkpoint_store.save(checkpoint)
+                    since_save = 0
+        finally:
+            checkpoint_store.save(checkpoint)
+
+        if not checkpoint.is_complete():
+            self.logger.warning(
+                f"{len(checkpoint.missing_pages())} pages still missing "
+                f"(failed: {sorted(checkpoint.failed)}); rerun to resume."
+            )
+            return checkpoint
+
+        self._compact_chunks(checkpoint, bucket, key, format, cleanup_chunks)
+        checkpoint_store.save(checkpoint)
+        return checkpoint
+
+    @staticmethod
+    def _chunk_key(key, page, format):
+        return f"{key}.parts/page-{page:06d}.{format}"
+
+    def _fetch_first_page_to_chunk(self, checkpoint, bucket, key, format, limit):
+        """Page 1 tells us total_pages; write it like any other page."""
+        first = self.api_client.fetch_page(1, limit)
+        if not first:
+            raise ValueError("Failed to fetch the first page — cannot determine total_pages.")
+        checkpoint.total_pages = first["metadata"]["total_pages"]
+        self._write_page_chunk(checkpoint, bucket, key, format, 1, first)
+
+    def _write_page_chunk(self, checkpoint, bucket, key, format, page, result):
+        import pandas as pd
+
+        if result is None:
+            checkpoint.mark_failed(page)
+            return
+
+        chunk_key = self._chunk_key(key, page, format)
+        if result.get("data"):
+            frame = pd.DataFrame(result["data"])
+            if self.schema_registry is not None:
+                # Only conforms once the endpoint's schema is known (registered or learned)
+                frame = self.schema_registry.conform(self.endpoint, frame)
+            self.storage.upload_df(frame, bucket=bucket, key=chunk_key, format=format)
+            checkpoint.mark_completed(page, chunk_key)
+        else:
+            # Nothing to write, but the page is done
+            checkpoint.mark_completed(page, None)
+
+    def _compact_chunks(self, checkpoint, bucket, key, format, cleanup_chunks):
+        chunk_keys = [chunk_key for chunk_key in checkpoint.chunk_keys() if chunk_key]
+        if not chunk_keys:
+            self.logger.warning("No data to upload to storage.")
+        else:
+            self.storage.upload_df_stream(
+                self._settled_chunks(bucket, chunk_keys, format), bucket=bucket, key=key, format=format
+            )
+            self.logger.info(f"Compacted {len(chunk_keys)} chunks into {bucket}/{key}.")
+
+            if cleanup_chunks:
+                for chunk_key in chunk_keys:
+                    self.storage.delete(bucket, chunk_key)
+
+        checkpoint.compacted = True
+
+    def _settled_chunks(self, bucket, chunk_keys, format):
+        """
+        Chunk frames cast to one schema promoted over every chunk. Pages were
+        written one by one, so their columns and dtypes can disagree (int on
+        one page, float on another); a sample would not do, since a rerun
+        must not fail the same way. Chunks are read twice (schemas first) to
+        keep memory bounded by one chunk.
+        """
+        import pyarrow as pa
+
+        def chunks():
+            for chunk_key in chunk_keys:
+                yield as_arrow_table(self.storage.download_df(bucket, chunk_key, format=format))
+
+        schema = pa.unify_schemas([table.schema for table in chunks()], promote_options="permissive")
+        for table in chunks():
+            yield conform_table(table, schema)
@@ -0,0 +1,94 @@
+import asyncio
+
+import aiohttp
+from botocore.exceptions import ClientError
+
+
+class AsyncApiDataService:
+    """
+    asyncio counterpart of ApiDataService.
+
+    Pages are fetched on the event loop through an AsyncUnstableAPIClient;
+    the (blocking) storage upload runs in a worker thread so it does not
+    stall other ingestions sharing the loop.
+    """
+
+    def __init__(self, api_client, storage_service, logger):
+        """
+        Args:
+            api_client: Instance of AsyncUnstableAPIClient.
+            storage_service: Instance of StorageDataService.
+            logger: Logger instance.
+        """
+        self.api_client = api_client
+        self.storage = storage_service
+        self.logger = logger
+
+    async def iter_page_frames(self, limit=1000, max_in_flight=None):
+        """
+        Lazily yield one DataFrame per successfully fetched page.
+
+            async for frame in service.iter_page_frames(limit=500):
+                ...
+        """
+        import pandas as pd
+
+        async for page, result in self.api_client.iterate_all_pages(limit=limit, max_in_flight=max_in_flight):
+            if result and result.get("data"):
+                yield pd.DataFrame(result["data"])
+            else:
+                self.logger.warning("Page %s returned no data.", page)
+
+    async def fetch_all_to_df(self, limit=1000, max_in_flight=None):
+        """
+        Fetch all pages from the API and return as a single DataFrame.
+
+        Args:
+            limit (int): Number of records per page.
+            max_in_flight (int, optional): Concurrent page requests
+                (defaults to the API client's setting).
+
+        Returns:
+            pd.DataFrame
+        """
+        import pandas as pd
+
+        frames = []
+        try:
+            async for frame in self.iter_page_frames(limit=limit, max_in_flight=max_in_flight):
+                frames.append(frame)
+        except (aiohttp.ClientError, pd.errors.EmptyDataError, ValueError) as e:
+            self.logger.error(f"Error fetching API data: {e}", exc_info=True)
+
+        if frames:
+            try:
+                return pd.concat(frames, ignore_index=True)
+            except ValueError as e:
+                self.logger.error(f"Error concatenating DataFrames: {e}", exc_info=True)
+                return pd.DataFrame()
+        else:
+            self.logger.warning("No data fetched from API.")
+            return pd.DataFrame()
+
+    async def fetch_all_to_storage(self, bucket, key, format="csv", limit=1000, max_in_flight=None):
+        """
+        Fetch all API data and upload it to storage in the requested format.
+
+        Args:
+            bucket (str): Storage bucket name.
+            key (str): Object path in storage.
+            format (str): Any format registered with the storage service.
+            limit (int): Number of records per page.
+            max_in_flight (int, optional): Concurrent page requests.
+        """
+        df = await self.fetch_all_to_df(limit=limit, max_in_flight=max_in_flight)
+
+        if df.empty:
+            self.logger.warning("No data to upload to storage.")
+            return
+
+        try:
+            await asyncio.to_thread(self.storage.upload_df, df, bucket=bucket, key=key, format=format)
+            self.logger.info(f"Uploaded API data to {bucket}/{key} as {format}.")
+        except (ValueError, ClientError) as e:
+            self.logger.error(f"Failed to upload data to storage: {e}", exc_info=True)
@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+import aiohttp
+
+from src.common.json_backend import get_json_backend
+
+
+class AsyncAuthClient:
+    """
+    asyncio counterpart of AuthClient.
+
+    Token refresh is single-flight: when the token expires, the first caller
+    logs in while every other concurrent caller awaits the same refresh
+    instead of sending its own /login request.
+    """
+
+    def __init__(self, auth_url, username, password, logger, timeout=10, session=None):
+        """
+        Args:
+            session (aiohttp.ClientSession, optional): Shared session. When
+                omitted, one is created on first use and closed by close().
+        """
+        self.auth_url = auth_url
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+
+        self.logger = logger
+        self.access_token = None
+        self.expires_at = 0  # epoch timestamp
+
+        self._session = session
+        self._owns_session = session is None
+        self._refresh_lock = None
+
+        # tracking fields
+        self.refresh_count = 0
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    def _get_refresh_lock(self):
+        # Created lazily so the lock binds to the running event loop
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        return self._refresh_lock
+
+    def _is_token_expired(self):
+        """Check if token is missing or expired."""
+        return not self.access_token or time.time() >= self.expires_at
+
+    async def _request_new_token(self):
+        """Request a new access token from the auth endpoint."""
+        try:
+            self.logger.info("Requesting new access token...")
+
+            async with self._get_session().post(
+                self.auth_url,
+                json={
+                    "username": self.username,
+                    "password": self.password,
+                },
+            ) as response:
+                response.raise_for_status()
+                data = get_json_backend().loads(await response.read())
+
+            self.access_token = data["access_token"]
+            self.expires_at = time.time() + data.get("expires_in", 3600) - 30
+            self.refresh_count += 1
+
+            self.logger.info("Authentication successful.")
+
+        except aiohttp.ClientError as e:
+            self.logger.error(f"Authentication failed: {e}")
+            raise
+
+    async def get_token(self):
+        """Returns a fresh token. Refreshes (once, for all waiters) if expired."""
+        if self._is_token_expired():
+            async with self._get_refresh_lock():
+                # Another caller may have refreshed while we waited for the lock
+                if self._is_token_expired():
+                    await self._request_new_token()
+        return self.access_token
+
+    async def refresh(self, stale_token=None):
+        """
+        Force a new token, e.g. after the API rejected one with 401. If another
+        caller already replaced stale_token, that token is returned instead.
+        """
+        async with self._get_refresh_lock():
+            if stale_token is None or self.access_token == stale_token or self._is_token_expired():
+                await self._request_new_token()
+            return self.access_token
+
+    async def get_auth_header(self):
+        """Helper that returns the Authorization header dict."""
+        token = await self.get_token()
+        return {"Authorization": f"Bearer {token}"}
+
+    async def close(self):
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,268 @@
+import asyncio
+import random
+import time
+
+import aiohttp
+
+from src.api.rate_limiter import parse_retry_after
+from src.common.json_backend import get_json_backend
+from src.common.metrics import get_metrics
+
+
+class AsyncUnstableAPIClient:
+    """
+    asyncio counterpart of UnstableAPIClient.
+    Handles:
+        - retry with exponential backoff + jitter (non-blocking asyncio.sleep)
+        - rate-limit handling, Retry-After, optional shared AdaptiveRateLimiter
+        - transient 500/503 failures
+        - pagination sequencing with up to max_in_flight concurrent requests
+
+    A single event loop can drive thousands of in-flight page requests; the
+    session's connector limits how many TCP connections are actually open.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        auth_client,
+        logger,
+        max_retries=5,
+        timeout=10,
+        jitter=True,
+        max_in_flight=100,
+        session=None,
+        rate_limiter=None,
+        connection_limit=100,
+        json_backend=None,
+        metrics=None
+    ):
+        """
+        Args:
+            auth_client (AsyncAuthClient): Shared token provider.
+            session (aiohttp.ClientSession, optional): Shared session. When
+                omitted, one is created on first use and closed by close().
+            rate_limiter (AdaptiveRateLimiter, optional): Shared request pacing.
+            connection_limit (int): TCP connection limit for an owned session.
+            json_backend (optional): Parser for response bodies (see
+                common.json_backend); defaults to orjson when installed.
+            metrics (Metrics, optional): Instrumentation registry; defaults
+                to the process-wide one (common.metrics.get_metrics).
+        """
+        self.base_url = base_url
+        self.auth_client = auth_client
+        self.logger = logger
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.jitter = jitter
+        self.max_in_flight = max_in_flight
+        self.rate_limiter = rate_limiter
+        self.connection_limit = connection_limit
+        self.json_backend = json_backend or get_json_backend()
+        self.metrics = metrics or get_metrics()
+
+        self._session = session
+        self._owns_session = session is None
+
+        # tracking fields (single event loop, no locking needed)
+        self.retry_count = 0
+        self.successful_pages = 0
+        self.failed_pages = 0
+        self.records_ingested = 0
+        self.failed_page_numbers = set()
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def _record_page(self, page, result):
+        if result is None:
+            self.failed_pages += 1
+            self.failed_page_numbers.add(page)
+        else:
+            self.failed_page_numbers.discard(page)
+            self.successful_pages += 1
+            self.records_ingested += len(result["data"])
+
+    # ---------------------------------------------------------
+    # 1. Fetch a single page (with retry logic)
+    # ---------------------------------------------------------
+    async def fetch_page(self, page, limit=1000):
+        """
+        Fetch one page of results with retry logic.
+        Returns:
+            dict -> parsed JSON data (metadata + records), or None
+        """
+        params = {"page": page, "limit": limit}
+        with self.metrics.span("page_fetch", attributes={"page": page}):
+            return await self._retry_request(self.base_url, params)
+
+    # ---------------------------------------------------------
+    # 2. Retry Logic (500, 503, 429, 401, network issues)
+    # ---------------------------------------------------------
+    def _backoff_wait(self, attempts, retry_after=None):
+        if retry_after is not None:
+            return retry_after
+        wait = 2 ** attempts
+        if self.jitter:
+            wait += random.uniform(0, 1)
+        return wait
+
+    def _throttled_wait(self, attempts, response):
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_throttle(retry_after)
+            if retry_after is not None:
+                return 0
+        return self._backoff_wait(attempts, retry_after)
+
+    def _count_retry(self, reason):
+        self.retry_count += 1
+        self.metrics.increment("http_retries_total", client="async_api", reason=reason)
+
+    async def _sleep(self, wait):
+        """Non-blocking backoff sleep, accounted in backoff_sleep_seconds_total."""
+        self.metrics.increment("backoff_sleep_seconds_total", wait, client="async_api")
+        await asyncio.sleep(wait)
+
+    async def _retry_request(self, url, params):
+        attempts = 0
+        reauthenticated = False
+
+        while attempts <= self.max_retries:
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+
+                token = await self.auth_client.get_token()
+                headers = {"Authorization": f"Bearer {token}"}
+                start = time.perf_counter()
+                async with self._get_session().get(url, headers=headers, params=params) as response:
+                    body = await response.read()
+                    self.metrics.observe(
+                        "http_request_seconds", time.perf_counter() - start, client="async_api", status=response.status
+                    )
+                    self.metrics.increment("http_response_bytes_total", len(body), client="async_api")
+
+                    # SUCCESS
+                    if response.status == 200:
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.on_success()
+                        return self.json_backend.loads(body)
+
+                    # TOKEN REJECTED (401): re-authenticate and retry once
+                    if response.status == 401 and not reauthenticated:
+                        self.logger.warning("Token rejected (401): re-authenticating...")
+                        await self.auth_client.refresh(stale_token=token)
+                        reauthenticated = True
+                        continue
+
+                    # RATE LIMITED (429) / SERVER FAILURE (500 or 503)
+                    if response.status in (429, 500, 503):
+                        self._count_retry(str(response.status))
+                        if response.status == 500:
+                            wait = self._backoff_wait(attempts)
+                        else:
+                            wait = self._throttled_wait(attempts, response)
+                        self.logger.warning("HTTP %s: retrying in %.2fs...", response.status, wait)
+                        await self._sleep(wait)
+                        attempts += 1
+                        continue
+
+                    # NON-RETRYABLE ERROR
+                    response.raise_for_status()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                # ValueError: truncated/invalid JSON body
+                self._count_retry(type(e).__name__)
+                wait = self._backoff_wait(attempts)
+                self.logger.error("Request failed: %s, retrying in %.2fs...", e, wait)
+                await self._sleep(wait)
+                attempts += 1
+
+        # FAILED ALL RETRIES
+        self.logger.error("Max retries exceeded for page params: %s", params)
+        return None
+
+    # ---------------------------------------------------------
+    # 3. Async generators for pages
+    # ---------------------------------------------------------
+    async def iterate_all_pages(self, limit=1000, max_in_flight=None, ordered=True):
+        """
+        Yield (page, result) for every page: page 1 first (to learn
+        total_pages), then pages 2..N with up to max_in_flight requests
+        in flight.
+
+            async for page, result in client.iterate_all_pages(limit=100):
+                ...
+        """
+        first = await self.fetch_page(1, limit)
+        if not first:
+            self.logger.error("Failed to fetch the first page — cannot continue.")
+            self._record_page(1, None)
+            return
+
+        self._record_page(1, first)
+        yield (1, first)
+
+        total_pages = first["metadata"]["total_pages"]
+        async for item in self.iterate_pages(range(2, total_pages + 1), limit, max_in_flight, ordered):
+            yield item
+
+    async def iterate_pages(self, pages, limit=1000, max_in_flight=None, ordered=True):
+        """Yield (page, result) for an explicit list of pages, fetched concurrently."""
+        pages = list(pages)
+        max_in_flight = max_in_flight or self.max_in_flight
+        pending = iter(pages)
+        yield_order = iter(pages)
+        next_to_yield = next(yield_order, None)
+        in_flight = {}
+        completed = {}
+
+        def fill():
+            while len(in_flight) + len(completed) < max_in_flight:
+                page = next(pending, None)
+                if page is None:
+                    return
+                in_flight[asyncio.ensure_future(self.fetch_page(page, limit))] = page
+
+        try:
+            fill()
+            while in_flight:
+                finished, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in finished:
+                    page = in_flight.pop(task)
+                    result = task.result()
+                    self._record_page(page, result)
+
+                    if ordered:
+                        completed[page] = result
+                    else:
+                        yield (page, result)
+
+                while next_to_yield is not None and next_to_yield in completed:
+                    yield (next_to_yield, completed.pop(next_to_yield))
+                    next_to_yield = next(yield_order, None)
+
+                fill()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # Wait for the cancellations, or closing early leaves pending tasks behind
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def close(self):
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -1,22 +1,68 @@
+import threading
 import time
 import requests
 
+from src.api.http_session import PooledHTTPSession
+from src.common.json_backend import get_json_backend
+
 
 class AuthClient:
     """
     Handles authentication & token refresh for an API.
+
+    Refresh is single-flight and thread-safe: when the token expires, one
+    thread logs in while the others wait for its result. With
+    background_refresh=True a daemon thread renews the token once
+    refresh_fraction of its lifetime has passed, so no page request pays the
+    login latency.
     """
 
-    def __init__(self, auth_url, username, password, logger, timeout=10):
+    def __init__(
+        self,
+        auth_url,
+        username,
+        password,
+        logger,
+        timeout=10,
+        session=None,
+        background_refresh=False,
+        refresh_fraction=0.8,
+        retry_interval=5
+    ):
+        """
+        Args:
+            session (PooledHTTPSession, optional): Shared connection pool.
+                A small private pool is created when omitted.
+            background_refresh (bool): Start the proactive renewal thread.
+            refresh_fraction (float): Fraction of expires_in after which the
+                background thread renews the token.
+            retry_interval (float): Seconds between background renewal
+                attempts after a failed login.
+        """
         self.auth_url = auth_url
         self.username = username
         self.password = password
         self.timeout = timeout
+        self.session = session or PooledHTTPSession(pool_maxsize=1)
+        self.refresh_fraction = refresh_fraction
+        self.retry_interval = retry_interval
 
         self.logger = logger
         self.access_token = None
+        self.issued_at = 0
+        self.expires_in = 0
         self.expires_at = 0  # epoch timestamp
 
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._refresh_thread = None
+
+        # tracking fields
+        self.refresh_count = 0
+
+        if background_refresh:
+            self.start_background_refresh()
+
     def _is_token_expired(self):
         """Check if token is missing or expired."""
         return not self.access_token or time.time() >= self.expires_at
@@ -26,7 +72,7 @@ class AuthClient:
         try:
             self.logger.info("Requesting new access token...")
 
-            response = requests.post(
+            response = self.session.post(
                 self.auth_url,
                 json={
                     "username": self.username,
@@ -35,24 +81,89 @@ class AuthClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = get_json_backend().loads(response.content)
 
             self.access_token = data["access_token"]
-            self.expires_at = time.time() + data.get("expires_in", 3600) - 30
+            self.issued_at = time.time()
+            self.expires_in = data.get("expires_in", 3600)
+            self.expires_at = self.issued_at + self.expires_in - 30
+            self.refresh_count += 1
 
             self.logger.info("Authentication successful.")
 
         except requests.RequestException as e:
             self.logger.error(f"Authentication failed: {e}")
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            # Not JSON, or JSON without an access_token
+            self.logger.error(f"Authentication failed: malformed login response ({e!r})")
+            raise
 
     def get_token(self):
-        """Returns a fresh token. Refreshes automatically if expired."""
+        """Returns a fresh token. Refreshes automatically (once, for all waiters) if expired."""
         if self._is_token_expired():
-            self._request_new_token()
+            with self._refresh_lock:
+                # Another thread may have refreshed while we waited for the lock
+                if self._is_token_expired():
+                    self._request_new_token()
         return self.access_token
 
+    def refresh(self, stale_token=None):
+        """
+        Force a new token, e.g. after the API rejected one with 401.
+
+        Args:
+            stale_token (str, optional): The rejected token. If another thread
+                has already replaced it, that token is returned instead of
+                logging in again.
+
+        Returns:
+            str: The current token.
+        """
+        with self._refresh_lock:
+            if stale_token is None or self.access_token == stale_token or self._is_token_expired():
+                self._request_new_token()
+            return self.access_token
+
     def get_auth_header(self):
         """Helper that returns the Authorization header dict."""
         token = self.get_token()
-        return {"Authorization": f"Bearer {token}"}
\ No newline at end of file
+        return {"Authorization": f"Bearer {token}"}
+
+    # ---------------------------------------------------------
+    # Background renewal
+    # ---------------------------------------------------------
+    def _next_refresh_in(self):
+        if not self.access_token:
+            return 0
+        return max(0, self.issued_at + self.expires_in * self.refresh_fraction - time.time())
+
+    def _refresh_loop(self):
+        while not self._stop_event.wait(self._next_refresh_in()):
+            try:
+                self.refresh(stale_token=self.access_token)
+            except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+                # Keep the thread alive: a dead one would leave requests to an expired token
+                self.logger.warning(
+                    f"Background token refresh failed ({e!r}): retrying in {self.retry_interval}s..."
+                )
+                if self._stop_event.wait(self.retry_interval):
+                    return
+
+    def start_background_refresh(self):
+        """Start the daemon thread that renews the token ahead of expiry."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, name="auth-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self):
+        self._stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=self.timeout)
+            self._refresh_thread = None
+
+    def close(self):
+        self.stop_background_refresh()
+        self.session.close()
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+
+class IngestionCheckpoint:
+    """
+    Progress of one resumable ingestion run.
+
+    Records total_pages, the chunk key written for every completed page, and
+    the pages that exhausted their retries, so a rerun only fetches what is
+    still missing. Mutations are thread-safe; persist with store.save().
+    """
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.total_pages = state.get("total_pages")
+        self.limit = state.get("limit")
+        self.format = state.get("format")
+        self.completed = {int(page): key for page, key in state.get("completed", {}).items()}
+        self.failed = set(state.get("failed", []))
+        self.compacted = state.get("compacted", False)
+        self._lock = threading.Lock()
+
+    def mark_completed(self, page, chunk_key):
+        with self._lock:
+            self.completed[page] = chunk_key
+            self.failed.discard(page)
+
+    def mark_failed(self, page):
+        with self._lock:
+            self.failed.add(page)
+
+    def missing_pages(self):
+        """Pages not yet completed (including previously failed ones), in order."""
+        with self._lock:
+            return [page for page in range(1, (self.total_pages or 0) + 1) if page not in self.completed]
+
+    def is_complete(self):
+        return self.total_pages is not None and not self.missing_pages()
+
+    def chunk_keys(self):
+        """Chunk keys of all completed pages, in page order."""
+        with self._lock:
+            return [self.completed[page] for page in sorted(self.completed)]
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "total_pages": self.total_pages,
+                "limit": self.limit,
+                "format": self.format,
+                "completed": {str(page): key for page, key in sorted(self.completed.items())},
+                "failed": sorted(self.failed),
+                "compacted": self.compacted,
+            }
+
+
+class LocalCheckpointStore:
+    """Keeps an IngestionCheckpoint in a local JSON file (atomically replaced on save)."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return IngestionCheckpoint(json.load(f))
+        except FileNotFoundError:
+            return IngestionCheckpoint()
+
+    def save(self, checkpoint):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(checkpoint.to_dict(), f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class S3CheckpointStore:
+    """Keeps an IngestionCheckpoint as a JSON object in a bucket (e.g. next to the data)."""
+
+    def __init__(self, storage_client, bucket, key):
+        """
+        Args:
+            storage_client: S3Client, MinioClient or other BaseS3Client.
+            bucket (str): Bucket name.
+            key (str): Object path of the checkpoint.
+        """
+        self.storage = storage_client
+        self.bucket = bucket
+        self.key = key
+
+    def load(self):
+        if not self.storage.exists(self.bucket, self.key):
+            return IngestionCheckpoint()
+        return IngestionCheckpoint(json.loads(self.storage.download_bytes(self.bucket, self.key)))
+
+    def save(self, checkpoint):
+        data = json.dumps(checkpoint.to_dict()).encode("utf-8")
+        self.storage.upload_bytes(self.bucket, self.key, data, content_type="application/json")
+
+    def clear(self):
+        self.storage.delete(self.bucket, self.key)
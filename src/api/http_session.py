@@ -0,0 +1,126 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class _ConnectionCounter:
+    """Thread-safe counters for requests sent vs. connections opened."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def add_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+
+def _counting_pool_class(base, counter):
+    """Return a urllib3 pool class that reports every newly opened connection."""
+
+    class CountingConnectionPool(base):
+        def _new_conn(self):
+            counter.add_connection()
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools count new connections and sent requests."""
+
+    def __init__(self, counter, **kwargs):
+        self.counter = counter
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.counter),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.counter),
+        }
+
+    def send(self, request, **kwargs):
+        self.counter.add_request()
+        return super().send(request, **kwargs)
+
+
+class PooledHTTPSession:
+    """
+    A shareable HTTP session backed by a keep-alive connection pool.
+
+    Wraps a requests.Session so that AuthClient, UnstableAPIClient, and any
+    other caller can reuse TCP/TLS connections across pages and retries
+    instead of paying for a new handshake on every request.
+
+    Tracks how many requests were sent and how many new connections had to
+    be opened, so connection reuse can be observed via connection_stats().
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, headers=None):
+        """
+        Args:
+            pool_connections (int): Number of per-host pools to cache.
+            pool_maxsize (int): Max keep-alive connections kept per host.
+                Should be at least the number of concurrent requests.
+            pool_block (bool): Block when the pool is exhausted instead of
+                opening (and later discarding) extra connections.
+            headers (dict, optional): Default headers sent with every request.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._counter = _ConnectionCounter()
+
+        self.session = requests.Session()
+        adapter = _CountingHTTPAdapter(
+            self._counter,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        if headers:
+            self.session.headers.update(headers)
+
+    @classmethod
+    def for_concurrency(cls, max_in_flight, **kwargs):
+        """Create a session whose per-host pool fits max_in_flight requests."""
+        return cls(pool_maxsize=max(max_in_flight, 1), **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.session.post(url, **kwargs)
+
+    def connection_stats(self):
+        """
+        Returns:
+            dict: requests sent, new connections opened, and connections reused.
+        """
+        requests_sent = self._counter.requests
+        new_connections = self._counter.new_connections
+        return {
+            "requests": requests_sent,
+            "new_connections": new_connections,
+            "reused_connections": max(requests_sent - new_connections, 0),
+        }
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,216 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket rate limiter whose rate adapts to server feedback (AIMD).
+
+    - Every request takes a token (acquire); tokens refill at `rate` per second
+      up to `burst`.
+    - Successes raise the rate additively: about +additive_increase req/s for
+      every second of traffic.
+    - A 429/503 cuts the rate multiplicatively (decrease_factor), at most once
+      per cooldown so one burst of rejections counts as one congestion event.
+    - A Retry-After value pauses the whole bucket until it has passed.
+
+    One limiter is meant to be shared by every fetch against an API, across
+    threads and clients (see get_shared_limiter), so that concurrent callers
+    slow down together instead of causing retry storms.
+    """
+
+    def __init__(
+        self,
+        rate=10.0,
+        burst=None,
+        min_rate=0.5,
+        max_rate=1000.0,
+        additive_increase=1.0,
+        decrease_factor=0.5,
+        cooldown=1.0,
+    ):
+        """
+        Args:
+            rate (float): Initial requests per second.
+            burst (float, optional): Bucket capacity (defaults to max(1, rate)).
+            min_rate (float): Lower bound for the adapted rate.
+            max_rate (float): Upper bound for the adapted rate.
+            additive_increase (float): Rate gained per second of successful traffic.
+            decrease_factor (float): Multiplier applied on throttling.
+            cooldown (float): Minimum seconds between two decreases.
+        """
+        self.rate = float(rate)
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._tokens = self._capacity()
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._waiting = 0
+
+        # tracking fields
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _capacity(self):
+        return self.burst if self.burst is not None else max(1.0, self.rate)
+
+    def _refill(self, now):
+        self._tokens = min(self._capacity(), self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _reserve(self):
+        """
+        Take a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds to wait before retrying.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.acquired += 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                with self._lock:
+                    wait = self._reserve()
+                if wait <= 0:
+                    break
+                time.sleep(wait)
+                waited += wait
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                self.wait_seconds += waited
+        return waited
+
+    async def acquire_async(self):
+        """
+        Non-blocking variant of acquire() for asyncio callers.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        import asyncio
+
+        waited = 0.0
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                with self._lock:
+                    wait = self._reserve()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+                waited += wait
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                self.wait_seconds += waited
+        return waited
+
+    def on_success(self):
+        """Additive increase after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.additive_increase / max(self.rate, 1.0))
+
+    def on_throttle(self, retry_after=None):
+        """
+        Multiplicative decrease after a 429/503.
+
+        Args:
+            retry_after (float, optional): Seconds the server asked us to wait.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.throttled += 1
+            if now - self._last_decrease >= self.cooldown:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self._last_decrease = now
+                self._refill(now)
+                self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    @property
+    def current_rate(self):
+        return self.rate
+
+    @property
+    def queue_depth(self):
+        """Number of callers currently waiting in acquire()."""
+        return self._waiting
+
+    def stats(self):
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "queue_depth": self._waiting,
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "paused_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+            }
+
+
+_shared_limiters = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter(name, **kwargs):
+    """
+    Return the process-wide limiter registered under name, creating it with
+    kwargs on first use. Use one name per API (e.g. its host).
+    """
+    with _shared_lock:
+        if name not in _shared_limiters:
+            _shared_limiters[name] = AdaptiveRateLimiter(**kwargs)
+        return _shared_limiters[name]
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Returns:
+        float: Seconds to wait, or None if missing/unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
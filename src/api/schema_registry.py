@@ -0,0 +1,226 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Nullable integer dtypes, narrowest first
+INT_DTYPES = ("Int8", "Int16", "Int32", "Int64")
+
+
+class SchemaRegistry:
+    """
+    Target pandas dtypes per API endpoint, so every page is cast to the same
+    compact schema as it arrives and pages concatenate without falling back
+    to object dtype.
+
+    A schema is either registered explicitly or learned from the first
+    sample_pages pages of an endpoint:
+
+        - integers (even if a page made them float because of nulls)
+          become nullable Int64, or with narrow_integers=True the
+          narrowest Int8/16/32/64 that fits the sample
+        - low-cardinality strings become "category", others "string"
+        - booleans become nullable "boolean", floats stay "float64"
+        - columns that are all-null or of mixed types are left alone
+
+    Narrowed integer columns are widened (and the schema re-saved) if a
+    later page overflows them. Pages already written keep the narrow type,
+    so a streamed Parquet/Arrow write (whose schema is fixed by the first
+    pages) fails on overflow: only narrow for whole-dataset writes. Pages
+    whose values cannot be cast keep the parsed column; this is logged and
+    counted in cast_failures. With a store, schemas persist between runs.
+    """
+
+    def __init__(
+        self,
+        store=None,
+        sample_pages=3,
+        category_ratio=0.5,
+        max_categories=1000,
+        narrow_integers=False,
+        logger=None,
+    ):
+        """
+        Args:
+            store (LocalSchemaStore | S3SchemaStore, optional): Persistence.
+            sample_pages (int): Pages to observe before fixing a learned schema.
+            category_ratio (float): Max distinct/non-null ratio for "category".
+            max_categories (int): Max distinct values for "category".
+            narrow_integers (bool): Learn Int8/16/32 when the sample fits.
+            logger (optional): Logger for pages that do not fit the schema.
+        """
+        self.store = store
+        self.sample_pages = sample_pages
+        self.category_ratio = category_ratio
+        self.max_categories = max_categories
+        self.narrow_integers = narrow_integers
+        self.logger = logger
+        self._lock = threading.Lock()
+        self.schemas = store.load() if store is not None else {}
+
+        # tracking fields
+        self.cast_failures = {}   # (endpoint, column) -> pages left uncast
+
+    def get(self, endpoint):
+        """{column: dtype} for the endpoint, or None if not known yet."""
+        with self._lock:
+            schema = self.schemas.get(endpoint)
+            return dict(schema) if schema is not None else None
+
+    def register(self, endpoint, schema):
+        """Pin a user-supplied {column: dtype} schema for an endpoint."""
+        with self._lock:
+            self.schemas[endpoint] = {col: str(dtype) for col, dtype in schema.items()}
+            self._save()
+
+    def learn(self, endpoint, frames):
+        """Infer and store the endpoint's schema from sample DataFrames."""
+        schema = self.infer(frames)
+        with self._lock:
+            self.schemas[endpoint] = schema
+            self._save()
+        return schema
+
+    def infer(self, frames):
+        """Infer {column: dtype} from sample DataFrames (see class docstring)."""
+        frames = [df for df in frames if len(df.columns)]
+        if not frames:
+            return {}
+        sample = pd.concat(frames, ignore_index=True)
+
+        schema = {}
+        for col in sample.columns:
+            dtype = self._infer_column(sample[col].dropna().infer_objects())
+            if dtype is not None:
+                schema[str(col)] = dtype
+        return schema
+
+    def _infer_column(self, values):
+        if values.empty:
+            return None
+        if pd.api.types.is_bool_dtype(values) or values.map(type).eq(bool).all():
+            return "boolean"
+        if pd.api.types.is_numeric_dtype(values):
+            if (values == np.floor(values)).all():
+                return _int_dtype_for(values.min(), values.max()) if self.narrow_integers else "Int64"
+            return "float64"
+        if values.map(type).eq(str).all():
+            distinct = values.nunique()
+            if distinct <= self.max_categories and distinct <= len(values) * self.category_ratio:
+                return "category"
+            return "string"
+        return None
+
+    def conform(self, endpoint, df):
+        """
+        Cast a page to the endpoint's schema. Missing columns are added as
+        nulls; integer columns that overflow are widened in the schema.
+        """
+        schema = self.get(endpoint)
+        if not schema:
+            return df
+
+        df = df.copy()
+        widened = {}
+        for col, dtype in schema.items():
+            if col not in df.columns:
+                df[col] = pd.Series(None, index=df.index, dtype=object)
+
+            if dtype in INT_DTYPES:
+                values = pd.to_numeric(df[col], errors="coerce").dropna()
+                if not values.empty:
+                    needed = _int_dtype_for(values.min(), values.max())
+                    if INT_DTYPES.index(needed) > INT_DTYPES.index(dtype):
+                        widened[col] = dtype = needed
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError) as e:
+                # Leave the column as parsed rather than lose the page
+                with self._lock:
+                    key = (endpoint, col)
+                    self.cast_failures[key] = self.cast_failures.get(key, 0) + 1
+                if self.logger is not None:
+                    self.logger.warning(
+                        "Column %s of a page from %s does not fit schema dtype %s, kept as %s: %s",
+                        col, endpoint, dtype, df[col].dtype, e,
+                    )
+
+        if widened:
+            with self._lock:
+                self.schemas[endpoint].update(widened)
+                self._save()
+        return df
+
+    def _save(self):
+        if self.store is not None:
+            self.store.save(self.schemas)
+
+
+def _int_dtype_for(low, high):
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype.lower())
+        if info.min <= low and high <= info.max:
+            return dtype
+    return "Int64"
+
+
+def unify_categories(frames):
+    """
+    Give every categorical column the union of its categories across frames
+    (cheap: only codes are remapped), so pd.concat keeps it categorical.
+    """
+    categorical = {
+        col for df in frames for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    for col in categorical:
+        categories = pd.Index([])
+        for df in frames:
+            if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+                categories = categories.union(df[col].cat.categories)
+        for df in frames:
+            if col in df.columns:
+                df[col] = df[col].astype(pd.CategoricalDtype(categories))
+    return frames
+
+
+class LocalSchemaStore:
+    """Keeps registry schemas in a local JSON file (atomically replaced on save)."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def save(self, schemas):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(schemas, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class S3SchemaStore:
+    """Keeps registry schemas as a JSON object in a bucket."""
+
+    def __init__(self, storage_client, bucket, key):
+        self.storage = storage_client
+        self.bucket = bucket
+        self.key = key
+
+    def load(self):
+        if not self.storage.exists(self.bucket, self.key):
+            return {}
+        return json.loads(self.storage.download_bytes(self.bucket, self.key))
+
+    def save(self, schemas):
+        data = json.dumps(schemas, sort_keys=True).encode("utf-8")
+        self.storage.upload_bytes(self.bucket, self.key, data, content_type="application/json")
@@ -1,7 +1,16 @@
+import contextvars
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait as wait_futures
+
 import requests
 
+from src.api.http_session import PooledHTTPSession
+from src.common.json_backend import get_json_backend
+from src.common.metrics import get_metrics
+from src.api.rate_limiter import parse_retry_after
+
 
 class UnstableAPIClient:
     """
@@ -11,6 +20,9 @@ class UnstableAPIClient:
         - rate-limit handling
         - transient 500/503 failures
         - pagination sequencing
+        - optional bounded-concurrency page fetching
+        - keep-alive connection reuse via a (shareable) PooledHTTPSession
+        - Retry-After headers and an optional shared AdaptiveRateLimiter
     """
 
 
@@ -21,20 +33,60 @@ class UnstableAPIClient:
         logger,
         max_retries=5,
         timeout=10,
-        jitter=True
+        jitter=True,
+        max_in_flight=1,
+        session=None,
+        rate_limiter=None,
+        json_backend=None,
+        metrics=None
     ):
+        """
+        Args:
+            session (PooledHTTPSession, optional): Shared connection pool.
+                When omitted, the client owns a pool sized to max_in_flight.
+            rate_limiter (AdaptiveRateLimiter, optional): Paces every request
+                and adapts to 429/503 responses; share one across clients
+                hitting the same API.
+            json_backend (optional): Parser for response bodies (see
+                common.json_backend); defaults to orjson when installed.
+            metrics (Metrics, optional): Instrumentation registry; defaults
+                to the process-wide one (common.metrics.get_metrics).
+        """
         self.base_url = base_url
         self.auth_client = auth_client
         self.logger = logger
         self.max_retries = max_retries
         self.timeout = timeout
         self.jitter = jitter
+        self.max_in_flight = max_in_flight
+        self.session = session or PooledHTTPSession.for_concurrency(max_in_flight)
+        self.rate_limiter = rate_limiter
+        self.json_backend = json_backend or get_json_backend()
+        self.metrics = metrics or get_metrics()
 
-        # tracking fields
+        # tracking fields (guarded by _stats_lock, workers update them concurrently)
+        self._stats_lock = threading.Lock()
         self.retry_count = 0
         self.successful_pages = 0
         self.failed_pages = 0
         self.records_ingested = 0
+        self.failed_page_numbers = set()
+
+    def _increment(self, field, amount=1):
+        """Thread-safe increment of one of the tracking counters."""
+        with self._stats_lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def _record_page(self, page, result):
+        """Update page/record counters for a fetched (or failed) page."""
+        with self._stats_lock:
+            if result is None:
+                self.failed_pages += 1
+                self.failed_page_numbers.add(page)
+            else:
+                self.failed_page_numbers.discard(page)
+                self.successful_pages += 1
+                self.records_ingested += len(result["data"])
 
     # ---------------------------------------------------------
     # 1. Fetch a single page (with retry logic)
@@ -48,74 +100,134 @@ class UnstableAPIClient:
         url = f"{self.base_url}"
         params = {"page": page, "limit": limit}
 
-        return self._retry_request(url, params)
+        with self.metrics.span("page_fetch", attributes={"page": page}):
+            return self._retry_request(url, params)
 
     # ---------------------------------------------------------
-    # 2. Retry Logic (500, 503, 429, network issues)
+    # 2. Retry Logic (500, 503, 429, 401, network issues)
     # ---------------------------------------------------------
+    def _backoff_wait(self, attempts, retry_after=None):
+        """Exponential backoff (+ jitter), unless the server told us how long to wait."""
+        if retry_after is not None:
+            return retry_after
+        wait = 2 ** attempts
+        if self.jitter:
+            wait += random.uniform(0, 1)
+        return wait
+
+    def _throttled_wait(self, attempts, response):
+        """
+        Seconds to sleep before retrying a 429/503. With a shared rate limiter,
+        a Retry-After pauses the limiter itself (so every caller waits) and
+        this request just queues behind it.
+        """
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_throttle(retry_after)
+            if retry_after is not None:
+                return 0
+        return self._backoff_wait(attempts, retry_after)
+
+    def _count_retry(self, reason):
+        self._increment("retry_count")
+        self.metrics.increment("http_retries_total", client="api", reason=reason)
+
+    def _sleep(self, wait):
+        """Backoff sleep, accounted in backoff_sleep_seconds_total."""
+        self.metrics.increment("backoff_sleep_seconds_total", wait, client="api")
+        time.sleep(wait)
+
     def _retry_request(self, url, params):
         attempts = 0
+        reauthenticated = False
 
         while attempts <= self.max_retries:
             try:
-                response = requests.get(
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+
+                token = self.auth_client.get_token()
+                start = time.perf_counter()
+                response = self.session.get(
                     url,
-                    headers=self.auth_client.get_auth_header(),
+                    headers={"Authorization": f"Bearer {token}"},
                     params=params,
                     timeout=self.timeout
                 )
+                self.metrics.observe(
+                    "http_request_seconds", time.perf_counter() - start, client="api", status=response.status_code
+                )
+                self.metrics.increment("http_response_bytes_total", len(response.content), client="api")
 
                 # SUCCESS
                 if response.status_code == 200:
-                    return response.json()
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.on_success()
+                    return self.json_backend.loads(response.content)
+
+                # TOKEN REJECTED (401): re-authenticate and retry once
+                if response.status_code == 401 and not reauthenticated:
+                    self.logger.warning("Token rejected (401): re-authenticating...")
+                    self.auth_client.refresh(stale_token=token)
+                    reauthenticated = True
+                    continue
 
                 # RATE LIMITED (429)
                 if response.status_code == 429:
-                    self.retry_count += 1
-                    wait = 2 ** attempts
-                    if self.jitter:
-                        wait += random.uniform(0, 1)
-                    self.logger.warning(f"Rate limited: retrying in {wait:.2f}s...")
-                    time.sleep(wait)
+                    self._count_retry("429")
+                    wait = self._throttled_wait(attempts, response)
+                    self.logger.warning("Rate limited: retrying in %.2fs...", wait)
+                    self._sleep(wait)
                     attempts += 1
                     continue
 
                 # SERVER FAILURE (500 or 503)
                 if response.status_code in (500, 503):
-                    self.retry_count += 1
-                    wait = 2 ** attempts
-                    if self.jitter:
-                        wait += random.uniform(0, 1)
-                    self.logger.error(f"Server error {response.status_code}: retrying in {wait:.2f}s...")
-                    time.sleep(wait)
+                    self._count_retry(str(response.status_code))
+                    if response.status_code == 503:
+                        wait = self._throttled_wait(attempts, response)
+                    else:
+                        wait = self._backoff_wait(attempts)
+                    self.logger.error("Server error %s: retrying in %.2fs...", response.status_code, wait)
+                    self._sleep(wait)
                     attempts += 1
                     continue
 
                 # NON-RETRYABLE ERROR
                 response.raise_for_status()
 
-            except requests.RequestException as e:
-                self.retry_count += 1
-                wait = 2 ** attempts
-                if self.jitter:
-                    wait += random.uniform(0, 1)
-                self.logger.error(f"Request failed: {e}, retrying in {wait:.2f}s...")
-                time.sleep(wait)
+            except (requests.RequestException, ValueError) as e:
+                # ValueError: truncated/invalid JSON body
+                self._count_retry(type(e).__name__)
+                wait = self._backoff_wait(attempts)
+                self.logger.error("Request failed: %s, retrying in %.2fs...", e, wait)
+                self._sleep(wait)
                 attempts += 1
 
         # FAILED ALL RETRIES
-        self.logger.error(f"Max retries exceeded for page params: {params}")
+        self.logger.error("Max retries exceeded for page params: %s", params)
         return None
 
     # ---------------------------------------------------------
     # 3. Generator for all pages (lazy iteration)
     # ---------------------------------------------------------
-    def iterate_all_pages(self, limit=1000):
+    def iterate_all_pages(self, limit=1000, max_in_flight=None, ordered=True):
         """
         Automatically yields all pages and tracks:
             - successful pages
             - failed pages
             - total records ingested
+
+        Page 1 is always fetched first to learn total_pages. When
+        max_in_flight > 1, pages 2..N are then fetched concurrently on a
+        thread pool with at most max_in_flight requests outstanding.
+
+        Args:
+            limit (int): Number of records per page.
+            max_in_flight (int, optional): Concurrent page requests.
+                Defaults to the client's max_in_flight.
+            ordered (bool): Yield pages in page order (True) or as soon
+                as each one completes (False).
         """
         page = 1
 
@@ -123,28 +235,86 @@ class UnstableAPIClient:
         first = self.fetch_page(page, limit)
         if not first:
             self.logger.error("Failed to fetch the first page — cannot continue.")
-            self.failed_pages += 1
+            self._record_page(page, None)
             return
 
         total_pages = first["metadata"]["total_pages"]
 
         # Track success & records
-        self.successful_pages += 1
-        self.records_ingested += len(first["data"])
+        self._record_page(page, first)
 
         # Yield first
         yield (page, first)
 
         # Remaining pages
-        for page in range(2, total_pages + 1):
-            result = self.fetch_page(page, limit)
+        remaining = range(2, total_pages + 1)
+        yield from self.iterate_pages(remaining, limit, max_in_flight, ordered)
 
-            if result is None:
-                self.failed_pages += 1
-                yield (page, None)
-                continue
+    def iterate_pages(self, pages, limit=1000, max_in_flight=None, ordered=True):
+        """
+        Yield (page, result) for an explicit list of page numbers, e.g. to
+        re-fetch only the pages a previous run is missing. Failed pages are
+        yielded as (page, None) and recorded in failed_page_numbers.
+        """
+        pages = list(pages)
+        workers = max_in_flight or self.max_in_flight
 
-            self.successful_pages += 1
-            self.records_ingested += len(result["data"])
+        if workers > 1:
+            yield from self._iterate_concurrent(pages, limit, workers, ordered)
+            return
 
+        for page in pages:
+            result = self.fetch_page(page, limit)
+            self._record_page(page, result)
             yield (page, result)
+
+    # ---------------------------------------------------------
+    # 4. Bounded-concurrency fetching
+    # ---------------------------------------------------------
+    def _iterate_concurrent(self, pages, limit, max_in_flight, ordered=True):
+        """
+        Fetch the given pages on a thread pool and yield (page, result).
+
+        At most max_in_flight pages are outstanding at once. In ordered mode,
+        pages that finished ahead of a slower earlier page count against that
+        budget, so memory stays bounded by max_in_flight pages.
+        """
+        pending = iter(pages)
+        yield_order = iter(pages)
+        next_to_yield = next(yield_order, None)
+        in_flight = {}
+        completed = {}
+
+        pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="page-fetch")
+
+        def fill():
+            while len(in_flight) + len(completed) < max_in_flight:
+                page = next(pending, None)
+                if page is None:
+                    return
+                # Copy the context so page_fetch spans nest under the caller's span
+                in_flight[pool.submit(contextvars.copy_context().run, self.fetch_page, page, limit)] = page
+
+        try:
+            fill()
+            while in_flight:
+                finished, _ = wait_futures(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    page = in_flight.pop(future)
+                    result = future.result()
+                    self._record_page(page, result)
+
+                    if ordered:
+                        completed[page] = result
+                    else:
+                        yield (page, result)
+
+                while next_to_yield is not None and next_to_yield in completed:
+                    yield (next_to_yield, completed.pop(next_to_yield))
+                    next_to_yield = next(yield_order, None)
+
+                fill()
+        finally:
+            # Don't block on outstanding requests if the consumer stops early
+            pool.shutdown(wait=False, cancel_futures=True)
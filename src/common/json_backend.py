@@ -0,0 +1,73 @@
+"""
+Pluggable JSON parser for API response bodies.
+
+orjson is used when it is installed (it parses straight from bytes and is
+several times faster than the standard library); otherwise the stdlib json
+module is used. Select a backend explicitly with set_json_backend("json").
+
+The JSON/NDJSON codecs do not use it: pd.read_json parses bytes in C as
+well, and its dtype and date conversion is what makes frames round-trip.
+"""
+import json
+
+
+class StdlibJsonBackend:
+    """The standard library json module."""
+
+    name = "json"
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+
+class OrjsonBackend:
+    """orjson: parses bytes without decoding to str first."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+_BACKENDS = {"json": StdlibJsonBackend, "orjson": OrjsonBackend}
+_default_backend = None
+
+
+def get_json_backend(name=None):
+    """
+    Return a backend by name ("orjson", "json"), or the process default
+    (orjson if installed, else json) when name is None.
+
+    Raises:
+        ValueError: Unknown backend name.
+    """
+    global _default_backend
+
+    if name is not None:
+        if name not in _BACKENDS:
+            raise ValueError(f"Unsupported JSON backend: {name}")
+        return _BACKENDS[name]()
+
+    if _default_backend is None:
+        try:
+            _default_backend = OrjsonBackend()
+        except ImportError:
+            _default_backend = StdlibJsonBackend()
+    return _default_backend
+
+
+def set_json_backend(backend):
+    """Set the process default backend (a name or a backend instance)."""
+    global _default_backend
+    _default_backend = get_json_backend(backend) if isinstance(backend, str) else backend
+
+
+def loads(data):
+    """Parse JSON from bytes or str with the default backend."""
+    return get_json_backend().loads(data)
@@ -1,49 +1,227 @@
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# LogRecord attributes that are not user-supplied `extra` fields
+_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "suppressed"}
+
+_listeners = {}
+_listeners_lock = threading.Lock()
+
 
 class AppLogger:
-    """Application-wide logger for console and file output."""
+    """
+    Application-wide logger for console and file output.
 
-    def __init__(self, name: str = "app", level: int = logging.DEBUG):
+    By default handlers run on the calling thread. With async_handlers=True
+    the logger only enqueues records (QueueHandler) and a background
+    QueueListener does the formatting and I/O, so hot paths such as page
+    fetchers never block on a terminal or disk. Call close() (also run at
+    interpreter exit) to drain the queue.
+    """
+
+    def __init__(
+        self,
+        name: str = "app",
+        level: int = logging.DEBUG,
+        async_handlers: bool = False,
+        json_console: bool = False,
+        log_file: str = "logs/app.log",
+        rate_limit: float = None,
+        sample_rate: float = None,
+    ):
+        """
+        Args:
+            name: Logger name.
+            level: Logger level.
+            async_handlers: Hand records to a background thread for output.
+            json_console: Write JSON lines to the console instead of text.
+            log_file: Rotating file for ERROR+ records (JSON lines).
+            rate_limit: Max records per second per message template at
+                WARNING and below (see RateLimitFilter).
+            sample_rate: Fraction of DEBUG/INFO records to keep (see
+                SamplingFilter).
+        """
+        self.name = name
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
 
-        # Make sure logs/ folder exists
-        Path("logs").mkdir(exist_ok=True)
+        # Make sure the log folder exists
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
         # Prevent duplicate handlers if logger imported multiple times
         if not self.logger.handlers:
 
-            # === Console formatter (human-readable) ===
-            console_format = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-
-            # === File formatter (JSON-like) ===
-            file_format = logging.Formatter(
-                "{'time':'%(asctime)s', 'name':'%(name)s', "
-                "'level':'%(levelname)s', 'message':'%(message)s'}"
-            )
+            # === Console formatter (human-readable or JSON) ===
+            if json_console:
+                console_format = JsonFormatter()
+            else:
+                console_format = logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                )
 
             # === Console handler ===
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.DEBUG)   # everything to console
             console_handler.setFormatter(console_format)
 
-            # === Rotating file handler ===
+            # === Rotating file handler (one JSON object per line) ===
             file_handler = RotatingFileHandler(
-                "logs/app.log",
+                log_file,
                 maxBytes=5 * 1024 * 1024,  # 5 MB
                 backupCount=5
             )
             file_handler.setLevel(logging.ERROR)  # only log ERROR+ to file
-            file_handler.setFormatter(file_format)
+            file_handler.setFormatter(JsonFormatter())
+
+            # Filters run on the calling thread, before any formatting
+            if rate_limit is not None:
+                self.logger.addFilter(RateLimitFilter(rate=rate_limit))
+            if sample_rate is not None:
+                self.logger.addFilter(SamplingFilter(sample_rate))
 
             # Add handlers
-            self.logger.addHandler(console_handler)
-            self.logger.addHandler(file_handler)
+            if async_handlers:
+                listener = QueueListener(
+                    queue.SimpleQueue(), console_handler, file_handler, respect_handler_level=True
+                )
+                self.logger.addHandler(_PreparedQueueHandler(listener.queue))
+                listener.start()
+                with _listeners_lock:
+                    _listeners[name] = listener
+            else:
+                self.logger.addHandler(console_handler)
+                self.logger.addHandler(file_handler)
 
     def get_logger(self):
         return self.logger
+
+    def close(self):
+        """Flush queued records and stop the background listener, if any."""
+        with _listeners_lock:
+            listener = _listeners.pop(self.name, None)
+        if listener is not None:
+            listener.stop()
+            for handler in list(self.logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    self.logger.removeHandler(handler)
+            for handler in listener.handlers:
+                handler.close()
+
+
+@atexit.register
+def _stop_listeners():
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        listener.stop()
+
+
+class _PreparedQueueHandler(QueueHandler):
+    """
+    QueueHandler that only merges args into the message before enqueueing.
+
+    The stock prepare() formats the whole record (traceback included) into
+    msg, so downstream formatters (e.g. JSON) could not structure it.
+    """
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# ---------------------------------------------------------
+# Formatting
+# ---------------------------------------------------------
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line:
+    {"time", "name", "level", "message", ...extra fields, "exception"}.
+    """
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+# ---------------------------------------------------------
+# Volume control
+# ---------------------------------------------------------
+class RateLimitFilter(logging.Filter):
+    """
+    Lets through at most `rate` records per second (bursts up to `burst`)
+    for each message template, e.g. "Rate limited: retrying in %.2fs...".
+
+    Records above max_level are never dropped. The next record that passes
+    after some were dropped carries `suppressed` (the number dropped) and a
+    note in its message.
+    """
+
+    def __init__(self, rate=10.0, burst=None, max_level=logging.WARNING):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.max_level = max_level
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+        # tracking fields
+        self.suppressed = 0
+
+    def filter(self, record):
+        if record.levelno > self.max_level:
+            return True
+        # msg may be any object (e.g. a dict), so key on its text
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at, dropped = self._buckets.get(key, (self.burst, now, 0))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now, dropped + 1)
+                self.suppressed += 1
+                return False
+            self._buckets[key] = (tokens - 1, now, 0)
+        if dropped:
+            record.suppressed = dropped
+            record.msg = f"{record.msg} ({dropped} similar messages suppressed)"
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a random fraction of records at or below max_level (default INFO)."""
+
+    def __init__(self, sample_rate, max_level=logging.INFO):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.max_level = max_level
+
+    def filter(self, record):
+        return record.levelno > self.max_level or random.random() < self.sample_rate
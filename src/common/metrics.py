@@ -0,0 +1,311 @@
+"""
+Lightweight metrics and tracing shared by the api and storage packages.
+
+A Metrics registry aggregates counters and histograms in memory and fans
+span events and snapshots out to pluggable sinks:
+
+    metrics = get_metrics()
+    metrics.add_sink(PrometheusTextSink("metrics/ingest.prom"))
+    metrics.add_sink(JsonLinesSink("metrics/spans.jsonl"))
+
+    with metrics.span("ingest", endpoint="orders"):
+        ...
+    metrics.flush()
+
+Every span also feeds a "{name}_seconds" histogram with the span's labels,
+so page_fetch -> frame_build -> encode -> upload timings show up both as
+traces and as aggregated latency distributions.
+"""
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def quantile(self, q):
+        """Upper bucket bound below which a fraction q of observations fall."""
+        if not self.count:
+            return None
+        target = q * self.count
+        for bound, count in zip(self.buckets, self.counts):
+            if count >= target:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "buckets": dict(zip(map(str, self.buckets), self.counts)),
+        }
+
+
+class Span:
+    """One timed operation; nested spans share trace_id and link via parent_id."""
+
+    def __init__(self, name, labels, parent=None, attributes=None):
+        self.name = name
+        self.labels = labels
+        self.attributes = attributes or {}
+        self.span_id = os.urandom(8).hex()
+        self.trace_id = parent.trace_id if parent else os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.start = time.time()
+        self.duration = None
+
+    def to_dict(self):
+        return {
+            "type": "span",
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration": self.duration,
+            "labels": self.labels,
+            "attributes": self.attributes,
+        }
+
+
+class Metrics:
+    """Thread-safe registry of counters and histograms with pluggable sinks."""
+
+    def __init__(self, sinks=None, buckets=DEFAULT_BUCKETS):
+        self.sinks = list(sinks or [])
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def increment(self, name, value=1, **labels):
+        """Add value to a counter, e.g. increment("http_retries_total", reason="429")."""
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """Record one observation in a histogram, e.g. a latency in seconds."""
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Observe the duration of the block in histogram name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @contextmanager
+    def span(self, name, attributes=None, **labels):
+        """
+        Trace a block: records "{name}_seconds" and emits a span event to the
+        sinks. Spans opened inside the block (same thread or a context copied
+        with contextvars) become its children.
+
+        Args:
+            name (str): Span name, e.g. "page_fetch".
+            attributes (dict, optional): High-cardinality details (page
+                number, key) kept on the span event only, not as labels.
+            **labels: Low-cardinality labels, e.g. format="parquet".
+        """
+        span = Span(name, labels, parent=_current_span.get(), attributes=attributes)
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - start
+            _current_span.reset(token)
+            self.observe(f"{name}_seconds", span.duration, **labels)
+            if self.sinks:
+                event = span.to_dict()
+                for sink in self.sinks:
+                    sink.emit(event)
+
+    def counter_value(self, name, **labels):
+        with self._lock:
+            return self.counters.get(self._key(name, labels), 0)
+
+    def histogram(self, name, **labels):
+        with self._lock:
+            return self.histograms.get(self._key(name, labels))
+
+    def snapshot(self):
+        """All counters and histograms as plain data."""
+        with self._lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                    for (name, labels), histogram in sorted(self.histograms.items())
+                ],
+            }
+
+    def flush(self):
+        """Push the current snapshot to every sink (e.g. rewrite the .prom file)."""
+        for sink in self.sinks:
+            sink.flush(self)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+# ---------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------
+class InMemorySink:
+    """Keeps span events and flushed snapshots in lists (tests, notebooks)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.events = []
+        self.snapshots = []
+
+    def emit(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def flush(self, metrics):
+        with self._lock:
+            self.snapshots.append(metrics.snapshot())
+
+    def spans(self, name=None):
+        with self._lock:
+            return [event for event in self.events if name is None or event["name"] == name]
+
+
+class JsonLinesSink:
+    """Appends span events and flushed snapshots to a file, one JSON object per line."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def emit(self, event):
+        line = json.dumps(event, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def flush(self, metrics):
+        line = json.dumps({"type": "snapshot", "time": time.time(), **metrics.snapshot()}, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class PrometheusTextSink:
+    """
+    Writes the Prometheus text exposition format to a file on flush (atomic
+    replace), e.g. for node_exporter's textfile collector.
+    """
+
+    def __init__(self, path, prefix=""):
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def emit(self, event):
+        pass
+
+    def flush(self, metrics):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(self.render(metrics))
+        os.replace(tmp_path, self.path)
+
+    def render(self, metrics):
+        lines = []
+        typed = set()
+        with metrics._lock:
+            counters = sorted(metrics.counters.items())
+            histograms = sorted(
+                ((key, histogram.buckets, list(histogram.counts), histogram.count, histogram.sum)
+                 for key, histogram in metrics.histograms.items()),
+                key=lambda item: item[0],
+            )
+
+        for (name, labels), value in counters:
+            name = self.prefix + name
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_labels(labels)} {value}")
+
+        for (name, labels), buckets, counts, count, total in histograms:
+            name = self.prefix + name
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            for bound, bucket_count in zip(buckets, counts):
+                lines.append(f"{name}_bucket{_labels(labels + (('le', str(bound)),))} {bucket_count}")
+            lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {total}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_default_metrics = Metrics()
+
+
+def get_metrics():
+    """The process-wide Metrics registry used when a component is given none."""
+    return _default_metrics
@@ -1,11 +1,12 @@
-import requests
 from src.common.logger.app_logger import AppLogger
 from src.api.auth_client import AuthClient
-from tests.test_storage import test_storage
-from tests.test_unstable_api import test_unstable_api_integration
 
 
 def main():
+    # Demo-only dependencies: keep them out of the import path of src.main
+    import requests
+    from tests.test_storage import test_storage
+    from tests.test_unstable_api import test_unstable_api_integration
 
     logger = AppLogger("my_logger").get_logger()
 
@@ -0,0 +1,122 @@
+import posixpath
+
+from src.pipelines.pipeline import DEFAULT_QUEUE_SIZE, Pipeline, Stage
+
+
+class ApiToStoragePipeline:
+    """
+    AuthClient -> UnstableAPIClient -> frame building/encoding -> storage,
+    with the three steps running concurrently (see Pipeline).
+
+    Every page becomes its own object "{prefix}/part-NNNNNN.{format}", so
+    pages can be written as soon as they are encoded, in any order. Encoding
+    and upload go through StorageDataService.encode_df()/upload_encoded(), so
+    spans and the column statistics index (written once per run) match
+    upload_df(). Read the result back with
+    StorageDataService.read_prefix(bucket, prefix, format).
+    """
+
+    def __init__(
+        self,
+        api_client,
+        storage_service,
+        logger,
+        fetch_workers=8,
+        transform_workers=2,
+        upload_workers=4,
+        queue_size=DEFAULT_QUEUE_SIZE,
+        metrics=None,
+    ):
+        """
+        Args:
+            api_client: UnstableAPIClient (or compatible fetch_page()).
+            storage_service: StorageDataService used for encoding and upload.
+            logger: Logger instance.
+            fetch_workers (int): Concurrent page requests.
+            transform_workers (int): Threads building DataFrames and encoding.
+            upload_workers (int): Concurrent uploads.
+            queue_size (int): Capacity of each inter-stage queue.
+            metrics (Metrics, optional): Passed to the Pipeline.
+        """
+        self.api_client = api_client
+        self.storage = storage_service
+        self.logger = logger
+        self.fetch_workers = fetch_workers
+        self.transform_workers = transform_workers
+        self.upload_workers = upload_workers
+        self.queue_size = queue_size
+        self.metrics = metrics
+        self.pipeline = None
+
+        # tracking fields
+        self.failed_pages = []
+
+    def run(self, bucket, prefix, format="parquet", limit=1000, **options):
+        """
+        Fetch every page and write it under prefix.
+
+        Args:
+            bucket (str): Bucket name.
+            prefix (str): Prefix of the part objects.
+            format (str): Registered format, e.g. "parquet" or "csv".
+            limit (int): Records per page.
+            **options: Codec options, e.g. compression="zstd".
+
+        Returns:
+            list[str]: Keys written, in page order.
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        import pandas as pd
+
+        self.storage.fmt.get_codec(format)  # fail on an unsupported format before fetching
+        self.failed_pages = []
+
+        first = self.api_client.fetch_page(1, limit=limit)
+        if not first:
+            self.logger.error("Failed to fetch the first page — cannot continue.")
+            return []
+        total_pages = first["metadata"]["total_pages"]
+
+        def fetch(page):
+            result = first if page == 1 else self.api_client.fetch_page(page, limit=limit)
+            if result is None:
+                self.failed_pages.append(page)
+                return None
+            if not result.get("data"):
+                self.logger.warning("Page %s returned no data.", page)
+                return None
+            return page, result["data"]
+
+        def transform(item):
+            page, records = item
+            return (page, *self.storage.encode_df(pd.DataFrame(records), format, **options))
+
+        def upload(item):
+            page, data, index_entry = item
+            key = posixpath.join(prefix.rstrip("/"), f"part-{page:06d}.{format}")
+            self.storage.upload_encoded(data, bucket, key, format, index_entry, **options)
+            return key
+
+        self.pipeline = Pipeline(
+            [
+                Stage("fetch", fetch, workers=self.fetch_workers, queue_size=self.queue_size),
+                Stage("transform", transform, workers=self.transform_workers, queue_size=self.queue_size),
+                Stage("upload", upload, workers=self.upload_workers, queue_size=self.queue_size),
+            ],
+            self.logger,
+            metrics=self.metrics,
+        )
+        with self.storage.index_batch():
+            keys = sorted(self.pipeline.run(range(1, total_pages + 1)))
+
+        self.failed_pages.sort()
+        if self.failed_pages:
+            self.logger.error("Pages failed after retries: %s", self.failed_pages)
+        self.logger.info("Wrote %s parts to %s/%s\n%s", len(keys), bucket, prefix, self.pipeline.report())
+        return keys
+
+    def stats(self):
+        """Per-stage stats of the last run (see Pipeline.stats)."""
+        return self.pipeline.stats() if self.pipeline else []
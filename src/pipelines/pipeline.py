@@ -0,0 +1,303 @@
+import queue
+import threading
+import time
+
+from src.common.metrics import get_metrics
+
+DEFAULT_QUEUE_SIZE = 16
+SAMPLE_INTERVAL = 0.05
+
+# end-of-stream marker passed down the queues, one per downstream worker
+_DONE = object()
+
+
+class Stage:
+    """
+    One step of a Pipeline: func applied to every item by `workers` threads.
+
+    func returns the item for the next stage, or None to drop it (e.g. a
+    page that exhausted its retries). With fan_out=True it returns an
+    iterable and every element is passed on separately.
+    """
+
+    def __init__(self, name, func, workers=1, queue_size=DEFAULT_QUEUE_SIZE, fan_out=False):
+        """
+        Args:
+            name (str): Stage name used in stats and metrics.
+            func (callable): item -> result.
+            workers (int): Threads running func concurrently.
+            queue_size (int): Capacity of this stage's input queue; a full
+                queue blocks the upstream stage (backpressure).
+            fan_out (bool): func returns an iterable of results.
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.fan_out = fan_out
+        self.stats = StageStats(name, self.workers, queue_size)
+
+
+class StageStats:
+    """Counters and timings of one stage, updated by its workers."""
+
+    def __init__(self, name, workers, queue_size):
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self.items_in = 0
+        self.items_out = 0
+        self.dropped = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0   # waiting for room downstream (backpressure)
+        self.starved_seconds = 0.0   # waiting for input
+        self.queue_samples = 0
+        self.queue_total = 0
+        self.queue_max = 0
+        self.started_at = None
+        self.finished_at = None
+        self.first_item_at = None    # when the first item started processing
+        self.last_item_at = None     # when the last item finished processing
+
+    def add(self, **deltas):
+        with self._lock:
+            for field, delta in deltas.items():
+                setattr(self, field, getattr(self, field) + delta)
+
+    def mark_item(self, start, end):
+        with self._lock:
+            if self.first_item_at is None or start < self.first_item_at:
+                self.first_item_at = start
+            if self.last_item_at is None or end > self.last_item_at:
+                self.last_item_at = end
+
+    def sample_queue(self, size):
+        with self._lock:
+            self.queue_samples += 1
+            self.queue_total += size
+            self.queue_max = max(self.queue_max, size)
+
+    def to_dict(self):
+        with self._lock:
+            elapsed = ((self.finished_at or time.perf_counter()) - self.started_at) if self.started_at else 0.0
+            capacity = self.workers * elapsed
+
+            def offset(at):
+                return round(at - self.started_at, 3) if at is not None and self.started_at else None
+
+            return {
+                "stage": self.name,
+                "workers": self.workers,
+                "items_in": self.items_in,
+                "items_out": self.items_out,
+                "dropped": self.dropped,
+                "items_per_sec": round(self.items_in / elapsed, 2) if elapsed else 0.0,
+                "utilization": round(self.busy_seconds / capacity, 3) if capacity else 0.0,
+                "blocked_seconds": round(self.blocked_seconds, 3),
+                "starved_seconds": round(self.starved_seconds, 3),
+                "queue_avg": round(self.queue_total / self.queue_samples, 2) if self.queue_samples else 0.0,
+                "queue_max": self.queue_max,
+                "queue_size": self.queue_size,
+                "first_item_at": offset(self.first_item_at),
+                "last_item_at": offset(self.last_item_at),
+            }
+
+
+class Pipeline:
+    """
+    Runs stages concurrently, connected by bounded queues.
+
+        pipeline = Pipeline([
+            Stage("fetch", fetch_page, workers=8),
+            Stage("encode", build_and_encode, workers=2),
+            Stage("upload", upload, workers=4),
+        ], logger)
+        for key in pipeline.run(range(1, total_pages + 1)):
+            ...
+        print(pipeline.report())
+
+    Each stage has its own worker threads, so network fetches, frame
+    building/encoding and uploads overlap. Queues are bounded: when a
+    stage falls behind, its input queue fills up and the stages before it
+    block instead of buffering without limit.
+
+    Per stage, stats() reports throughput, utilization (busy time over
+    worker time), time blocked on a full downstream queue, time starved
+    for input, the average/maximum occupancy of its input queue, and when
+    its first item started and last item finished (seconds since the run
+    started; stages overlap when a stage starts before the previous one
+    finishes). The
+    bottleneck is the stage with high utilization and a full input queue;
+    stages after it are starved and stages before it are blocked.
+
+    Workers are threads: CPU-bound stages scale only as far as the work
+    releases the GIL (pandas/pyarrow parsing and compression mostly do).
+    """
+
+    def __init__(self, stages, logger, metrics=None, sample_interval=SAMPLE_INTERVAL):
+        """
+        Args:
+            stages (list[Stage]): Stages in order.
+            logger: Logger instance.
+            metrics (Metrics, optional): Records per-item stage timings
+                (pipeline_stage_seconds{stage}); defaults to the process-wide
+                registry.
+            sample_interval (float): Seconds between queue occupancy samples.
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = list(stages)
+        self.logger = logger
+        self.metrics = metrics or get_metrics()
+        self.sample_interval = sample_interval
+        self.elapsed = 0.0
+
+    def run(self, items):
+        """
+        Feed items through the stages and yield the last stage's results as
+        they complete (not in input order).
+
+        Raises:
+            Exception: The first error raised by a stage function; the
+                remaining work is abandoned.
+        """
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        results = queue.Queue(maxsize=self.stages[-1].queue_size)
+        stop = threading.Event()
+        errors = []
+        threads = []
+
+        def put(q, item, stats):
+            # Blocking put that gives up when the pipeline is stopped
+            start = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if stats is not None:
+                stats.add(blocked_seconds=time.perf_counter() - start)
+
+        def feed():
+            try:
+                for item in items:
+                    if stop.is_set():
+                        return
+                    put(queues[0], item, None)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                for _ in range(self.stages[0].workers):
+                    put(queues[0], _DONE, None)
+
+        def work(index, remaining):
+            stage = self.stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(self.stages) else results
+            next_workers = self.stages[index + 1].workers if index + 1 < len(self.stages) else 1
+            stats = stage.stats
+            try:
+                while not stop.is_set():
+                    start = time.perf_counter()
+                    try:
+                        item = inbox.get(timeout=0.1)
+                    except queue.Empty:
+                        stats.add(starved_seconds=time.perf_counter() - start)
+                        continue
+                    stats.add(starved_seconds=time.perf_counter() - start)
+                    if item is _DONE:
+                        break
+
+                    start = time.perf_counter()
+                    result = stage.func(item)
+                    outputs = list(result) if stage.fan_out and result is not None else [result]
+                    busy = time.perf_counter() - start
+                    self.metrics.observe("pipeline_stage_seconds", busy, stage=stage.name)
+                    stats.add(items_in=1, busy_seconds=busy)
+                    stats.mark_item(start, start + busy)
+
+                    for output in outputs:
+                        if output is None:
+                            stats.add(dropped=1)
+                            continue
+                        put(outbox, output, stats)
+                        stats.add(items_out=1)
+            except Exception as e:
+                self.logger.error("Pipeline stage %s failed: %s", stage.name, e, exc_info=True)
+                errors.append(e)
+                stop.set()
+            finally:
+                # The last worker of a stage closes the stream for the next one
+                with remaining["lock"]:
+                    remaining["count"] -= 1
+                    last = remaining["count"] == 0
+                if last:
+                    stats.finished_at = time.perf_counter()
+                    for _ in range(next_workers):
+                        put(outbox, _DONE, None)
+
+        def sample():
+            while not stop.wait(self.sample_interval):
+                for stage, q in zip(self.stages, queues):
+                    stage.stats.sample_queue(q.qsize())
+
+        started = time.perf_counter()
+        for index, stage in enumerate(self.stages):
+            stage.stats = StageStats(stage.name, stage.workers, stage.queue_size)
+            stage.stats.started_at = started
+            remaining = {"lock": threading.Lock(), "count": stage.workers}
+            for n in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=work, args=(index, remaining), name=f"pipeline-{stage.name}-{n}", daemon=True
+                ))
+        threads.append(threading.Thread(target=feed, name="pipeline-source", daemon=True))
+        sampler = threading.Thread(target=sample, name="pipeline-sampler", daemon=True)
+        for thread in threads:
+            thread.start()
+        sampler.start()
+
+        try:
+            while True:
+                try:
+                    result = results.get(timeout=0.1)
+                except queue.Empty:
+                    if stop.is_set():
+                        break
+                    continue
+                if result is _DONE:
+                    break
+                yield result
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            sampler.join()
+            self.elapsed = time.perf_counter() - started
+
+        if errors:
+            raise errors[0]
+
+    def stats(self):
+        """Per-stage stats of the last (or current) run."""
+        return [stage.stats.to_dict() for stage in self.stages]
+
+    def bottleneck(self):
+        """Name of the stage with the highest utilization."""
+        return max(self.stats(), key=lambda stats: stats["utilization"])["stage"]
+
+    def report(self):
+        """Human-readable stats table."""
+        lines = [
+            f"{'stage':<12} {'workers':>7} {'items':>7} {'items/s':>9} {'util':>6} "
+            f"{'blocked s':>9} {'starved s':>9} {'queue avg/max':>14}"
+        ]
+        for s in self.stats():
+            lines.append(
+                f"{s['stage']:<12} {s['workers']:>7} {s['items_in']:>7} {s['items_per_sec']:>9.1f} "
+                f"{s['utilization']:>6.0%} {s['blocked_seconds']:>9.2f} {s['starved_seconds']:>9.2f} "
+                f"{s['queue_avg']:>7.1f}/{s['queue_max']}/{s['queue_size']}"
+            )
+        return "\n".join(lines)
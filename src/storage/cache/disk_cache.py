@@ -0,0 +1,127 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class DiskCache:
+    """
+    Local on-disk cache of object bytes, keyed by bucket/key and tagged
+    with the object's ETag.
+
+    - Each entry is a single file: one JSON header line (bucket, key, etag)
+      followed by the raw bytes. Entries are written to a temp file and
+      os.replace()d into place, so readers never see partial writes.
+    - Eviction is least-recently-used by total bytes (file mtime is bumped
+      on every hit) and runs under an exclusive file lock, so several
+      processes can share one cache directory.
+    """
+
+    def __init__(self, directory=".cache/s3", max_bytes=1024 * 1024 * 1024):
+        """
+        Args:
+            directory (str): Cache directory (created if missing).
+            max_bytes (int): Total size budget for cached entries.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock_path = self.directory / ".lock"
+
+        # tracking fields (per process)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, bucket, key):
+        digest = hashlib.sha256(f"{bucket}/{key}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.entry"
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Exclusive inter-process lock around eviction."""
+        with open(self._lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, bucket, key):
+        """
+        Returns:
+            tuple: (etag, data) for a cached entry, or None on a miss.
+        """
+        path = self._path(bucket, key)
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                data = f.read()
+            os.utime(path)  # mark as recently used
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+
+        if header.get("bucket") != bucket or header.get("key") != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return header["etag"], data
+
+    def put(self, bucket, key, etag, data):
+        """Store data for bucket/key at the given ETag, then enforce max_bytes."""
+        if not etag or len(data) > self.max_bytes:
+            return
+
+        header = json.dumps({"bucket": bucket, "key": key, "etag": etag}).encode("utf-8") + b"\n"
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(tmp_path, self._path(bucket, key))
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def invalidate(self, bucket, key):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path(bucket, key))
+
+    def size_bytes(self):
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _entries(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".entry"):
+                yield entry
+
+    def evict(self):
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        with self._locked():
+            entries = []
+            for entry in self._entries():
+                with contextlib.suppress(FileNotFoundError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                    self.evictions += 1
+                total -= size
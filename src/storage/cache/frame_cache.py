@@ -0,0 +1,54 @@
+import threading
+from collections import OrderedDict
+
+
+class FrameCache:
+    """
+    In-memory LRU cache of decoded DataFrames, bounded by total bytes.
+
+    Entries are keyed by (bucket, key, format, etag), so a changed object
+    never returns a stale frame. Frames are handed out as shallow copies;
+    with pandas copy-on-write (the default from pandas 3) callers can
+    modify them without affecting the cached frame.
+    """
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+
+        # tracking fields
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cache_key):
+        with self._lock:
+            entry = self._frames.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(cache_key)
+            self.hits += 1
+        return entry[0].copy(deep=False)
+
+    def put(self, cache_key, df):
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._frames.pop(cache_key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._frames[cache_key] = (df.copy(deep=False), size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._frames.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self.current_bytes = 0
@@ -1,5 +1,20 @@
-import boto3
+import io
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
 from botocore.exceptions import ClientError
+from src.common.metrics import get_metrics
+from src.storage.clients.object_readers import ChunkStream, RangedObjectReader
+
+# S3 rejects multipart parts smaller than 5 MiB (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+
+_client_lock = threading.Lock()
 
 
 class BaseS3Client:
@@ -9,37 +24,460 @@ class BaseS3Client:
 
     This client provides low-level byte-oriented operations (upload, download,
     exists) and is intended to be extended by more specialized clients.
+
+    Large transfers are split into parts of part_size bytes that are moved
+    by up to max_workers threads: multipart uploads above
+    multipart_threshold, and byte-range GETs for downloads.
+
+    An optional DiskCache makes download_bytes read-through: cached copies
+    are revalidated with a conditional GET (If-None-Match) and served
+    locally when the object has not changed.
+
+    Request latencies (s3_request_seconds by operation) and bytes moved
+    (s3_bytes_uploaded_total / s3_bytes_downloaded_total) are recorded in
+    a Metrics registry.
+
+    boto3 is imported and the client built on first use of self.s3, so
+    constructing a client (e.g. at Lambda cold start) costs nothing until
+    a request is actually made.
     """
 
-    def __init__(self, logger, endpoint_url, access_key, secret_key, region_name="us-east-1"):
+    part_size = DEFAULT_PART_SIZE
+    max_workers = DEFAULT_MAX_WORKERS
+    multipart_threshold = DEFAULT_MULTIPART_THRESHOLD
+    cache = None
+    metrics = None
+    _s3 = None
+
+    def __init__(
+        self,
+        logger,
+        endpoint_url,
+        access_key,
+        secret_key,
+        region_name="us-east-1",
+        part_size=DEFAULT_PART_SIZE,
+        max_workers=DEFAULT_MAX_WORKERS,
+        multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+        cache=None,
+        metrics=None,
+    ):
         """
         Create an S3 client.
         """
         self.logger = logger
-        self.s3 = boto3.client(
-            "s3",
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region_name
+        self.cache = cache
+        self.metrics = metrics
+        self.configure_transfers(part_size, max_workers, multipart_threshold)
+        self._client_kwargs = {
+            "endpoint_url": endpoint_url,
+            "aws_access_key_id": access_key,
+            "aws_secret_access_key": secret_key,
+            "region_name": region_name,
+        }
+
+    @property
+    def s3(self):
+        """The boto3 S3 client, created on first access."""
+        if self._s3 is None:
+            with _client_lock:
+                if self._s3 is None:
+                    self._s3 = self._create_client()
+        return self._s3
+
+    @s3.setter
+    def s3(self, client):
+        self._s3 = client
+
+    def _create_client(self):
+        import boto3
+
+        return boto3.client("s3", config=self.boto_config(), **self._client_kwargs)
+
+    def configure_transfers(self, part_size=None, max_workers=None, multipart_threshold=None):
+        """Set part size, transfer thread count, and multipart threshold."""
+        if part_size is not None:
+            self.part_size = max(part_size, MIN_PART_SIZE)
+        if max_workers is not None:
+            self.max_workers = max(max_workers, 1)
+        if multipart_threshold is not None:
+            self.multipart_threshold = max(multipart_threshold, self.part_size)
+
+    def _get_metrics(self):
+        return self.metrics or get_metrics()
+
+    def _record_transfer(self, operation, seconds, uploaded=0, downloaded=0):
+        metrics = self._get_metrics()
+        metrics.observe("s3_request_seconds", seconds, operation=operation)
+        if uploaded:
+            metrics.increment("s3_bytes_uploaded_total", uploaded)
+        if downloaded:
+            metrics.increment("s3_bytes_downloaded_total", downloaded)
+
+    def boto_config(self):
+        """botocore Config with an HTTP pool large enough for max_workers threads."""
+        from botocore.config import Config
+
+        return Config(max_pool_connections=max(self.max_workers, 10))
+
+    # ---------------------------------------------------------
+    # Upload
+    # ---------------------------------------------------------
+    def upload_bytes(self, bucket, key, data, content_type="text/csv", content_encoding=None):
+        """
+        Upload data to the given bucket/key.
+
+        Args:
+            data: bytes-like object, readable file-like object, or an
+                iterable of bytes chunks. Bytes above multipart_threshold,
+                files, and iterables are sent as a parallel multipart upload.
+            content_type (str): Content-Type of the object.
+            content_encoding (str, optional): Content-Encoding, e.g. "gzip".
+        """
+        if hasattr(data, "read"):
+            self.upload_fileobj(bucket, key, data, content_type=content_type, content_encoding=content_encoding)
+            return
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            self.upload_stream(bucket, key, data, content_type=content_type, content_encoding=content_encoding)
+            return
+        if len(data) > self.multipart_threshold:
+            view = memoryview(data)
+            parts = (
+                bytes(view[start:start + self.part_size])
+                for start in range(0, len(view), self.part_size)
+            )
+            self._multipart_upload(bucket, key, parts, self._object_args(content_type, content_encoding))
+            return
+
+        try:
+            start = time.perf_counter()
+            self.s3.put_object(Bucket=bucket, Key=key, Body=data, **self._object_args(content_type, content_encoding))
+            self._record_transfer("put_object", time.perf_counter() - start, uploaded=len(data))
+            self.logger.info("Uploaded %s to bucket %s", key, bucket)
+        except ClientError as e:
+            self.logger.error("Failed to upload %s to bucket %s: %s", key, bucket, e, exc_info=True)
+            raise
+
+    @staticmethod
+    def _object_args(content_type, content_encoding=None):
+        """Extra put_object / create_multipart_upload arguments."""
+        args = {"ContentType": content_type}
+        if content_encoding:
+            args["ContentEncoding"] = content_encoding
+        return args
+
+    def upload_fileobj(
+        self, bucket, key, fileobj, content_type="text/csv", content_encoding=None, part_size=None, max_workers=None
+    ):
+        """
+        Upload a readable file-like object, part by part.
+
+        Returns:
+            int: Total number of bytes uploaded.
+        """
+        part_size = max(part_size or self.part_size, MIN_PART_SIZE)
+        chunks = iter(lambda: fileobj.read(part_size), b"")
+        return self.upload_stream(
+            bucket,
+            key,
+            chunks,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            part_size=part_size,
+            max_workers=max_workers,
+        )
+
+    def upload_stream(
+        self, bucket, key, chunks, content_type="text/csv", content_encoding=None, part_size=None, max_workers=None
+    ):
+        """
+        Upload an iterable of byte chunks as one object using a multipart upload.
+
+        Chunks are buffered only until part_size bytes are available and at
+        most max_workers parts are in flight, so memory stays bounded by
+        roughly max_workers parts regardless of the object size. Small
+        streams that never fill a part are sent with a single put_object.
+
+        Args:
+            bucket (str): Bucket name.
+            key (str): Object path.
+            chunks (Iterable[bytes]): Data to upload, in order.
+            content_type (str): Content-Type of the final object.
+            content_encoding (str, optional): Content-Encoding, e.g. "gzip".
+            part_size (int, optional): Target part size in bytes (min 5 MiB).
+            max_workers (int, optional): Parts uploaded concurrently.
+
+        Returns:
+            int: Total number of bytes uploaded.
+        """
+        part_size = max(part_size or self.part_size, MIN_PART_SIZE)
+        parts = self._iter_parts(chunks, part_size)
+
+        first = next(parts, b"")
+        second = next(parts, None)
+        if second is None:
+            self.upload_bytes(bucket, key, first, content_type=content_type, content_encoding=content_encoding)
+            return len(first)
+
+        return self._multipart_upload(
+            bucket,
+            key,
+            self._chain_parts(first, second, parts),
+            self._object_args(content_type, content_encoding),
+            max_workers,
+        )
+
+    def _multipart_upload(self, bucket, key, parts, object_args, max_workers=None):
+        """Upload an iterable of parts concurrently and complete the upload."""
+        max_workers = max_workers or self.max_workers
+        upload_id = None
+        try:
+            upload_id = self.s3.create_multipart_upload(Bucket=bucket, Key=key, **object_args)["UploadId"]
+
+            completed = []
+            in_flight = set()
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-upload") as pool:
+                for number, body in enumerate(parts, start=1):
+                    if len(in_flight) >= max_workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        completed.extend(future.result() for future in done)
+                    in_flight.add(pool.submit(self._upload_part, bucket, key, upload_id, number, body))
+                completed.extend(future.result() for future in in_flight)
+
+            completed.sort(key=lambda part: part["PartNumber"])
+            self.s3.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": [{"PartNumber": p["PartNumber"], "ETag": p["ETag"]} for p in completed]},
+            )
+            total = sum(part["Size"] for part in completed)
+            self.logger.info("Uploaded %s to bucket %s in %s parts", key, bucket, len(completed))
+            return total
+        except Exception as e:
+            self.logger.error("Failed multipart upload of %s to bucket %s: %s", key, bucket, e, exc_info=True)
+            if upload_id is not None:
+                self._abort_multipart(bucket, key, upload_id)
+            raise
+
+    def _upload_part(self, bucket, key, upload_id, number, body):
+        start = time.perf_counter()
+        response = self.s3.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body
         )
+        self._record_transfer("upload_part", time.perf_counter() - start, uploaded=len(body))
+        return {"PartNumber": number, "ETag": response["ETag"], "Size": len(body)}
+
+    @staticmethod
+    def _iter_parts(chunks, part_size):
+        """Re-chunk an iterable of bytes into parts of at least part_size bytes."""
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= part_size:
+                yield bytes(buffer[:part_size])
+                del buffer[:part_size]
+        if buffer:
+            yield bytes(buffer)
+
+    @staticmethod
+    def _chain_parts(first, second, rest):
+        yield first
+        yield second
+        yield from rest
 
-    def upload_bytes(self, bucket, key, data, content_type="text/csv"):
-        """ Upload raw bytes to the given bucket/key."""
+    def _abort_multipart(self, bucket, key, upload_id):
+        """Best-effort cleanup of an incomplete multipart upload."""
         try:
-            self.s3.put_object(Bucket=bucket, Key=key, Body=data, ContentType=content_type)
-            self.logger.info(f"Uploaded {key} to bucket {bucket}")
+            self.s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
         except ClientError as e:
-            self.logger.error(f"Failed to upload {key} to bucket {bucket}: {e}", exc_info=True)
+            self.logger.error("Failed to abort multipart upload of %s: %s", key, e, exc_info=True)
+
+    # ---------------------------------------------------------
+    # Download
+    # ---------------------------------------------------------
+    def download_bytes(self, bucket, key, info=None):
+        """
+        Download the object and return its raw bytes.
+
+        Args:
+            info (dict, optional): Receives the "ETag" of the version
+                actually downloaded (from the GET itself, not a separate HEAD).
+        """
+        info = {} if info is None else info
+        if self.cache is None:
+            return b"".join(self._iter_object(bucket, key, info=info))
+
+        cached = self.cache.get(bucket, key)
+        if cached is not None:
+            etag, data = cached
+            try:
+                response = self.s3.get_object(Bucket=bucket, Key=key, IfNoneMatch=etag)
+            except ClientError as e:
+                if self._is_not_modified(e):
+                    self.logger.debug("Cache hit for %s/%s", bucket, key)
+                    info["ETag"] = etag
+                    return data
+                self.logger.error("Failed to download %s from bucket %s: %s", key, bucket, e, exc_info=True)
+                raise
+            # Object changed since it was cached: the conditional GET returned the new body
+            data = response["Body"].read()
+            self._get_metrics().increment("s3_bytes_downloaded_total", len(data))
+            info["ETag"] = response.get("ETag")
+            self.cache.put(bucket, key, info["ETag"], data)
+            return data
+
+        data = b"".join(self._iter_object(bucket, key, info=info))
+        self.cache.put(bucket, key, info.get("ETag"), data)
+        return data
+
+    @staticmethod
+    def _is_not_modified(error):
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status == 304 or error.response["Error"]["Code"] in ("304", "NotModified")
+
+    def etag(self, bucket, key):
+        """Return the object's current ETag."""
+        try:
+            return self.s3.head_object(Bucket=bucket, Key=key)["ETag"]
+        except ClientError as e:
+            self.logger.error("Failed to read ETag of %s in bucket %s: %s", key, bucket, e, exc_info=True)
+            raise
+
+    def download_fileobj(self, bucket, key, fileobj, part_size=None, max_workers=None):
+        """
+        Download the object into a writable file-like object.
+
+        Ranges are fetched in parallel but written in order, so at most
+        max_workers parts are held in memory.
+
+        Returns:
+            int: Total number of bytes written.
+        """
+        total = 0
+        for chunk in self.iter_chunks(bucket, key, part_size=part_size, max_workers=max_workers):
+            fileobj.write(chunk)
+            total += len(chunk)
+        return total
+
+    def iter_chunks(self, bucket, key, part_size=None, max_workers=None):
+        """
+        Yield the object's bytes in order, one part_size range at a time.
+
+        The first range GET also reports the object size and ETag; the
+        remaining ranges are prefetched by up to max_workers threads and sent
+        with IfMatch=<that ETag>, so an object overwritten mid-download fails
+        with a 412 ClientError instead of being stitched from two versions.
+        """
+        return self._iter_object(bucket, key, part_size=part_size, max_workers=max_workers)
+
+    def _iter_object(self, bucket, key, part_size=None, max_workers=None, info=None):
+        """iter_chunks, optionally recording the object's ETag into info."""
+        part_size = part_size or self.part_size
+        max_workers = max_workers or self.max_workers
+
+        start = time.perf_counter()
+        try:
+            first = self.s3.get_object(Bucket=bucket, Key=key, Range=f"bytes=0-{part_size - 1}")
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "InvalidRange":
+                self.logger.error("Failed to download %s from bucket %s: %s", key, bucket, e, exc_info=True)
+                raise
+            # Zero-byte objects cannot satisfy any range
+            first = self._get_range(bucket, key, None)
+
+        etag = first.get("ETag")
+        if info is not None:
+            info["ETag"] = etag
+        body = first["Body"].read()
+        self._record_transfer("get_object", time.perf_counter() - start, downloaded=len(body))
+        yield body
+
+        total = self._object_size(first, len(body))
+        ranges = [
+            (start, min(start + part_size, total) - 1)
+            for start in range(len(body), total, part_size)
+        ]
+        if not ranges:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-download") as pool:
+            pending = iter(ranges)
+            window = deque()
+            for byte_range in pending:
+                window.append(pool.submit(self._read_range, bucket, key, byte_range, etag))
+                if len(window) >= max_workers:
+                    break
+            while window:
+                chunk = window.popleft().result()
+                next_range = next(pending, None)
+                if next_range is not None:
+                    window.append(pool.submit(self._read_range, bucket, key, next_range, etag))
+                yield chunk
+
+    def open_ranged(self, bucket, key, size=None):
+        """
+        Return a seekable file object that reads the object via range GETs.
+        Only the byte ranges actually read are transferred.
+        """
+        return RangedObjectReader(self, bucket, key, size=size)
+
+    def open_stream(self, bucket, key, part_size=None, max_workers=None):
+        """
+        Return a forward-only, buffered file object over the object.
+        Parts are downloaded lazily (with parallel prefetch) as it is read.
+        """
+        chunks = self.iter_chunks(bucket, key, part_size=part_size, max_workers=max_workers)
+        return io.BufferedReader(ChunkStream(chunks))
+
+    def _read_range(self, bucket, key, byte_range, etag=None, info=None):
+        """
+        GET one (start, end) byte range. With etag, the GET is conditional
+        (IfMatch); the response ETag is recorded into info if given.
+        """
+        start, end = byte_range
+        started = time.perf_counter()
+        response = self._get_range(bucket, key, f"bytes={start}-{end}", etag)
+        data = response["Body"].read()
+        self._record_transfer("get_range", time.perf_counter() - started, downloaded=len(data))
+        if info is not None:
+            info["ETag"] = response.get("ETag")
+        return data
+
+    def _get_range(self, bucket, key, byte_range, etag=None):
+        args = {"Bucket": bucket, "Key": key}
+        if byte_range is not None:
+            args["Range"] = byte_range
+        if etag is not None:
+            args["IfMatch"] = etag
+        try:
+            return self.s3.get_object(**args)
+        except ClientError as e:
+            if self._is_precondition_failed(e):
+                self.logger.error("%s in bucket %s changed during the download (ETag %s)", key, bucket, etag)
+            else:
+                self.logger.error("Failed to download %s from bucket %s: %s", key, bucket, e, exc_info=True)
             raise
 
-    def download_bytes(self, bucket, key):
-        """ Download the object and return its raw bytes."""
+    @staticmethod
+    def _is_precondition_failed(error):
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status == 412 or error.response["Error"]["Code"] in ("412", "PreconditionFailed")
+
+    @staticmethod
+    def _object_size(response, fallback):
+        """Total object size from a ranged GET's Content-Range ("bytes 0-99/1234")."""
+        content_range = response.get("ContentRange")
+        if content_range and "/" in content_range:
+            return int(content_range.rsplit("/", 1)[1])
+        return fallback
+
+    def delete(self, bucket, key):
+        """ Delete the object (a no-op if it does not exist)."""
         try:
-            obj = self.s3.get_object(Bucket=bucket, Key=key)
-            return obj["Body"].read()
+            self.s3.delete_object(Bucket=bucket, Key=key)
         except ClientError as e:
-            self.logger.error(f"Failed to download {key} from bucket {bucket}: {e}", exc_info=True)
+            self.logger.error("Failed to delete %s from bucket %s: %s", key, bucket, e, exc_info=True)
             raise
 
     def exists(self, bucket, key):
@@ -50,5 +488,31 @@ class BaseS3Client:
         except ClientError as e:
             if e.response['Error']['Code'] == '404':
                 return False
-            self.logger.error(f"Error checking existence of {key} in {bucket}: {e}", exc_info=True)
+            self.logger.error("Error checking existence of %s in %s: %s", key, bucket, e, exc_info=True)
             raise
+
+    def list_objects(self, bucket, prefix="", page_size=1000):
+        """
+        Lazily list the objects under a prefix, following continuation tokens.
+
+        Args:
+            bucket (str): Bucket name.
+            prefix (str): Only list keys starting with this prefix.
+            page_size (int): Keys requested per ListObjectsV2 call (max 1000).
+
+        Yields:
+            dict: {"Key", "Size", "ETag", ...} for every object, in key order.
+        """
+        request = {"Bucket": bucket, "Prefix": prefix, "MaxKeys": page_size}
+        while True:
+            try:
+                response = self.s3.list_objects_v2(**request)
+            except ClientError as e:
+                self.logger.error("Failed to list %s in bucket %s: %s", prefix, bucket, e, exc_info=True)
+                raise
+
+            yield from response.get("Contents", [])
+
+            if not response.get("IsTruncated"):
+                return
+            request["ContinuationToken"] = response["NextContinuationToken"]
@@ -0,0 +1,206 @@
+import hashlib
+import threading
+import uuid
+
+from botocore.exceptions import ClientError
+from src.storage.clients.base_s3_client import BaseS3Client
+
+
+def _client_error(code, operation, message="", status=None):
+    """Build a botocore ClientError shaped like a real S3 error response."""
+    status = status or (int(code) if code.isdigit() else 400)
+    return ClientError(
+        {"Error": {"Code": code, "Message": message}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        operation,
+    )
+
+
+class _StreamingBody:
+    """Minimal stand-in for botocore's StreamingBody."""
+
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def read(self, amt=None):
+        if amt is None:
+            chunk = self._data[self._pos:]
+        else:
+            chunk = self._data[self._pos:self._pos + amt]
+        self._pos += len(chunk)
+        return chunk
+
+    def close(self):
+        pass
+
+
+class InMemoryS3:
+    """
+    A tiny, thread-safe, in-process imitation of the subset of the boto3 S3
+    client API used by BaseS3Client. Objects live in a dict.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = {}
+        self.uploads = {}
+
+    def _bucket(self, bucket, operation):
+        if bucket not in self.buckets:
+            raise _client_error("NoSuchBucket", operation, f"Bucket {bucket} does not exist")
+        return self.buckets[bucket]
+
+    def _object(self, bucket, key, operation):
+        objects = self._bucket(bucket, operation)
+        if key not in objects:
+            raise _client_error("404" if operation == "HeadObject" else "NoSuchKey", operation)
+        return objects[key]
+
+    # --- buckets ---
+    def create_bucket(self, Bucket, **kwargs):
+        with self._lock:
+            self.buckets.setdefault(Bucket, {})
+        return {}
+
+    def head_bucket(self, Bucket):
+        with self._lock:
+            self._bucket(Bucket, "HeadBucket")
+        return {}
+
+    def list_buckets(self):
+        with self._lock:
+            return {"Buckets": [{"Name": name} for name in sorted(self.buckets)]}
+
+    # --- objects ---
+    def put_object(self, Bucket, Key, Body, ContentType="binary/octet-stream", **kwargs):
+        data = Body.read() if hasattr(Body, "read") else bytes(Body)
+        etag = '"%s"' % hashlib.md5(data).hexdigest()
+        with self._lock:
+            self._bucket(Bucket, "PutObject")[Key] = {
+                "Body": bytes(data),
+                "ContentType": ContentType,
+                "ETag": etag,
+                **kwargs,
+            }
+        return {"ETag": etag}
+
+    def get_object(self, Bucket, Key, Range=None, IfNoneMatch=None, IfMatch=None, **kwargs):
+        with self._lock:
+            obj = self._object(Bucket, Key, "GetObject")
+        if IfNoneMatch is not None and IfNoneMatch == obj["ETag"]:
+            raise _client_error("304", "GetObject", "Not Modified")
+        if IfMatch is not None and IfMatch != obj["ETag"]:
+            raise _client_error("PreconditionFailed", "GetObject", "ETag does not match IfMatch", status=412)
+        data = obj["Body"]
+        response = {"ContentType": obj["ContentType"], "ETag": obj["ETag"]}
+        if Range:
+            if not data:
+                raise _client_error("InvalidRange", "GetObject")
+            start, _, end = Range.replace("bytes=", "").partition("-")
+            start, end = int(start), min(int(end) if end else len(data) - 1, len(data) - 1)
+            response["ContentRange"] = f"bytes {start}-{end}/{len(data)}"
+            data = data[start:end + 1]
+        response["Body"] = _StreamingBody(data)
+        response["ContentLength"] = len(data)
+        return response
+
+    def head_object(self, Bucket, Key, **kwargs):
+        with self._lock:
+            obj = self._object(Bucket, Key, "HeadObject")
+        return {
+            "ContentLength": len(obj["Body"]),
+            "ContentType": obj["ContentType"],
+            "ETag": obj["ETag"],
+        }
+
+    def list_objects_v2(self, Bucket, Prefix="", MaxKeys=1000, ContinuationToken=None, **kwargs):
+        with self._lock:
+            keys = sorted(key for key in self._bucket(Bucket, "ListObjectsV2") if key.startswith(Prefix))
+            objects = self.buckets[Bucket]
+            if ContinuationToken:
+                keys = [key for key in keys if key > ContinuationToken]
+            page, rest = keys[:MaxKeys], keys[MaxKeys:]
+            response = {
+                "KeyCount": len(page),
+                "IsTruncated": bool(rest),
+                "Contents": [
+                    {"Key": key, "Size": len(objects[key]["Body"]), "ETag": objects[key]["ETag"]}
+                    for key in page
+                ],
+            }
+        if rest:
+            response["NextContinuationToken"] = page[-1]
+        if not page:
+            del response["Contents"]
+        return response
+
+    def delete_object(self, Bucket, Key, **kwargs):
+        with self._lock:
+            self._bucket(Bucket, "DeleteObject").pop(Key, None)
+        return {}
+
+    # --- multipart ---
+    def create_multipart_upload(self, Bucket, Key, ContentType="binary/octet-stream", **kwargs):
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._bucket(Bucket, "CreateMultipartUpload")
+            self.uploads[upload_id] = {
+                "Bucket": Bucket,
+                "Key": Key,
+                "ContentType": ContentType,
+                "Parts": {},
+                "Extra": kwargs,
+            }
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        data = Body.read() if hasattr(Body, "read") else bytes(Body)
+        etag = '"%s"' % hashlib.md5(data).hexdigest()
+        with self._lock:
+            if UploadId not in self.uploads:
+                raise _client_error("NoSuchUpload", "UploadPart")
+            self.uploads[UploadId]["Parts"][PartNumber] = bytes(data)
+        return {"ETag": etag}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        with self._lock:
+            upload = self.uploads.pop(UploadId, None)
+        if upload is None:
+            raise _client_error("NoSuchUpload", "CompleteMultipartUpload")
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        data = b"".join(upload["Parts"][n] for n in numbers)
+        self.put_object(Bucket=Bucket, Key=Key, Body=data, ContentType=upload["ContentType"], **upload["Extra"])
+        return {"ETag": self.head_object(Bucket=Bucket, Key=Key)["ETag"]}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        with self._lock:
+            self.uploads.pop(UploadId, None)
+        return {}
+
+
+class InMemoryS3Client(BaseS3Client):
+    """
+    A BaseS3Client backed by an in-process InMemoryS3 store.
+
+    Useful for tests, benchmarks, and local experiments where no MinIO or
+    AWS endpoint is available. As with MinIO, buckets must be created
+    explicitly (see ensure_bucket).
+    """
+
+    def __init__(self, logger, backend=None, cache=None, metrics=None):
+        """
+        Args:
+            logger: Logger instance.
+            backend (InMemoryS3, optional): Share a store between clients.
+            cache (DiskCache, optional): Read-through cache for download_bytes.
+            metrics (Metrics, optional): Instrumentation registry.
+        """
+        self.logger = logger
+        self.s3 = backend or InMemoryS3()
+        self.cache = cache
+        self.metrics = metrics
+
+    def ensure_bucket(self, bucket):
+        """Create the bucket if it does not already exist."""
+        self.s3.create_bucket(Bucket=bucket)
+        return True
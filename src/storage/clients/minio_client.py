@@ -1,5 +1,10 @@
 from botocore.exceptions import ClientError
-from src.storage.clients.base_s3_client import BaseS3Client
+from src.storage.clients.base_s3_client import (
+    BaseS3Client,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MULTIPART_THRESHOLD,
+    DEFAULT_PART_SIZE,
+)
 
 
 class MinioClient(BaseS3Client):
@@ -15,6 +20,11 @@ class MinioClient(BaseS3Client):
         access_key=None,
         secret_key=None,
         region_name="us-east-1",
+        part_size=DEFAULT_PART_SIZE,
+        max_workers=DEFAULT_MAX_WORKERS,
+        multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+        cache=None,
+        metrics=None,
     ):
         """
         Create a MinIO client with MinIO-friendly defaults.
@@ -25,6 +35,11 @@ class MinioClient(BaseS3Client):
             access_key=access_key,
             secret_key=secret_key,
             region_name=region_name,
+            part_size=part_size,
+            max_workers=max_workers,
+            multipart_threshold=multipart_threshold,
+            cache=cache,
+            metrics=metrics,
         )
 
     def ensure_bucket(self, bucket):
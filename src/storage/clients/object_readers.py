@@ -0,0 +1,131 @@
+import io
+
+
+class RangedObjectReader(io.RawIOBase):
+    """
+    Seekable, read-only file object over an S3 object.
+
+    Each read is served by a byte-range GET, so libraries that seek around a
+    file (e.g. pyarrow reading a Parquet footer and then selected column
+    chunks) only transfer the bytes they actually touch. Small reads are
+    rounded up to block_size and the last block is cached, which keeps
+    footer parsing to a couple of requests.
+
+    Every GET is pinned to one object version with IfMatch (the ETag from
+    head_object, or from the first GET), so an overwrite between reads
+    raises a 412 ClientError instead of mixing bytes of two versions.
+    """
+
+    def __init__(self, storage_client, bucket, key, size=None, block_size=64 * 1024, etag=None):
+        """
+        Args:
+            storage_client: BaseS3Client instance.
+            bucket (str): Bucket name.
+            key (str): Object path.
+            size (int, optional): Object size; looked up with head_object if omitted.
+            block_size (int): Minimum bytes fetched per request.
+            etag (str, optional): Version to read; taken from head_object or
+                the first GET if omitted.
+        """
+        super().__init__()
+        self.storage = storage_client
+        self.bucket = bucket
+        self.key = key
+        if size is None:
+            head = storage_client.s3.head_object(Bucket=bucket, Key=key)
+            size = head["ContentLength"]
+            etag = etag or head.get("ETag")
+        self.size = size
+        self.etag = etag
+        self.block_size = block_size
+        self.position = 0
+
+        # tracking fields
+        self.requests = 0
+        self.bytes_fetched = 0
+
+        self._cache_start = 0
+        self._cache = b""
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        elif whence == io.SEEK_END:
+            self.position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self.position = max(0, min(self.position, self.size))
+        return self.position
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self.position
+        end = min(self.position + size, self.size)
+        if end <= self.position:
+            return b""
+
+        cache_end = self._cache_start + len(self._cache)
+        if not (self._cache_start <= self.position and end <= cache_end):
+            fetch_end = min(max(end, self.position + self.block_size), self.size)
+            self._cache = self._fetch(self.position, fetch_end)
+            self._cache_start = self.position
+
+        offset = self.position - self._cache_start
+        data = self._cache[offset:offset + (end - self.position)]
+        self.position = end
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def readall(self):
+        return self.read(-1)
+
+    def _fetch(self, start, end):
+        info = {}
+        data = self.storage._read_range(self.bucket, self.key, (start, end - 1), self.etag, info)
+        self.etag = self.etag or info.get("ETag")
+        self.requests += 1
+        self.bytes_fetched += len(data)
+        return data
+
+
+class ChunkStream(io.RawIOBase):
+    """
+    Forward-only file object over an iterator of byte chunks.
+
+    Wrap BaseS3Client.iter_chunks() with this to hand a lazily downloaded
+    object to parsers such as pandas.read_csv(chunksize=...).
+    """
+
+    def __init__(self, chunks):
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not len(self._pending):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
@@ -1,5 +1,9 @@
-import boto3
-from src.storage.clients.base_s3_client import BaseS3Client
+from src.storage.clients.base_s3_client import (
+    BaseS3Client,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MULTIPART_THRESHOLD,
+    DEFAULT_PART_SIZE,
+)
 
 
 class S3Client(BaseS3Client):
@@ -13,6 +17,11 @@ class S3Client(BaseS3Client):
         secret_key=None,
         region_name="us-east-1",
         session_profile=None,
+        part_size=DEFAULT_PART_SIZE,
+        max_workers=DEFAULT_MAX_WORKERS,
+        multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+        cache=None,
+        metrics=None,
     ):
         """
         Create an AWS S3 client.
@@ -29,24 +38,34 @@ class S3Client(BaseS3Client):
             AWS region.
         session_profile : str, optional
             AWS CLI profile name.
+        part_size : int
+            Multipart / ranged-download part size in bytes.
+        max_workers : int
+            Threads used for parallel part transfers.
+        multipart_threshold : int
+            Uploads larger than this use multipart.
+        cache : DiskCache, optional
+            Read-through cache for download_bytes.
+        metrics : Metrics, optional
+            Instrumentation registry (defaults to the process-wide one).
         """
+        self.configure_transfers(part_size, max_workers, multipart_threshold)
+        self.logger = logger
+        self.cache = cache
+        self.metrics = metrics
+        self.session_profile = session_profile
+        self._client_kwargs = {"region_name": region_name}
+        if access_key and secret_key and not session_profile:
+            self._client_kwargs.update(aws_access_key_id=access_key, aws_secret_access_key=secret_key)
 
-        if session_profile:
-            session = boto3.Session(profile_name=session_profile)
-            s3_client = session.client("s3", region_name=region_name)
-        elif access_key and secret_key:
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region_name,
-            )
-        else:
-            # Default credentials (IAM role, env vars, ~/.aws/)
-            s3_client = boto3.client("s3", region_name=region_name)
+    def _create_client(self):
+        import boto3
 
-        self.logger = logger
-        self.s3 = s3_client
+        if self.session_profile:
+            session = boto3.Session(profile_name=self.session_profile)
+            return session.client("s3", config=self.boto_config(), **self._client_kwargs)
+        # Explicit keys, or default credentials (IAM role, env vars, ~/.aws/)
+        return boto3.client("s3", config=self.boto_config(), **self._client_kwargs)
 
     # OPTIONAL AWS extras
     def list_buckets(self):
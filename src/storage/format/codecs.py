@@ -0,0 +1,755 @@
+import abc
+import gzip
+import io
+import zlib
+
+from src.storage.format.filters import filter_columns, filter_frame, stats_may_match
+
+GZIP_MAGIC = b"\x1f\x8b"
+# Rows a streaming Parquet/Arrow writer holds back while a column is still all-null
+SCHEMA_BUFFER_ROWS = 100_000
+
+
+class Codec(abc.ABC):
+    """
+    Converts DataFrames to/from one serialized format.
+
+    Subclasses implement encode/decode; streaming writes (iter_encode) and
+    pruned/chunked reads (read) fall back to whole-object behaviour unless a
+    codec can do better. Default options are set per instance and can be
+    overridden per call, e.g. ParquetCodec(compression="zstd").
+    """
+
+    name = None
+    content_type = "application/octet-stream"
+    # Read path hints for StorageDataService
+    seekable_reads = False      # benefits from a ranged, seekable reader
+    streamable_reads = False    # can parse a forward-only stream in chunks
+    # encode/iter_encode also accept pyarrow Tables and RecordBatches
+    arrow_native = False
+    # Process-pool hints for SlicePool (storage.format.parallel)
+    parallel_encode = False     # implements encode_slice/join_slices
+    parallel_decode = False     # implements split/decode_slice (line-oriented)
+
+    def __init__(self, name=None, **options):
+        if name:
+            self.name = name
+        self.options = options
+
+    def _options(self, overrides):
+        return {**self.options, **overrides}
+
+    def content_encoding(self, **options):
+        """HTTP Content-Encoding of the encoded bytes (None if not compressed)."""
+        return None
+
+    @abc.abstractmethod
+    def encode(self, df, **options):
+        """Serialize a DataFrame to bytes."""
+
+    @abc.abstractmethod
+    def decode(self, data, **options):
+        """Parse bytes into a DataFrame."""
+
+    def iter_encode(self, frames, **options):
+        """Yield byte chunks that, concatenated, form one valid object."""
+        import pandas as pd
+
+        frames = list(frames)
+        yield self.encode(pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(), **options)
+
+    def encode_slice(self, df, first, **options):
+        """Encode one row slice (first: it is the first slice) for join_slices()."""
+        raise NotImplementedError
+
+    def join_slices(self, parts, **options):
+        """Combine encode_slice() results, in row order, into one valid object."""
+        return b"".join(parts)
+
+    def split(self, data, parts):
+        """
+        Prepare encoded bytes for a parallel decode.
+
+        Returns:
+            tuple: (data, header, ranges) where data is the (decompressed)
+            buffer to share, header the bytes every slice is parsed with and
+            ranges at most `parts` (start, stop) offsets of whole records.
+        """
+        raise NotImplementedError
+
+    def decode_slice(self, header, chunk, dtype=None, **options):
+        """Parse header + one range of split() into a DataFrame (dtype: see slice_dtypes)."""
+        raise NotImplementedError
+
+    def slice_dtypes(self, frames):
+        """
+        dtype= overrides to re-parse every slice with when decode_slice()
+        results type a column differently than a whole-object decode would,
+        or {} when concatenating them as they are is equivalent.
+        """
+        return {}
+
+    def read(self, source, columns=None, filters=None, chunksize=None, **options):
+        """
+        Read a file object, keeping only the requested columns and matching rows.
+
+        Returns:
+            pd.DataFrame, or an iterator of DataFrames when chunksize is set.
+        """
+        df = finish_frame(self.decode(source.read(), **options), columns, filters).reset_index(drop=True)
+        if chunksize is None:
+            return df
+        return (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+
+
+def needed_columns(columns, filters):
+    """Requested columns plus any referenced only by filters (order kept)."""
+    if columns is None:
+        return None
+    return list(dict.fromkeys(list(columns) + filter_columns(filters)))
+
+
+def finish_frame(df, columns, filters):
+    """Apply row filters, then project to the requested columns."""
+    df = filter_frame(df, filters)
+    return df[list(columns)] if columns is not None else df
+
+
+def as_arrow_table(frame):
+    """A pyarrow Table for a DataFrame, Table or RecordBatch (no copy for Arrow input)."""
+    import pyarrow as pa
+
+    if isinstance(frame, pa.Table):
+        return frame
+    if isinstance(frame, pa.RecordBatch):
+        return pa.Table.from_batches([frame])
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def settled_tables(frames, buffer_rows=None, sample_frames=1):
+    """
+    Arrow tables for frames, all cast to one schema, for writers whose
+    schema is fixed when they open.
+
+    At least sample_frames tables are held back, and more (up to buffer_rows
+    rows) while a column is still all-null and so has no type yet. The
+    schema is unified across them with permissive promotion (null -> the
+    type seen later, int -> float). Columns missing from a frame become nulls.
+
+    Raises:
+        ValueError: A frame after the schema was fixed has a column the
+            held-back frames did not (hold back more with sample_frames).
+    """
+    import pyarrow as pa
+
+    buffer_rows = SCHEMA_BUFFER_ROWS if buffer_rows is None else buffer_rows
+    pending = []
+    rows = 0
+    schema = None
+    for frame in frames:
+        table = as_arrow_table(frame)
+        if schema is not None:
+            yield conform_table(table, schema)
+            continue
+        pending.append(table)
+        rows += table.num_rows
+        unified = pa.unify_schemas([held.schema for held in pending], promote_options="permissive")
+        if rows < buffer_rows and (
+            len(pending) < sample_frames or any(pa.types.is_null(field.type) for field in unified)
+        ):
+            continue
+        schema = unified
+        for held in pending:
+            yield conform_table(held, schema)
+        pending = []
+
+    if pending:
+        schema = pa.unify_schemas([held.schema for held in pending], promote_options="permissive")
+        for held in pending:
+            yield conform_table(held, schema)
+
+
+def conform_table(table, schema):
+    """
+    Cast table to schema, adding missing columns as nulls.
+
+    Raises:
+        ValueError: table has columns schema does not.
+    """
+    import pyarrow as pa
+
+    if table.schema == schema:
+        return table
+    _check_settled_columns(table.column_names, schema.names)
+    columns = [
+        table.column(field.name).cast(field.type) if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def settled_columns(frames, sample_frames=1):
+    """
+    DataFrames for frames, all reindexed to one column list, for writers
+    whose header is fixed when they open (CSV).
+
+    The first sample_frames frames are held back and their columns combined
+    in order of first appearance. Columns missing from a frame become nulls.
+
+    Raises:
+        ValueError: A frame after the columns were fixed has a column the
+            held-back frames did not (hold back more with sample_frames).
+    """
+    pending = []
+    columns = None
+    for frame in frames:
+        df = as_frame(frame)
+        if columns is None:
+            pending.append(df)
+            if len(pending) < sample_frames:
+                continue
+            columns = _union_columns(pending)
+            for held in pending:
+                yield _reindexed(held, columns)
+            pending = []
+            continue
+        yield _reindexed(df, columns)
+
+    if pending:
+        columns = _union_columns(pending)
+        for held in pending:
+            yield _reindexed(held, columns)
+
+
+def _union_columns(frames):
+    columns = {}
+    for df in frames:
+        columns.update(dict.fromkeys(df.columns))
+    return list(columns)
+
+
+def _reindexed(df, columns):
+    if list(df.columns) == columns:
+        return df
+    _check_settled_columns(df.columns, columns)
+    return df.reindex(columns=columns)
+
+
+def _check_settled_columns(names, settled):
+    extra = [name for name in names if name not in settled]
+    if extra:
+        raise ValueError(
+            f"Columns {extra} first appear after the first frames fixed the stream's columns {list(settled)}"
+        )
+
+
+def as_frame(frame):
+    """A DataFrame for a DataFrame, pyarrow Table or RecordBatch."""
+    import pandas as pd
+
+    return frame if isinstance(frame, pd.DataFrame) else frame.to_pandas()
+
+
+def line_ranges(data, start, parts, quote=None):
+    """
+    Split data[start:] into at most `parts` (start, stop) ranges of whole lines.
+
+    With quote set (e.g. b'"' for CSV), newlines inside quoted fields do not
+    end a record: quote characters are counted from the start of each range,
+    and escaped quotes ("") come in pairs, so the parity tells if a newline
+    is inside a field.
+    """
+    end = len(data)
+    step = max(1, -(-(end - start) // parts))
+    ranges = []
+    position = start
+    while position < end:
+        stop = record_end(data, position, min(position + step, end) - 1, quote)
+        ranges.append((position, stop))
+        position = stop
+    return ranges
+
+
+def record_end(data, position, target, quote=None):
+    """Offset just past the first newline at or after target that ends a record started at position."""
+    inside = False
+    cursor = position
+    newline = data.find(b"\n", target)
+    while newline != -1:
+        if quote is None:
+            return newline + 1
+        inside ^= data.count(quote, cursor, newline) % 2 == 1
+        cursor = newline
+        if not inside:
+            return newline + 1
+        newline = data.find(b"\n", newline + 1)
+    return len(data)
+
+
+def _is_gzip(source):
+    """Peek at a file object (or bytes) for the gzip magic number."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source[:2]) == GZIP_MAGIC
+    if hasattr(source, "peek"):
+        return source.peek(2)[:2] == GZIP_MAGIC
+    if source.seekable():
+        position = source.tell()
+        head = source.read(2)
+        source.seek(position)
+        return head == GZIP_MAGIC
+    return False
+
+
+# ---------------------------------------------------------
+# Text codecs (optionally gzip-compressed)
+# ---------------------------------------------------------
+class _TextCodec(Codec):
+    """Text formats that can be gzip-compressed as a whole (Content-Encoding: gzip)."""
+
+    def __init__(self, name=None, compression=None, **options):
+        if compression not in (None, "none", "gzip"):
+            raise ValueError(f"Unsupported compression for {name or self.name}: {compression}")
+        super().__init__(name=name, compression=compression, **options)
+
+    def content_encoding(self, **options):
+        return "gzip" if self._options(options).get("compression") == "gzip" else None
+
+    def _compress(self, data, options):
+        if self._options(options).get("compression") == "gzip":
+            return gzip.compress(data)
+        return data
+
+    def _compress_stream(self, chunks, options):
+        if self._options(options).get("compression") != "gzip":
+            yield from chunks
+            return
+        compressor = zlib.compressobj(wbits=31)  # wbits=31 -> gzip container
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    @staticmethod
+    def _decompressed(data):
+        return gzip.decompress(data) if _is_gzip(data) else data
+
+    @staticmethod
+    def _text_source(source):
+        return gzip.GzipFile(fileobj=source) if _is_gzip(source) else source
+
+
+class CsvCodec(_TextCodec):
+    name = "csv"
+    content_type = "text/csv"
+    streamable_reads = True
+    parallel_encode = True
+    parallel_decode = True
+
+    def encode(self, df, **options):
+        # Writing to a binary buffer skips the intermediate str copy
+        buffer = io.BytesIO()
+        df.to_csv(buffer, index=False, encoding="utf-8")
+        return self._compress(buffer.getvalue(), options)
+
+    def decode(self, data, **options):
+        import pandas as pd
+
+        return pd.read_csv(io.BytesIO(self._decompressed(data)))
+
+    def iter_encode(self, frames, **options):
+        """Yield CSV bytes per frame; the header is written once."""
+        return self._compress_stream(self._iter_csv(frames), options)
+
+    @staticmethod
+    def _iter_csv(frames):
+        # The header is fixed by the first frame unless frames were settled
+        # over a larger sample first (see settled_columns)
+        for index, df in enumerate(settled_columns(frames)):
+            buffer = io.BytesIO()
+            df.to_csv(buffer, index=False, header=index == 0, encoding="utf-8")
+            yield buffer.getvalue()
+
+    def encode_slice(self, df, first, **options):
+        """CSV rows of one slice, with the header only on the first one."""
+        buffer = io.BytesIO()
+        df.to_csv(buffer, index=False, header=first, encoding="utf-8")
+        # Concatenated gzip members form one valid gzip stream
+        return self._compress(buffer.getvalue(), options)
+
+    def split(self, data, parts):
+        data = self._decompressed(data)
+        body = record_end(data, 0, 0, quote=b'"')
+        return data, data[:body], line_ranges(data, body, parts, quote=b'"')
+
+    def decode_slice(self, header, chunk, dtype=None, **options):
+        import pandas as pd
+
+        return pd.read_csv(io.BytesIO(header + chunk), dtype=dtype)
+
+    def slice_dtypes(self, frames):
+        """
+        Columns that slices parsed as different types, to be re-parsed as str
+        (e.g. zip codes: int64 in slices of "01234" values, str in the slice
+        holding "A1234"). Numeric-only disagreements (int64 in one slice,
+        float64 in one with nulls) are left to pd.concat, which promotes them
+        as a whole-object read would.
+        """
+        import pandas as pd
+
+        dtypes = {}
+        for col in frames[0].columns:
+            column_dtypes = [frame[col].dtype for frame in frames]
+            if len(set(map(str, column_dtypes))) > 1 and not all(
+                pd.api.types.is_numeric_dtype(dtype) for dtype in column_dtypes
+            ):
+                dtypes[col] = str
+        return dtypes
+
+    def read(self, source, columns=None, filters=None, chunksize=None, **options):
+        """CSV is row-oriented: every byte is read, but only needed columns are parsed."""
+        import pandas as pd
+
+        usecols = needed_columns(columns, filters)
+        reader = pd.read_csv(self._text_source(source), usecols=usecols, chunksize=chunksize)
+        if chunksize is None:
+            return finish_frame(reader, columns, filters).reset_index(drop=True)
+        return (finish_frame(chunk, columns, filters) for chunk in reader)
+
+
+class JsonCodec(_TextCodec):
+    """A single JSON array of records."""
+
+    name = "json"
+    content_type = "application/json"
+    parallel_encode = True
+
+    def encode(self, df, **options):
+        return self._compress(df.to_json(orient="records").encode("utf-8"), options)
+
+    def decode(self, data, **options):
+        import pandas as pd
+
+        # read_json (not a plain loads) keeps its dtype and date conversion:
+        # epoch-ms columns such as created_at come back as datetime64
+        return pd.read_json(io.BytesIO(self._decompressed(data)))
+
+    def iter_encode(self, frames, **options):
+        """Yield a single JSON records array, one frame at a time."""
+        return self._compress_stream(self._iter_json(frames), options)
+
+    @staticmethod
+    def _iter_json(frames):
+        yield b"["
+        first = True
+        for df in frames:
+            if df.empty:
+                continue
+            records = df.to_json(orient="records")[1:-1]
+            yield (records if first else "," + records).encode("utf-8")
+            first = False
+        yield b"]"
+
+    def encode_slice(self, df, first, **options):
+        """The records of one slice, without the enclosing brackets."""
+        return df.to_json(orient="records")[1:-1].encode("utf-8")
+
+    def join_slices(self, parts, **options):
+        return self._compress(b"[" + b",".join(part for part in parts if part) + b"]", options)
+
+
+class NdjsonCodec(_TextCodec):
+    """
+    Newline-delimited JSON: one record per line, streamable in both directions.
+
+    Chunked reads parse chunksize lines at a time with pd.read_json (so
+    dates convert as in a whole-object read); writes emit at most
+    lines_per_chunk records per chunk, so neither side materializes the
+    whole document.
+    """
+
+    name = "ndjson"
+    content_type = "application/x-ndjson"
+    streamable_reads = True
+    parallel_encode = True
+    parallel_decode = True
+    lines_per_chunk = 10_000
+
+    def encode(self, df, **options):
+        if df.empty:
+            return self._compress(b"", options)
+        return self._compress(df.to_json(orient="records", lines=True).encode("utf-8"), options)
+
+    def decode(self, data, **options):
+        import pandas as pd
+
+        data = self._decompressed(data)
+        if not data.strip():
+            return pd.DataFrame()
+        return pd.read_json(io.BytesIO(data), lines=True)
+
+    def iter_encode(self, frames, **options):
+        chunks = (
+            self.encode(df.iloc[start:start + self.lines_per_chunk], compression=None)
+            for df in frames
+            for start in range(0, len(df), self.lines_per_chunk)
+        )
+        return self._compress_stream(self._with_trailing_newlines(chunks), options)
+
+    @staticmethod
+    def _with_trailing_newlines(chunks):
+        for chunk in chunks:
+            yield chunk if chunk.endswith(b"\n") else chunk + b"\n"
+
+    def encode_slice(self, df, first, **options):
+        data = self.encode(df, compression=None)
+        if data and not data.endswith(b"\n"):
+            data += b"\n"
+        return self._compress(data, options)
+
+    def split(self, data, parts):
+        # JSON strings cannot contain raw newlines, so every newline ends a record
+        data = self._decompressed(data)
+        return data, b"", line_ranges(data, 0, parts)
+
+    def decode_slice(self, header, chunk, dtype=None, **options):
+        # JSON values carry their types, so slices never need dtype overrides
+        return self.decode(chunk)
+
+    def read(self, source, columns=None, filters=None, chunksize=None, **options):
+        if chunksize is None:
+            return super().read(source, columns, filters, **options)
+        frames = self._iter_line_frames(self._text_source(source), chunksize, needed_columns(columns, filters))
+        return (finish_frame(chunk, columns, filters) for chunk in frames)
+
+    @staticmethod
+    def _iter_line_frames(lines, chunksize, columns=None):
+        """Parse a binary stream into DataFrames of chunksize records (only columns, if given)."""
+        import pandas as pd
+
+        def parse(records):
+            frame = pd.read_json(io.BytesIO(b"\n".join(records)), lines=True)
+            return frame if columns is None else frame.reindex(columns=columns)
+
+        records = []
+        for line in lines:
+            if line.strip():
+                records.append(line.rstrip(b"\r\n"))
+            if len(records) >= chunksize:
+                yield parse(records)
+                records = []
+        if records:
+            yield parse(records)
+
+
+# ---------------------------------------------------------
+# Columnar codecs (Arrow-based, compression inside the file)
+# ---------------------------------------------------------
+class ParquetCodec(Codec):
+    """
+    Parquet with selectable compression ("snappy", "zstd", "gzip", "none")
+    and dictionary encoding (True, False, or a list of column names).
+    """
+
+    name = "parquet"
+    content_type = "application/vnd.apache.parquet"
+    seekable_reads = True
+    arrow_native = True
+
+    def __init__(self, name=None, compression="snappy", use_dictionary=True, **options):
+        super().__init__(name=name, compression=compression, use_dictionary=use_dictionary, **options)
+
+    def _writer_options(self, options):
+        options = self._options(options)
+        compression = options.pop("compression")
+        options["compression"] = None if compression == "none" else compression
+        return options
+
+    def encode(self, df, **options):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        buffer = pa.BufferOutputStream()
+        pq.write_table(as_arrow_table(df), buffer, **self._writer_options(options))
+        return buffer.getvalue().to_pybytes()
+
+    def decode(self, data, **options):
+        import pandas as pd
+
+        return pd.read_parquet(io.BytesIO(data))
+
+    def iter_encode(self, frames, **options):
+        """
+        Yield Parquet bytes, writing each frame as its own row group. The
+        schema is settled across frames first (see settled_tables).
+        """
+        import pyarrow.parquet as pq
+
+        sink = DrainableSink()
+        writer = None
+        try:
+            for table in settled_tables(frames):
+                if writer is None:
+                    writer = pq.ParquetWriter(sink, table.schema, **self._writer_options(options))
+                writer.write_table(table)
+                yield sink.drain()
+        finally:
+            if writer is not None:
+                writer.close()
+        yield sink.drain()
+
+    def read(self, source, columns=None, filters=None, chunksize=None, **options):
+        """
+        Read only the row groups whose min/max statistics can match the
+        filters, and only the needed column chunks. With a ranged reader as
+        source, skipped row groups and columns are never downloaded.
+        """
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source)
+        needed = needed_columns(columns, filters)
+        row_groups = [
+            i for i in range(parquet_file.metadata.num_row_groups)
+            if stats_may_match(self.row_group_stats(parquet_file.metadata.row_group(i)), filters)
+        ]
+
+        if chunksize is None:
+            table = parquet_file.read_row_groups(row_groups, columns=needed)
+            return finish_frame(table.to_pandas(), columns, filters).reset_index(drop=True)
+
+        batches = parquet_file.iter_batches(batch_size=chunksize, row_groups=row_groups, columns=needed)
+        return (finish_frame(batch.to_pandas(), columns, filters) for batch in batches)
+
+    @staticmethod
+    def row_group_stats(row_group):
+        """{column: (min, max)} for the columns that carry statistics."""
+        stats = {}
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            if column.statistics is not None and column.statistics.has_min_max:
+                stats[column.path_in_schema] = (column.statistics.min, column.statistics.max)
+        return stats
+
+
+class ArrowIpcCodec(Codec):
+    """
+    Arrow IPC file format (Feather v2) with "lz4", "zstd", or "uncompressed"
+    buffers. Decoding is close to a memcpy, which makes it a good format for
+    intermediate data.
+    """
+
+    name = "feather"
+    content_type = "application/vnd.apache.arrow.file"
+    seekable_reads = True
+    arrow_native = True
+
+    def __init__(self, name=None, compression="lz4", **options):
+        super().__init__(name=name, compression=compression, **options)
+
+    def _ipc_options(self, options):
+        import pyarrow.ipc as ipc
+
+        compression = self._options(options).get("compression")
+        if compression in (None, "none", "uncompressed"):
+            compression = None
+        return ipc.IpcWriteOptions(compression=compression)
+
+    def encode(self, df, **options):
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+
+        table = as_arrow_table(df)
+        buffer = pa.BufferOutputStream()
+        with ipc.new_file(buffer, table.schema, options=self._ipc_options(options)) as writer:
+            writer.write_table(table)
+        return buffer.getvalue().to_pybytes()
+
+    def decode(self, data, **options):
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+
+        return ipc.open_file(pa.py_buffer(data)).read_all().to_pandas()
+
+    def iter_encode(self, frames, **options):
+        import pyarrow.ipc as ipc
+
+        sink = DrainableSink()
+        writer = None
+        try:
+            for table in settled_tables(frames):
+                if writer is None:
+                    writer = ipc.new_file(sink, table.schema, options=self._ipc_options(options))
+                writer.write_table(table)
+                yield sink.drain()
+        finally:
+            if writer is not None:
+                writer.close()
+        yield sink.drain()
+
+    def read(self, source, columns=None, filters=None, chunksize=None, **options):
+        import pandas as pd
+        import pyarrow.ipc as ipc
+
+        reader = ipc.open_file(source)
+        needed = needed_columns(columns, filters)
+
+        def batches():
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                if needed is not None:
+                    batch = batch.select(needed)
+                yield finish_frame(batch.to_pandas(), columns, filters)
+
+        if chunksize is None:
+            frames = list(batches())
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+        return (
+            frame.iloc[start:start + chunksize]
+            for frame in batches()
+            for start in range(0, len(frame), chunksize)
+        )
+
+
+class DrainableSink:
+    """Write-only file object whose buffered bytes can be taken incrementally."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def default_codecs():
+    """A fresh set of the built-in codecs, keyed by format name."""
+    codecs = [
+        CsvCodec(),
+        CsvCodec(name="csv.gz", compression="gzip"),
+        JsonCodec(),
+        NdjsonCodec(),
+        NdjsonCodec(name="ndjson.gz", compression="gzip"),
+        ParquetCodec(),
+        ParquetCodec(name="parquet.zstd", compression="zstd"),
+        ArrowIpcCodec(),
+        ArrowIpcCodec(name="arrow", compression="zstd"),
+    ]
+    return {codec.name: codec for codec in codecs}
@@ -0,0 +1,131 @@
+"""
+Per-column statistics of a DataFrame, in a JSON-friendly shape:
+
+    {"amount": {"dtype": "float64", "min": 1.5, "max": 99.0, "null_count": 2}}
+
+Used by the dataset manifests and indexes in StorageDataService so readers
+can skip objects (with filters.stats_may_match) without downloading them.
+"""
+import datetime
+import math
+
+
+def column_stats(df):
+    """
+    Compute dtype, min, max and null count for every column.
+
+    Bounds are None when a column is empty, all-null, or of a type that
+    cannot be ordered or stored as JSON. Accepts a DataFrame or a pyarrow
+    Table (computed with pyarrow.compute, without converting to pandas).
+    """
+    import pandas as pd
+
+    if not isinstance(df, pd.DataFrame):
+        return _arrow_column_stats(df)
+
+    stats = {}
+    for col in df.columns:
+        series = df[col]
+        non_null = series.dropna()
+        low = high = None
+        if len(non_null):
+            try:
+                low, high = _json_value(non_null.min()), _json_value(non_null.max())
+            except TypeError:
+                pass
+        stats[str(col)] = {
+            "dtype": str(series.dtype),
+            "min": low,
+            "max": high,
+            "null_count": int(series.isna().sum()),
+        }
+    return stats
+
+
+def _arrow_column_stats(table):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    stats = {}
+    for field, column in zip(table.schema, table.columns):
+        low = high = None
+        if column.length() > column.null_count:
+            try:
+                bounds = pc.min_max(column)
+                low, high = _json_value(bounds["min"].as_py()), _json_value(bounds["max"].as_py())
+            except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+                pass
+        stats[field.name] = {
+            "dtype": str(field.type),
+            "min": low,
+            "max": high,
+            "null_count": column.null_count,
+        }
+    return stats
+
+
+def merge_column_stats(stats, other):
+    """
+    Combine column_stats of two parts of one dataset (e.g. streamed chunks):
+    widest bounds, summed null counts, the first part's dtype. A column
+    whose bounds cannot be compared across parts loses them.
+    """
+    if stats is None:
+        return other
+    merged = {}
+    for col in list(stats) + [col for col in other if col not in stats]:
+        left, right = stats.get(col), other.get(col)
+        if left is None or right is None:
+            merged[col] = dict(left or right)
+            continue
+        low = _pick(left["min"], right["min"], min)
+        high = _pick(left["max"], right["max"], max)
+        if (low is None) != (high is None):
+            low = high = None
+        merged[col] = {
+            "dtype": left["dtype"],
+            "min": low,
+            "max": high,
+            "null_count": left["null_count"] + right["null_count"],
+        }
+    return merged
+
+
+def _pick(a, b, choose):
+    if a is None or b is None:
+        return a if b is None else b
+    try:
+        return choose(a, b)
+    except TypeError:
+        return None
+
+
+def stats_bounds(stats):
+    """
+    Turn column_stats output (possibly loaded from JSON) into the
+    {column: (min, max)} shape expected by stats_may_match.
+    """
+    import pandas as pd
+
+    bounds = {}
+    for col, col_stats in stats.items():
+        low, high = col_stats.get("min"), col_stats.get("max")
+        dtype = col_stats.get("dtype", "")
+        if ("datetime" in dtype or "timestamp" in dtype) and low is not None:
+            low, high = pd.Timestamp(low), pd.Timestamp(high)
+        bounds[col] = (low, high)
+    return bounds
+
+
+def _json_value(value):
+    import pandas as pd
+
+    if isinstance(value, (pd.Timestamp, datetime.date)):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return None
@@ -1,39 +1,201 @@
-import io
-import pandas as pd
+from src.common.metrics import get_metrics
+from src.storage.format.codecs import as_frame, default_codecs
+from src.storage.format.parallel import SlicePool
+
+# Below these sizes a process pool costs more than it saves
+DEFAULT_PARALLEL_MIN_ROWS = 200_000
+DEFAULT_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
 
 
 class DataFormatService:
-    """Handles converting DataFrames to/from serialized formats."""
+    """
+    Handles converting DataFrames to/from serialized formats.
+
+    Formats are provided by a registry of codecs (see storage.format.codecs).
+    Built in: csv, csv.gz, json, ndjson, ndjson.gz, parquet, parquet.zstd,
+    feather (Arrow IPC, lz4) and arrow (Arrow IPC, zstd). Register your own
+    with register_codec().
+
+    With processes=N, large objects are encoded/decoded in N worker
+    processes, one row slice each (see storage.format.parallel.SlicePool).
+    """
+
+    def __init__(
+        self,
+        codecs=None,
+        metrics=None,
+        processes=None,
+        parallel_min_rows=DEFAULT_PARALLEL_MIN_ROWS,
+        parallel_min_bytes=DEFAULT_PARALLEL_MIN_BYTES,
+    ):
+        """
+        Args:
+            codecs (list, optional): Extra Codec instances to register
+                (replacing built-ins with the same name).
+            metrics (Metrics, optional): Records encode/decode spans per
+                format; defaults to the process-wide registry.
+            processes (int, optional): Worker processes for slice-parallel
+                encode/decode; None keeps everything in-process.
+            parallel_min_rows (int): Frames with fewer rows are encoded
+                in-process.
+            parallel_min_bytes (int): Objects smaller than this are decoded
+                in-process.
+        """
+        self.codecs = default_codecs()
+        self.metrics = metrics or get_metrics()
+        self.slices = SlicePool(processes, metrics=self.metrics) if processes else None
+        self.parallel_min_rows = parallel_min_rows
+        self.parallel_min_bytes = parallel_min_bytes
+        for codec in codecs or []:
+            self.register_codec(codec)
+
+    def close(self):
+        """Stop the worker processes, if any."""
+        if self.slices is not None:
+            self.slices.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- REGISTRY ---
+    def register_codec(self, codec):
+        """Add or replace the codec for codec.name."""
+        self.codecs[codec.name] = codec
+
+    def get_codec(self, format):
+        """
+        Raises:
+            ValueError: Unsupported format.
+        """
+        try:
+            return self.codecs[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}") from None
 
+    def encode(self, df, format, **options):
+        """
+        Encode a DataFrame (or a pyarrow Table / RecordBatch: columnar
+        codecs write Arrow data directly, others convert it to pandas).
+        """
+        codec = self.get_codec(format)
+        with self.metrics.span("encode", format=format):
+            return self.encode_with(codec, df, **options)
+
+    def decode(self, data_bytes, format, **options):
+        codec = self.get_codec(format)
+        with self.metrics.span("decode", format=format):
+            return self.decode_with(codec, data_bytes, **options)
+
+    def encode_with(self, codec, df, **options):
+        """encode() with a resolved codec and no span (for callers that time it themselves)."""
+        df = df if codec.arrow_native else as_frame(df)
+        if self.slices is not None and len(df) >= self.parallel_min_rows:
+            return self.slices.encode(codec, df, **options)
+        return codec.encode(df, **options)
+
+    def decode_with(self, codec, data_bytes, **options):
+        """decode() with a resolved codec and no span."""
+        if self.slices is not None and len(data_bytes) >= self.parallel_min_bytes:
+            return self.slices.decode(codec, data_bytes, **options)
+        return codec.decode(data_bytes, **options)
+
+    # ---------------------------------------------------------
+    # Fixed-format helpers (built-in codecs, callable on the class:
+    # DataFormatService.df_to_csv_bytes(df))
+    # ---------------------------------------------------------
     # --- CSV ---
     @staticmethod
     def df_to_csv_bytes(df):
-        buffer = io.StringIO()
-        df.to_csv(buffer, index=False)
-        return buffer.getvalue().encode("utf-8")
+        return _default_codec("csv").encode(as_frame(df))
 
     @staticmethod
     def csv_bytes_to_df(data_bytes):
-        return pd.read_csv(io.BytesIO(data_bytes))
+        return _default_codec("csv").decode(data_bytes)
+
+    @staticmethod
+    def iter_csv_bytes(frames):
+        return _default_codec("csv").iter_encode(as_frame(frame) for frame in frames)
+
+    @staticmethod
+    def read_csv(source, columns=None, filters=None, chunksize=None):
+        return _default_codec("csv").read(source, columns=columns, filters=filters, chunksize=chunksize)
 
     # --- PARQUET ---
     @staticmethod
     def df_to_parquet_bytes(df):
-        buffer = io.BytesIO()
-        df.to_parquet(buffer, index=False)
-        return buffer.getvalue()
+        return _default_codec("parquet").encode(df)
 
     @staticmethod
     def parquet_bytes_to_df(data_bytes):
-        return pd.read_parquet(io.BytesIO(data_bytes))
+        return _default_codec("parquet").decode(data_bytes)
+
+    @staticmethod
+    def iter_parquet_bytes(frames):
+        return _default_codec("parquet").iter_encode(frames)
+
+    @staticmethod
+    def read_parquet(source, columns=None, filters=None, chunksize=None):
+        return _default_codec("parquet").read(source, columns=columns, filters=filters, chunksize=chunksize)
 
     # --- JSON ---
     @staticmethod
     def df_to_json_bytes(df):
-        text = df.to_json(orient="records")
-        return text.encode("utf-8")
+        return _default_codec("json").encode(as_frame(df))
 
     @staticmethod
     def json_bytes_to_df(data_bytes):
-        text = data_bytes.decode("utf-8")
-        return pd.read_json(io.StringIO(text))
\ No newline at end of file
+        return _default_codec("json").decode(data_bytes)
+
+    @staticmethod
+    def iter_json_bytes(frames):
+        return _default_codec("json").iter_encode(as_frame(frame) for frame in frames)
+
+    @staticmethod
+    def read_json(source, columns=None, filters=None, chunksize=None):
+        return _default_codec("json").read(source, columns=columns, filters=filters, chunksize=chunksize)
+
+    # --- PRUNED / CHUNKED READS ---
+    def read_df(self, source, format, columns=None, filters=None, chunksize=None, **options):
+        """
+        Read a file object, keeping only the requested columns and matching rows.
+
+        Args:
+            source: Readable file object (seekable for Parquet/Arrow).
+            format (str): Registered format name.
+            columns (list, optional): Columns to return.
+            filters (list, optional): Row filters, see storage.format.filters.
+            chunksize (int, optional): Return an iterator of DataFrames with
+                at most chunksize rows each instead of one DataFrame.
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        return self.get_codec(format).read(source, columns=columns, filters=filters, chunksize=chunksize, **options)
+
+    # --- STREAMING (one chunk of bytes per incoming DataFrame) ---
+    def iter_bytes(self, frames, format, **options):
+        """
+        Encode an iterable of DataFrames (or Arrow tables/batches) into a stream of byte chunks that,
+        concatenated, form one valid file in the given format.
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        codec = self.get_codec(format)
+        if not codec.arrow_native:
+            frames = (as_frame(frame) for frame in frames)
+        return codec.iter_encode(frames, **options)
+
+
+_default_codecs = None
+
+
+def _default_codec(format):
+    """Built-in codec for the static helpers (instance registrations do not apply)."""
+    global _default_codecs
+    if _default_codecs is None:
+        _default_codecs = default_codecs()
+    return _default_codecs[format]
@@ -0,0 +1,114 @@
+"""
+Row filters shared by the storage services.
+
+Filters use the same shape as pyarrow/pandas `read_parquet(filters=...)`:
+
+    [("country", "=", "US"), ("age", ">=", 18)]            # AND of predicates
+    [[("country", "=", "US")], [("country", "=", "CA")]]  # OR of AND-groups
+
+Supported operators: =, ==, !=, <, <=, >, >=, in, not in.
+"""
+
+OPERATORS = ("=", "==", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def normalize_filters(filters):
+    """
+    Return filters as a list of AND-groups (disjunctive normal form).
+
+    Raises:
+        ValueError: Unknown operator or malformed predicate.
+    """
+    if not filters:
+        return []
+    groups = filters if isinstance(filters[0], list) else [filters]
+    for group in groups:
+        for predicate in group:
+            if len(predicate) != 3 or predicate[1] not in OPERATORS:
+                raise ValueError(f"Unsupported filter predicate: {predicate}")
+    return [list(group) for group in groups]
+
+
+def filter_columns(filters):
+    """Names of all columns referenced by the filters."""
+    return [col for group in normalize_filters(filters) for col, _, _ in group]
+
+
+def filter_frame(df, filters):
+    """Return the rows of df that match the filters."""
+    groups = normalize_filters(filters)
+    if not groups:
+        return df
+
+    mask = None
+    for group in groups:
+        group_mask = None
+        for col, op, value in group:
+            predicate = _series_predicate(df[col], op, value)
+            group_mask = predicate if group_mask is None else group_mask & predicate
+        mask = group_mask if mask is None else mask | group_mask
+    return df[mask.fillna(False).astype(bool)]
+
+
+def _series_predicate(series, op, value):
+    if op in ("=", "=="):
+        return series == value
+    if op == "!=":
+        return series != value
+    if op == "<":
+        return series < value
+    if op == "<=":
+        return series <= value
+    if op == ">":
+        return series > value
+    if op == ">=":
+        return series >= value
+    if op == "in":
+        return series.isin(value)
+    return ~series.isin(value)
+
+
+def stats_may_match(stats, filters):
+    """
+    Decide from column min/max statistics whether any row could match.
+
+    Args:
+        stats (dict): {column: (min, max)}. Missing columns, or None bounds,
+            are treated as unknown (may match).
+        filters: Filters in any accepted shape.
+
+    Returns:
+        bool: False only when the statistics prove that no row matches.
+    """
+    groups = normalize_filters(filters)
+    if not groups:
+        return True
+    return any(
+        all(_range_may_match(stats.get(col), op, value) for col, op, value in group)
+        for group in groups
+    )
+
+
+def _range_may_match(bounds, op, value):
+    if not bounds or bounds[0] is None or bounds[1] is None:
+        return True
+    low, high = bounds
+    try:
+        if op in ("=", "=="):
+            return low <= value <= high
+        if op == "!=":
+            return not (low == high == value)
+        if op == "<":
+            return low < value
+        if op == "<=":
+            return low <= value
+        if op == ">":
+            return high > value
+        if op == ">=":
+            return high >= value
+        if op == "in":
+            return any(low <= v <= high for v in value)
+    except TypeError:
+        # Incomparable types (e.g. stats stored as strings) — can't prune
+        return True
+    return True
@@ -0,0 +1,286 @@
+import pickle
+import threading
+from multiprocessing.shared_memory import SharedMemory
+
+from src.common.metrics import get_metrics
+from src.storage.format.codecs import as_arrow_table
+
+
+class SlicePool:
+    """
+    Encodes and decodes row slices of large objects in a process pool.
+
+    Text encoding/parsing (CSV, JSON) runs in Python-level pandas code that
+    holds the GIL, so threads do not speed it up; worker processes do.
+
+    - encode: the DataFrame is split into one row slice per process; each
+      worker encodes its slice (CSV header only on the first, gzip per slice
+      as concatenated members) and the codec joins the parts in order.
+      Columnar codecs (Parquet/Arrow) already encode in C++ without the GIL:
+      they stay in-process, the frame is converted to one Arrow table and
+      each slice of it is written as its own row group.
+    - decode: line-oriented objects (CSV, NDJSON) are split at record
+      boundaries and each range is parsed by a worker; the frames are
+      concatenated in order. Workers infer dtypes per slice; where slices
+      disagree on a column in a way concat cannot reconcile (see
+      Codec.slice_dtypes), every slice is parsed again with dtype= for it,
+      so the result matches a single-process decode.
+
+    Data crosses process boundaries through shared memory, not the pool's
+    pickled pipes: the input frame once as an Arrow IPC stream (workers
+    read their rows zero-copy), the input bytes once as raw bytes, and every
+    result in its own segment. Frames Arrow cannot represent (mixed-type
+    object columns) fall back to a pickle written to shared memory.
+
+    The pool is started on first use; call close() when done.
+    """
+
+    def __init__(self, processes, metrics=None):
+        """
+        Args:
+            processes (int): Worker processes, also the number of slices.
+            metrics (Metrics, optional): Counts slices per operation and
+                format; defaults to the process-wide registry.
+        """
+        if processes < 1:
+            raise ValueError(f"Unsupported process count: {processes}")
+        self.processes = processes
+        self.metrics = metrics or get_metrics()
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        """ProcessPoolExecutor, created on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    import multiprocessing
+                    from concurrent.futures import ProcessPoolExecutor
+                    from multiprocessing import resource_tracker
+
+                    # Workers must share the parent's tracker, or each one
+                    # would unlink (and warn about) the segments it created
+                    resource_tracker.ensure_running()
+                    # Forking a process that runs other threads (upload pools,
+                    # HTTP servers) can copy a held lock and hang the worker:
+                    # start workers from a single-threaded fork server instead
+                    methods = multiprocessing.get_all_start_methods()
+                    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+                    self._pool = ProcessPoolExecutor(max_workers=self.processes, mp_context=context)
+        return self._pool
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ---------------------------------------------------------
+    # Encode / decode
+    # ---------------------------------------------------------
+    def encode(self, codec, df, **options):
+        """
+        Encode df with codec, one row slice per process.
+
+        Args:
+            codec (Codec): Codec with parallel_encode or arrow_native set;
+                any other codec encodes df in-process as usual.
+            df (pd.DataFrame | pa.Table): Data to encode (pa.Table only for
+                arrow_native codecs).
+            **options: Codec options, e.g. compression="gzip".
+
+        Returns:
+            bytes: The encoded object.
+        """
+        bounds = slice_bounds(len(df), self.processes)
+        if codec.arrow_native:
+            # Convert once: a slice on its own could infer another type (an
+            # all-null slice of an object column becomes null-typed)
+            table = as_arrow_table(df)
+            slices = (table.slice(start, stop - start) for start, stop in bounds)
+            return b"".join(codec.iter_encode(slices, **options))
+        if not codec.parallel_encode or len(bounds) < 2:
+            return codec.encode(df, **options)
+
+        self.metrics.increment("format_slices_total", len(bounds), operation="encode", format=codec.name)
+        frame = _write_frame(df)
+        try:
+            futures = [
+                self.pool.submit(_encode_slice, codec, frame, start, stop, index == 0, options)
+                for index, (start, stop) in enumerate(bounds)
+            ]
+            parts = _gather(futures, _read_bytes)
+        finally:
+            _unlink(frame)
+        return codec.join_slices(parts, **options)
+
+    def decode(self, codec, data, **options):
+        """
+        Decode data with codec, parsing record ranges in parallel.
+
+        Args:
+            codec (Codec): Codec with parallel_decode set; any other codec
+                decodes in-process as usual.
+            data (bytes): Encoded object.
+
+        Returns:
+            pd.DataFrame
+        """
+        if not codec.parallel_decode:
+            return codec.decode(data, **options)
+        data, header, ranges = codec.split(data, self.processes)
+        if len(ranges) < 2:
+            return codec.decode(data, **options)
+
+        import pandas as pd
+
+        self.metrics.increment("format_slices_total", len(ranges), operation="decode", format=codec.name)
+        source = _write_bytes(data)
+        try:
+            frames = self._decode_ranges(codec, header, source, ranges, options)
+            dtypes = codec.slice_dtypes(frames)
+            if dtypes:
+                self.metrics.increment("format_slice_reparses_total", operation="decode", format=codec.name)
+                frames = self._decode_ranges(codec, header, source, ranges, {**options, "dtype": dtypes})
+        finally:
+            _unlink(source)
+        return pd.concat(frames, ignore_index=True)
+
+    def _decode_ranges(self, codec, header, source, ranges, options):
+        futures = [
+            self.pool.submit(_decode_slice, codec, header, source, start, stop, options)
+            for start, stop in ranges
+        ]
+        return _gather(futures, _read_frame)
+
+
+def slice_bounds(rows, parts):
+    """At most `parts` contiguous (start, stop) row ranges of near-equal size."""
+    step = max(1, -(-rows // parts))
+    return [(start, min(start + step, rows)) for start in range(0, rows, step)]
+
+
+# ---------------------------------------------------------
+# Worker functions (run in the pool's processes)
+# ---------------------------------------------------------
+def _encode_slice(codec, frame, start, stop, first, options):
+    kind, name, size = frame
+    shm = SharedMemory(name=name)
+    try:
+        df = _load_frame(shm.buf[:size], kind, start, stop)
+        data = codec.encode_slice(df, first, **options)
+        # The slice may be a zero-copy view of the segment: drop it first
+        del df
+    finally:
+        shm.close()
+    return _write_bytes(data)
+
+
+def _decode_slice(codec, header, source, start, stop, options):
+    _, name, _ = source
+    shm = SharedMemory(name=name)
+    try:
+        chunk = bytes(shm.buf[start:stop])
+    finally:
+        shm.close()
+    return _write_frame(codec.decode_slice(header, chunk, **options))
+
+
+# ---------------------------------------------------------
+# Shared-memory transfer
+#
+# A segment is referenced by (kind, name, size): kind "bytes" for raw
+# bytes, "arrow" for an Arrow IPC stream, "pickle" for a pickled frame.
+# The process that creates a segment closes its handle; the reader (or,
+# for shared inputs, the parent once all slices are done) unlinks it.
+# ---------------------------------------------------------
+def _write_bytes(data, kind="bytes"):
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    try:
+        shm.buf[:len(data)] = data
+    finally:
+        shm.close()
+    return kind, shm.name, len(data)
+
+
+def _read_bytes(ref):
+    _, name, size = ref
+    shm = SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _write_frame(df):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return _write_bytes(pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL), kind="pickle")
+
+    counter = pa.MockOutputStream()
+    with ipc.new_stream(counter, table.schema) as writer:
+        writer.write_table(table)
+    size = counter.size()
+
+    shm = SharedMemory(create=True, size=max(size, 1))
+    try:
+        target = pa.py_buffer(shm.buf)
+        with ipc.new_stream(pa.FixedSizeBufferWriter(target), table.schema) as writer:
+            writer.write_table(table)
+        # Arrow must drop its view of the segment before it can be closed
+        del target, writer
+    finally:
+        shm.close()
+    return "arrow", shm.name, size
+
+
+def _read_frame(ref):
+    """Copy a frame stored by _write_frame out of its segment and unlink it."""
+    return _load_frame(_read_bytes(ref), ref[0])
+
+
+def _load_frame(data, kind, start=None, stop=None):
+    """The frame (or rows start:stop of it) in data; Arrow columns may be views of data."""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    if kind == "pickle":
+        df = pickle.loads(data)
+        return df.iloc[start:stop] if start is not None else df
+    table = ipc.open_stream(pa.py_buffer(data)).read_all()
+    if start is not None:
+        table = table.slice(start, stop - start)
+    return table.to_pandas()
+
+
+def _unlink(ref):
+    shm = SharedMemory(name=ref[1])
+    shm.close()
+    shm.unlink()
+
+
+def _gather(futures, read):
+    """Read every result in order; on failure, still free the segments of the others."""
+    results = []
+    error = None
+    for future in futures:
+        try:
+            ref = future.result()
+        except Exception as e:
+            error = error or e
+            continue
+        results.append(read(ref))
+    if error is not None:
+        raise error
+    return results
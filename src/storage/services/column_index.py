@@ -0,0 +1,72 @@
+import json
+
+from src.storage.format.column_stats import column_stats, stats_bounds
+from src.storage.format.filters import stats_may_match
+
+INDEX_NAME = "_index.json"
+
+
+class ColumnStatsIndex:
+    """
+    Statistics of the objects under one prefix, stored next to them as
+    {prefix}/_index.json:
+
+        {"objects": {"sales/2024-01.parquet": {
+            "format": "parquet", "rows": 1200,
+            "schema": {"amount": "float64", ...},
+            "columns": {"amount": {"dtype": ..., "min": ..., "max": ..., "null_count": 0}}}}}
+
+    prune() answers "which objects could contain rows matching these
+    filters?" without touching the objects themselves.
+    """
+
+    def __init__(self, objects=None):
+        self.objects = objects or {}
+
+    @staticmethod
+    def index_key(prefix):
+        """Object path of the index for a prefix ("" for the bucket root)."""
+        prefix = prefix.strip("/")
+        return f"{prefix}/{INDEX_NAME}" if prefix else INDEX_NAME
+
+    @classmethod
+    def load(cls, storage_client, bucket, prefix):
+        index_key = cls.index_key(prefix)
+        if not storage_client.exists(bucket, index_key):
+            return cls()
+        return cls(json.loads(storage_client.download_bytes(bucket, index_key))["objects"])
+
+    def save(self, storage_client, bucket, prefix):
+        data = json.dumps({"objects": self.objects}).encode("utf-8")
+        storage_client.upload_bytes(bucket, self.index_key(prefix), data, content_type="application/json")
+
+    @staticmethod
+    def entry(format, rows, stats):
+        """Index entry of one object from its row count and column_stats."""
+        return {
+            "format": format,
+            "rows": rows,
+            "schema": {col: col_stats["dtype"] for col, col_stats in stats.items()},
+            "columns": stats,
+        }
+
+    def record(self, key, df, format):
+        self.objects[key] = self.entry(format, len(df), column_stats(df))
+
+    def remove(self, key):
+        self.objects.pop(key, None)
+
+    def apply(self, changes):
+        """Apply {key: entry, or None to remove the key}."""
+        for key, entry in changes.items():
+            if entry is None:
+                self.remove(key)
+            else:
+                self.objects[key] = entry
+
+    def prune(self, filters):
+        """Keys (in order) of the objects whose statistics may match the filters."""
+        return [
+            key for key, entry in sorted(self.objects.items())
+            if entry["rows"] and stats_may_match(stats_bounds(entry["columns"]), filters)
+        ]
@@ -1,45 +1,195 @@
+import io
+import itertools
+import json
+import posixpath
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import quote
+
+from src.common.metrics import get_metrics
+from src.storage.format.codecs import as_arrow_table, as_frame, finish_frame, needed_columns
+from src.storage.format.column_stats import column_stats, merge_column_stats, stats_bounds
+from src.storage.format.filters import stats_may_match
+from src.storage.services.column_index import ColumnStatsIndex
+
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_DECODE_WORKERS = 4
+DEFAULT_UPLOAD_WORKERS = 8
+MANIFEST_NAME = "_manifest.json"
+# Hive's directory name for null partition values
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
 class StorageDataService:
     """
     Service for uploading and downloading pandas DataFrames
     to/from storage systems like S3 or MinIO.
-    Handles the serialization/deserialization (CSV, JSON, Parquet).
+    Handles the serialization/deserialization through the DataFormatService
+    codec registry (CSV, JSON, NDJSON, Parquet, Arrow/Feather, ...).
     """
-    def __init__(self, storage_client, format_service, logger):
+    def __init__(
+        self,
+        storage_client,
+        format_service,
+        logger,
+        frame_cache=None,
+        maintain_index=False,
+        metrics=None
+    ):
         """
         Args:
             storage_client: S3Client or MinioClient instance.
             format_service: DataFormatService for format conversions.
             logger: Logger for messages and errors.
+            frame_cache (FrameCache, optional): In-memory tier of decoded
+                DataFrames; hot objects skip download and parsing entirely
+                (one HEAD request checks the ETag; entries are keyed on the
+                ETag of the GET that produced them).
+            maintain_index (bool): Record every upload (upload_df,
+                upload_df_stream, upload_partitioned) and delete in the column
+                statistics index of its prefix (see query()). Use
+                index_batch() to write each index once for many uploads.
+            metrics (Metrics, optional): Records encode/decode/upload spans;
+                defaults to the process-wide registry.
         """
         self.storage = storage_client        # S3Client or MinioClient
         self.fmt = format_service            # DataFormatService
         self.logger = logger
+        self.frame_cache = frame_cache
+        self.maintain_index = maintain_index
+        self._index_lock = threading.Lock()
+        self._index_batch_depth = 0
+        self._pending_index = {}     # (bucket, prefix) -> {key: entry or None}
+        self.metrics = metrics or get_metrics()
+
+        # tracking fields
+        self.objects_pruned = 0
 
-    def upload_df(self, df, bucket, key, format="csv"):
+    def upload_df(self, df, bucket, key, format="csv", **options):
         """
         Serialize a DataFrame and upload it.
 
         Args:
-            df (pd.DataFrame): Data to upload.
+            df (pd.DataFrame | pa.Table): Data to upload. Parquet/Arrow write
+                pyarrow Tables directly, without a pandas round-trip.
+            bucket (str): Bucket name.
+            key (str): Object path.
+            format (str): Registered format, e.g. "csv", "json", "parquet".
+            **options: Codec options, e.g. compression="zstd".
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        data, index_entry = self.encode_df(df, format, **options)
+        self.upload_encoded(data, bucket, key, format, index_entry, **options)
+
+    def encode_df(self, df, format="csv", **options):
+        """
+        Serialize a DataFrame for upload_encoded(): the first half of
+        upload_df(), for callers that encode and upload on different threads.
+
+        Args:
+            df (pd.DataFrame | pa.Table): Data to encode.
+            format (str): Registered format.
+            **options: Codec options, e.g. compression="zstd".
+
+        Returns:
+            tuple: (data, index_entry); index_entry is None unless
+                maintain_index is set.
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        codec = self.fmt.get_codec(format)
+        with self.metrics.span("encode", format=format):
+            data = self.fmt.encode_with(codec, df, **options)
+        index_entry = ColumnStatsIndex.entry(format, len(df), column_stats(df)) if self.maintain_index else None
+        return data, index_entry
+
+    def upload_encoded(self, data, bucket, key, format="csv", index_entry=None, **options):
+        """
+        Upload bytes from encode_df() and record them in the index.
+
+        Args:
+            data (bytes): Encoded object.
             bucket (str): Bucket name.
             key (str): Object path.
-            format (str): "csv", "json", or "parquet".
+            format (str): Format data was encoded in.
+            index_entry (dict, optional): The entry encode_df() returned.
+            **options: The codec options used to encode data.
 
         Raises:
             ValueError: Unsupported format.
         """
-        if format == "csv":
-            data = self.fmt.df_to_csv_bytes(df)
-        elif format == "json":
-            data = self.fmt.df_to_json_bytes(df)
-        elif format == "parquet":
-            data = self.fmt.df_to_parquet_bytes(df)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        codec = self.fmt.get_codec(format)
+        with self.metrics.span("upload", attributes={"bucket": bucket, "key": key, "bytes": len(data)}):
+            self.storage.upload_bytes(
+                bucket,
+                key,
+                data,
+                content_type=codec.content_type,
+                content_encoding=codec.content_encoding(**options),
+            )
+
+        if self.maintain_index and index_entry is not None:
+            self._update_index(bucket, key, index_entry)
+
+    def upload_df_stream(self, frames, bucket, key, format="csv", part_size=None, **options):
+        """
+        Serialize DataFrames as they arrive and stream them into a single
+        object via a multipart upload. Only about one part is held in memory.
 
-        self.storage.upload_bytes(bucket, key, data)
+        Args:
+            frames (Iterable[pd.DataFrame | pa.Table | pa.RecordBatch]):
+                Chunks of the dataset, in order.
+            bucket (str): Bucket name.
+            key (str): Object path.
+            format (str): Registered format, e.g. "csv", "json", "parquet".
+            part_size (int, optional): Multipart part size in bytes.
+            **options: Codec options, e.g. compression="zstd".
 
-    def download_df(self, bucket, key, format="csv"):
+        Returns:
+            int: Total number of bytes uploaded.
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        codec = self.fmt.get_codec(format)
+        if not codec.arrow_native:
+            frames = (as_frame(frame) for frame in frames)
+        stats = {"rows": 0, "columns": None}
+        if self.maintain_index:
+            frames = self._tracking_stats(frames, stats)
+        size = self.storage.upload_stream(
+            bucket,
+            key,
+            codec.iter_encode(frames, **options),
+            content_type=codec.content_type,
+            content_encoding=codec.content_encoding(**options),
+            part_size=part_size,
+        )
+        if self.maintain_index:
+            self._update_index(bucket, key, ColumnStatsIndex.entry(format, stats["rows"], stats["columns"] or {}))
+        return size
+
+    @staticmethod
+    def _tracking_stats(frames, stats):
+        """Pass frames through, accumulating their row count and column_stats into stats."""
+        for frame in frames:
+            frame_stats = column_stats(as_arrow_table(frame) if hasattr(frame, "schema") else frame)
+            stats["rows"] += len(frame)
+            stats["columns"] = merge_column_stats(stats["columns"], frame_stats)
+            yield frame
+
+    def delete(self, bucket, key):
+        """Delete a stored object."""
+        self.storage.delete(bucket, key)
+        if self.maintain_index:
+            self._update_index(bucket, key, None)
+
+    def download_df(self, bucket, key, format="csv", columns=None, filters=None, chunksize=None, **options):
         """
         Download an object and return it as a DataFrame.
 
@@ -47,17 +197,446 @@ class StorageDataService:
             bucket (str): Bucket name.
             key (str): Object path.
             format (str): Expected format.
+            columns (list, optional): Only return these columns.
+            filters (list, optional): Only return matching rows, e.g.
+                [("country", "=", "US"), ("age", ">=", 18)].
+            chunksize (int, optional): Return a lazy iterator of DataFrames
+                with at most chunksize rows each.
+
+        For Parquet, columns/filters are pushed down: only the footer, the
+        row groups whose statistics can match, and the needed column chunks
+        are fetched (with range GETs). CSV/NDJSON are streamed and parsed in
+        chunks when chunksize is given.
 
         Returns:
-            pd.DataFrame
+            pd.DataFrame, or an iterator of DataFrames when chunksize is set.
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        codec = self.fmt.get_codec(format)
+
+        if columns is not None or filters or chunksize:
+            if codec.seekable_reads:
+                source = self.storage.open_ranged(bucket, key)
+            elif chunksize and codec.streamable_reads:
+                source = self.storage.open_stream(bucket, key)
+            else:
+                source = io.BytesIO(self.storage.download_bytes(bucket, key))
+            return codec.read(source, columns=columns, filters=filters, chunksize=chunksize, **options)
+
+        if self.frame_cache is None or options:
+            return self._decode(codec, format, self.storage.download_bytes(bucket, key), **options)
+
+        df = self.frame_cache.get((bucket, key, format, self.storage.etag(bucket, key)))
+        if df is None:
+            # Cache under the ETag of the version the GET returned: the object
+            # may have been overwritten since the HEAD above
+            info = {}
+            df = self._decode(codec, format, self.storage.download_bytes(bucket, key, info=info))
+            self.frame_cache.put((bucket, key, format, info.get("ETag")), df)
+        return df
+
+    def _decode(self, codec, format, data, **options):
+        with self.metrics.span("decode", format=format):
+            return self.fmt.decode_with(codec, data, **options)
+
+    # ---------------------------------------------------------
+    # Multi-object reads
+    # ---------------------------------------------------------
+    def read_prefix(self, bucket, prefix, format="csv", suffix=None, **kwargs):
         """
-        data = self.storage.download_bytes(bucket, key)
+        Read every object under a prefix (e.g. the part files of a dataset).
+
+        Args:
+            bucket (str): Bucket name.
+            prefix (str): Key prefix, e.g. "events/2024/".
+            format (str): Format of the objects.
+            suffix (str, optional): Only read keys ending with this, e.g. ".parquet".
+            **kwargs: Passed to download_many (lazy, columns, filters, workers...).
+
+        Returns:
+            pd.DataFrame, or an iterator of (key, DataFrame) when lazy=True.
+        """
+        keys = [
+            obj["Key"] for obj in self.storage.list_objects(bucket, prefix)
+            if not obj["Key"].endswith("/") and (suffix is None or obj["Key"].endswith(suffix))
+        ]
+        return self.download_many(bucket, keys, format=format, **kwargs)
+
+    def download_many(
+        self,
+        bucket,
+        keys,
+        format="csv",
+        columns=None,
+        filters=None,
+        lazy=False,
+        download_workers=DEFAULT_DOWNLOAD_WORKERS,
+        decode_workers=DEFAULT_DECODE_WORKERS,
+        **options
+    ):
+        """
+        Download and decode many objects concurrently.
+
+        Downloads run on one pool and decoding on another, so parsing of
+        finished objects overlaps the network I/O of the next ones. At most
+        download_workers + decode_workers objects are held in memory.
+
+        Args:
+            bucket (str): Bucket name.
+            keys (Iterable[str]): Object paths.
+            format (str): Format of the objects.
+            columns (list, optional): Only return these columns.
+            filters (list, optional): Only return matching rows.
+            lazy (bool): Return an iterator of (key, DataFrame) in key order
+                instead of one concatenated DataFrame.
+            download_workers (int): Concurrent downloads.
+            decode_workers (int): Concurrent decodes.
+            **options: Codec options.
+
+        Returns:
+            pd.DataFrame, or an iterator of (key, DataFrame) when lazy=True.
+
+        Raises:
+            ValueError: Unsupported format.
+        """
+        import pandas as pd
+
+        codec = self.fmt.get_codec(format)
+
+        def decode(data):
+            if columns is not None or filters:
+                with self.metrics.span("decode", format=format):
+                    return codec.read(io.BytesIO(data), columns=columns, filters=filters, **options)
+            return self._decode(codec, format, data, **options)
+
+        frames = self._iter_many(bucket, list(keys), decode, download_workers, decode_workers)
+        if lazy:
+            return frames
+
+        frames = [df for _, df in frames]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def _iter_many(self, bucket, keys, decode, download_workers, decode_workers):
+        window = download_workers + decode_workers
+        downloads = ThreadPoolExecutor(max_workers=download_workers, thread_name_prefix="download")
+        decodes = ThreadPoolExecutor(max_workers=decode_workers, thread_name_prefix="decode")
+        pending = deque()
+        remaining = iter(keys)
+
+        def fill():
+            while len(pending) < window:
+                key = next(remaining, None)
+                if key is None:
+                    return
+                pending.append((key, self._download_then_decode(downloads, decodes, bucket, key, decode)))
+
+        try:
+            fill()
+            while pending:
+                key, result = pending.popleft()
+                df = result.result()
+                fill()
+                yield key, df
+        finally:
+            downloads.shutdown(wait=True, cancel_futures=True)
+            decodes.shutdown(wait=True, cancel_futures=True)
+
+    def _download_then_decode(self, downloads, decodes, bucket, key, decode):
+        """Future of decode(download_bytes(key)); the decode is queued as soon as the bytes arrive."""
+        result = Future()
+
+        def relay(future):
+            if future.cancelled():
+                result.cancel()
+            elif future.exception() is not None:
+                result.set_exception(future.exception())
+            else:
+                result.set_result(future.result())
+
+        def on_downloaded(download):
+            if download.cancelled() or download.exception() is not None:
+                relay(download)
+                return
+            try:
+                decodes.submit(decode, download.result()).add_done_callback(relay)
+            except RuntimeError as e:  # decode pool already shut down
+                result.set_exception(e)
+
+        downloads.submit(self.storage.download_bytes, bucket, key).add_done_callback(on_downloaded)
+        return result
+
+    # ---------------------------------------------------------
+    # Partitioned datasets
+    # ---------------------------------------------------------
+    def upload_partitioned(
+        self,
+        df,
+        bucket,
+        prefix,
+        partition_cols,
+        format="parquet",
+        max_rows_per_file=None,
+        max_workers=DEFAULT_UPLOAD_WORKERS,
+        **options
+    ):
+        """
+        Write a DataFrame as a Hive-style partitioned dataset:
+
+            {prefix}/country=US/year=2024/part-00000.parquet
+            {prefix}/_manifest.json
+
+        Partition columns are encoded in the path (not in the files). Files
+        are uploaded in parallel; the manifest records every file's partition
+        values, row count and per-column min/max/null statistics so that
+        read_partitioned can skip files without downloading them.
+
+        Args:
+            df (pd.DataFrame): Data to write.
+            bucket (str): Bucket name.
+            prefix (str): Dataset root, e.g. "events".
+            partition_cols (list): Columns to partition by, outermost first.
+            format (str): Registered format of the part files.
+            max_rows_per_file (int, optional): Split large partitions into
+                several part files.
+            max_workers (int): Concurrent uploads.
+            **options: Codec options.
+
+        Returns:
+            dict: The manifest.
+
+        Raises:
+            ValueError: Unsupported format or unknown partition column.
+        """
+        codec = self.fmt.get_codec(format)
+        partition_cols = list(partition_cols)
+        missing = [col for col in partition_cols if col not in df.columns]
+        if missing:
+            raise ValueError(f"Unknown partition columns: {missing}")
+
+        prefix = prefix.rstrip("/")
+        files = []
+        for values, part_df in self._partitions(df, partition_cols):
+            part_df = part_df.drop(columns=partition_cols).reset_index(drop=True)
+            directory = "/".join(
+                f"{col}={self._partition_dirname(value)}" for col, value in zip(partition_cols, values)
+            )
+            step = max_rows_per_file or max(len(part_df), 1)
+            for number, start in enumerate(range(0, len(part_df), step)):
+                chunk = part_df.iloc[start:start + step]
+                key = "/".join(filter(None, [prefix, directory, f"part-{number:05d}.{format}"]))
+                files.append({
+                    "key": key,
+                    "partition": {col: _json_scalar(value) for col, value in zip(partition_cols, values)},
+                    "rows": len(chunk),
+                    "columns": column_stats(chunk),
+                    "_frame": chunk,
+                })
+
+        def upload(entry):
+            # As encode_df(), reusing the statistics already taken for the manifest
+            with self.metrics.span("encode", format=format):
+                data = self.fmt.encode_with(codec, entry.pop("_frame"), **options)
+            index_entry = ColumnStatsIndex.entry(format, entry["rows"], entry["columns"])
+            self.upload_encoded(data, bucket, entry["key"], format, index_entry, **options)
+
+        with self.index_batch(), ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="upload") as pool:
+            list(pool.map(upload, files))
+
+        manifest = {"format": format, "partition_cols": partition_cols, "files": files}
+        self.storage.upload_bytes(
+            bucket, f"{prefix}/{MANIFEST_NAME}", json.dumps(manifest).encode("utf-8"), content_type="application/json"
+        )
+        self.logger.info(f"Wrote {len(files)} files under {bucket}/{prefix}/ ({len(df)} rows).")
+        return manifest
+
+    def read_manifest(self, bucket, prefix):
+        """Load the manifest written by upload_partitioned."""
+        return json.loads(self.storage.download_bytes(bucket, f"{prefix.rstrip('/')}/{MANIFEST_NAME}"))
+
+    def read_partitioned(self, bucket, prefix, columns=None, filters=None, lazy=False, **kwargs):
+        """
+        Read a dataset written by upload_partitioned. Files whose partition
+        values or column statistics cannot match the filters are skipped
+        without being downloaded; partition columns are added back.
+
+        Args:
+            bucket (str): Bucket name.
+            prefix (str): Dataset root.
+            columns (list, optional): Only return these columns.
+            filters (list, optional): Only return matching rows.
+            lazy (bool): Return an iterator of (key, DataFrame).
+            **kwargs: Passed to download_many (e.g. download_workers).
+
+        Returns:
+            pd.DataFrame, or an iterator of (key, DataFrame) when lazy=True.
+        """
+        import pandas as pd
+
+        manifest = self.read_manifest(bucket, prefix)
+        partition_cols = manifest["partition_cols"]
+        selected = {
+            entry["key"]: entry for entry in manifest["files"]
+            if stats_may_match(self._entry_bounds(entry), filters)
+        }
+        self.logger.info(f"Reading {len(selected)} of {len(manifest['files'])} files under {bucket}/{prefix}/.")
+
+        needed = needed_columns(columns, filters)
+        file_columns = None if needed is None else [col for col in needed if col not in partition_cols]
+        frames = self.download_many(
+            bucket, list(selected), format=manifest["format"], columns=file_columns, lazy=True, **kwargs
+        )
+
+        def finished():
+            for key, df in frames:
+                for col, value in selected[key]["partition"].items():
+                    df[col] = value
+                yield key, finish_frame(df, columns, filters).reset_index(drop=True)
+
+        if lazy:
+            return finished()
+        results = [df for _, df in finished()]
+        return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
+    @staticmethod
+    def _partitions(df, partition_cols):
+        """Yield (partition values tuple, rows) for every partition, nulls included."""
+        for values, part_df in df.groupby(partition_cols, sort=True, dropna=False):
+            yield (values if isinstance(values, tuple) else (values,)), part_df
+
+    @staticmethod
+    def _partition_dirname(value):
+        import pandas as pd
+
+        if pd.isna(value):
+            return NULL_PARTITION
+        return quote(str(value), safe="")
+
+    @staticmethod
+    def _entry_bounds(entry):
+        bounds = stats_bounds(entry["columns"])
+        for col, value in entry["partition"].items():
+            bounds[col] = (value, value)
+        return bounds
+
+    # ---------------------------------------------------------
+    # Column statistics index
+    # ---------------------------------------------------------
+    def _update_index(self, bucket, key, entry):
+        """
+        Record entry (None removes key) in the index covering key: written
+        right away, or at the end of the current index_batch(). Serialized
+        within this service; concurrent writers in other processes must not
+        share a prefix.
+        """
+        prefix = posixpath.dirname(key)
+        with self._index_lock:
+            if self._index_batch_depth:
+                self._pending_index.setdefault((bucket, prefix), {})[key] = entry
+                return
+            self._write_index(bucket, prefix, {key: entry})
+
+    def _write_index(self, bucket, prefix, changes):
+        index = ColumnStatsIndex.load(self.storage, bucket, prefix)
+        index.apply(changes)
+        index.save(self.storage, bucket, prefix)
+
+    @contextmanager
+    def index_batch(self):
+        """
+        Defer index updates until the outermost batch exits, then write each
+        touched index once (one GET and one PUT per prefix instead of per
+        upload):
+
+            with storage.index_batch():
+                for key, df in frames.items():
+                    storage.upload_df(df, bucket, key, format="parquet")
+        """
+        with self._index_lock:
+            self._index_batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._index_lock:
+                self._index_batch_depth -= 1
+                last = self._index_batch_depth == 0
+            if last:
+                self.flush_index()
+
+    def flush_index(self):
+        """
+        Write pending index updates now.
+
+        Returns:
+            int: Number of indexes written.
+        """
+        with self._index_lock:
+            pending, self._pending_index = self._pending_index, {}
+            for (bucket, prefix), changes in pending.items():
+                self._write_index(bucket, prefix, changes)
+        return len(pending)
+
+    def load_index(self, bucket, prefix):
+        """The ColumnStatsIndex of a prefix (empty if none has been written)."""
+        return ColumnStatsIndex.load(self.storage, bucket, prefix)
+
+    def prune(self, bucket, prefix, filters=None):
+        """
+        Keys of the indexed objects under prefix that may contain rows
+        matching filters, decided from the index alone (no object GETs).
+        """
+        return self._prune(self.load_index(bucket, prefix), bucket, prefix, filters)
+
+    def _prune(self, index, bucket, prefix, filters):
+        keys = index.prune(filters)
+        skipped = len(index.objects) - len(keys)
+        self.objects_pruned += skipped
+        self.logger.info(f"Index pruned {skipped} of {len(index.objects)} objects under {bucket}/{prefix}.")
+        return keys
+
+    def query(self, bucket, prefix, filters=None, columns=None, lazy=False, **kwargs):
+        """
+        Read the indexed objects under prefix that can match filters; objects
+        ruled out by their min/max statistics are never downloaded.
+
+        Args:
+            bucket (str): Bucket name.
+            prefix (str): Prefix whose index to use.
+            filters (list, optional): Only return matching rows.
+            columns (list, optional): Only return these columns.
+            lazy (bool): Return an iterator of (key, DataFrame).
+            **kwargs: Passed to download_many (e.g. download_workers).
+
+        Returns:
+            pd.DataFrame, or an iterator of (key, DataFrame) when lazy=True.
+        """
+        import pandas as pd
+
+        index = self.load_index(bucket, prefix)
+        keys = self._prune(index, bucket, prefix, filters)
+
+        by_format = {}
+        for key in keys:
+            by_format.setdefault(index.objects[key]["format"], []).append(key)
+        frames = itertools.chain.from_iterable(
+            self.download_many(bucket, group, format=format, columns=columns, filters=filters, lazy=True, **kwargs)
+            for format, group in by_format.items()
+        )
+        if lazy:
+            return frames
+        results = [df for _, df in frames]
+        return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
+
+def _json_scalar(value):
+    """Partition value as a JSON-friendly scalar (None for nulls)."""
+    import pandas as pd
 
-        if format == "csv":
-            return self.fmt.csv_bytes_to_df(data)
-        elif format == "json":
-            return self.fmt.json_bytes_to_df(data)
-        elif format == "parquet":
-            return self.fmt.parquet_bytes_to_df(data)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+    if pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value.item() if hasattr(value, "item") else value
@@ -0,0 +1,87 @@
+import json
+import logging
+import sys
+
+from src.common.logger.app_logger import AppLogger, JsonFormatter, RateLimitFilter, SamplingFilter
+
+
+# -------------------------------
+# Helpers
+# -------------------------------
+def make_record(msg, *args, level=logging.WARNING, **extra):
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_json_formatter_emits_valid_json_with_extras_and_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "it's page %s", (3,), sys.exc_info())
+    record.bucket = "raw"
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "it's page 3"
+    assert entry["level"] == "ERROR"
+    assert entry["bucket"] == "raw"
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_rate_limit_filter_suppresses_per_template_and_reports_count():
+    limiter = RateLimitFilter(rate=0.001, burst=2)
+
+    passed = [limiter.filter(make_record("Page %s returned no data.", page)) for page in range(10)]
+    other = limiter.filter(make_record("Rate limited: retrying in %.2fs...", 1.0))
+    error = limiter.filter(make_record("Page %s returned no data.", 11, level=logging.ERROR))
+
+    assert passed == [True, True] + [False] * 8
+    assert other and error
+    assert limiter.suppressed == 8
+
+    limiter.rate = 1e9  # refill immediately
+    record = make_record("Page %s returned no data.", 12)
+    assert limiter.filter(record)
+    assert record.suppressed == 8
+    assert "(8 similar messages suppressed)" in record.getMessage()
+
+
+
+def test_rate_limit_filter_accepts_unhashable_messages():
+    limiter = RateLimitFilter(rate=0.001, burst=1)
+
+    passed = [limiter.filter(make_record({"event": "page_empty", "page": 1})) for _ in range(3)]
+
+    assert passed == [True, False, False]
+    assert limiter.suppressed == 2
+
+def test_sampling_filter_keeps_warnings():
+    sampler = SamplingFilter(0.0)
+    assert not sampler.filter(make_record("debug", level=logging.DEBUG))
+    assert sampler.filter(make_record("warning", level=logging.WARNING))
+
+
+def test_async_handlers_write_json_lines_on_background_thread(tmp_path):
+    log_file = tmp_path / "logs" / "app.log"
+    app_logger = AppLogger("test_async_app_logger", async_handlers=True, log_file=str(log_file))
+    logger = app_logger.get_logger()
+    try:
+        try:
+            raise RuntimeError("upload failed")
+        except RuntimeError:
+            logger.error("Failed to upload %s", "a.csv", exc_info=True, extra={"bucket": "raw"})
+        logger.info("not written to the file")
+    finally:
+        app_logger.close()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["message"] == "Failed to upload a.csv"
+    assert entry["bucket"] == "raw"
+    assert "RuntimeError: upload failed" in entry["exception"]
+    assert not logger.handlers
@@ -0,0 +1,90 @@
+import logging
+
+import pandas as pd
+import pyarrow as pa
+
+from src.api.api_data_service import ApiDataService
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+# -------------------------------
+# Fake API client (no network)
+# -------------------------------
+class DriftingApiClient:
+    """Pages disagree: "score" is all-null on page 1, ints on page 2, floats on page 3."""
+
+    SCORES = {1: [None, None], 2: [1, 2], 3: [0.5, 1.5]}
+
+    def iterate_all_pages(self, limit=1000, max_in_flight=None):
+        for page, scores in self.SCORES.items():
+            data = [{"id": page * 10 + i, "score": score} for i, score in enumerate(scores)]
+            yield page, {"metadata": {"total_pages": len(self.SCORES)}, "data": data}
+
+
+def make_service():
+    logger = logging.getLogger("test_arrow_ingestion")
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("raw")
+    storage = StorageDataService(client, DataFormatService(), logger)
+    return storage, ApiDataService(DriftingApiClient(), storage, logger)
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_fetch_all_to_table_promotes_page_schemas():
+    _, service = make_service()
+    table = service.fetch_all_to_table()
+
+    assert table.num_rows == 6
+    assert table.column("score").num_chunks == 3
+    assert table.schema.field("score").type == pa.float64()
+    assert table.column("score").to_pylist() == [None, None, 1.0, 2.0, 0.5, 1.5]
+
+
+def test_fetch_all_to_df_arrow_engine_with_explicit_schema():
+    _, service = make_service()
+    schema = pa.schema([("id", pa.int32()), ("score", pa.float32())])
+
+    df = service.fetch_all_to_df(engine="arrow", schema=schema)
+
+    assert str(df["id"].dtype) == "int32"
+    assert str(df["score"].dtype) == "float32"
+    assert len(df) == 6
+
+
+def test_arrow_engine_writes_parquet_without_pandas():
+    storage, service = make_service()
+    service.fetch_all_to_storage("raw", "scores.parquet", format="parquet", engine="arrow")
+    service.fetch_all_to_storage("raw", "scores.csv", format="csv", engine="arrow", stream=True)
+
+    parquet = storage.download_df("raw", "scores.parquet", format="parquet")
+    csv = storage.download_df("raw", "scores.csv", format="csv")
+
+    assert parquet["score"].tolist()[2:] == [1.0, 2.0, 0.5, 1.5]
+    assert csv["id"].tolist() == [10, 11, 20, 21, 30, 31]
+    pd.testing.assert_series_equal(parquet["id"], csv["id"])
+
+
+def test_arrow_engine_stream_promotes_page_schemas():
+    storage, service = make_service()
+
+    for format in ("parquet", "feather"):
+        service.fetch_all_to_storage("raw", f"scores.{format}", format=format, engine="arrow", stream=True)
+
+        df = storage.download_df("raw", f"scores.{format}", format=format)
+        assert str(df["score"].dtype) == "float64"
+        assert df["score"].tolist()[2:] == [1.0, 2.0, 0.5, 1.5]
+
+
+def test_arrow_engine_stream_logs_unpromotable_pages(caplog):
+    storage, service = make_service()
+    service.api_client.SCORES = {1: [1, 2], 2: ["high", "low"]}
+
+    with caplog.at_level(logging.ERROR):
+        service.fetch_all_to_storage("raw", "bad.parquet", format="parquet", engine="arrow", stream=True)
+
+    assert "Failed to stream data to storage" in caplog.text
+    assert "bad.parquet" not in storage.storage.s3.buckets["raw"]
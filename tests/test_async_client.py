@@ -0,0 +1,111 @@
+import asyncio
+import logging
+
+from aiohttp import web
+
+from src.api.async_api_data_service import AsyncApiDataService
+from src.api.async_auth_client import AsyncAuthClient
+from src.api.async_unstable_api_client import AsyncUnstableAPIClient
+
+
+TOTAL_PAGES = 30
+PAGE_SIZE = 4
+FLAKY_PAGES = {5, 17}
+
+
+# -------------------------------
+# In-process fake API
+# -------------------------------
+def make_app(state):
+    async def login(request):
+        state["logins"] += 1
+        await asyncio.sleep(0.05)
+        return web.json_response({"access_token": "token", "expires_in": 3600})
+
+    async def data(request):
+        assert request.headers["Authorization"] == "Bearer token"
+        page = int(request.query["page"])
+        state["in_flight"] += 1
+        state["peak_in_flight"] = max(state["peak_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            if page in FLAKY_PAGES and page not in state["failed_once"]:
+                state["failed_once"].add(page)
+                return web.json_response({}, status=429, headers={"Retry-After": "0"})
+            return web.json_response({
+                "metadata": {"total_pages": TOTAL_PAGES},
+                "data": [{"id": f"{page}-{i}", "page": page} for i in range(PAGE_SIZE)],
+            })
+        finally:
+            state["in_flight"] -= 1
+
+    app = web.Application()
+    app.router.add_post("/login", login)
+    app.router.add_get("/data", data)
+    return app
+
+
+async def run_with_server(body):
+    state = {"logins": 0, "in_flight": 0, "peak_in_flight": 0, "failed_once": set()}
+    runner = web.AppRunner(make_app(state))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    logger = logging.getLogger("test_async_client")
+
+    try:
+        async with AsyncAuthClient(f"http://127.0.0.1:{port}/login", "user", "pass", logger) as auth:
+            async with AsyncUnstableAPIClient(f"http://127.0.0.1:{port}/data", auth, logger) as client:
+                await body(auth, client, state)
+    finally:
+        await runner.cleanup()
+    return state
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_concurrent_token_refresh_is_single_flight():
+    async def body(auth, client, state):
+        headers = await asyncio.gather(*(auth.get_auth_header() for _ in range(50)))
+        assert all(h == {"Authorization": "Bearer token"} for h in headers)
+
+    state = asyncio.run(run_with_server(body))
+    assert state["logins"] == 1
+
+
+def test_async_iterate_all_pages_ordered():
+    async def body(auth, client, state):
+        pages = [page async for page, _ in client.iterate_all_pages(limit=PAGE_SIZE, max_in_flight=10)]
+        assert pages == list(range(1, TOTAL_PAGES + 1))
+        assert client.successful_pages == TOTAL_PAGES
+        assert client.records_ingested == TOTAL_PAGES * PAGE_SIZE
+        assert client.retry_count == len(FLAKY_PAGES)
+
+    state = asyncio.run(run_with_server(body))
+    assert state["logins"] == 1
+    assert 1 < state["peak_in_flight"] <= 10
+
+
+def test_async_service_fetch_all_to_df():
+    async def body(auth, client, state):
+        service = AsyncApiDataService(client, storage_service=None, logger=logging.getLogger("test_async_client"))
+        df = await service.fetch_all_to_df(limit=PAGE_SIZE, max_in_flight=8)
+        assert len(df) == TOTAL_PAGES * PAGE_SIZE
+        assert df["page"].tolist() == sorted(df["page"].tolist())
+
+    asyncio.run(run_with_server(body))
+
+
+def test_closing_iterate_pages_early_leaves_no_pending_tasks():
+    async def body(auth, client, state):
+        pages = client.iterate_pages(range(1, TOTAL_PAGES + 1), limit=PAGE_SIZE, max_in_flight=8)
+        first, _ = await pages.__anext__()
+        await pages.aclose()
+
+        assert first == 1
+        fetches = [task for task in asyncio.all_tasks() if "fetch_page" in task.get_coro().__qualname__]
+        assert fetches == []
+
+    asyncio.run(run_with_server(body))
@@ -0,0 +1,146 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.api.auth_client import AuthClient
+from src.api.unstable_api_client import UnstableAPIClient
+
+
+# -------------------------------
+# Local auth + data server
+# -------------------------------
+class AuthState:
+    def __init__(self, expires_in=3600):
+        self.lock = threading.Lock()
+        self.logins = 0
+        self.expires_in = expires_in
+        self.revoked = set()
+        self.malformed_logins = 0   # logins answered without an access_token
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(0.05)
+            with state.lock:
+                if state.malformed_logins:
+                    state.malformed_logins -= 1
+                    self._send(200, {"error": "try again"})
+                    return
+                state.logins += 1
+                token = f"token-{state.logins}"
+            self._send(200, {"access_token": token, "expires_in": state.expires_in})
+
+        def do_GET(self):
+            token = self.headers["Authorization"].split(" ", 1)[1]
+            if token in state.revoked:
+                self._send(401, {"error": "invalid token"})
+                return
+            page = int(parse_qs(urlparse(self.path).query)["page"][0])
+            self._send(200, {"metadata": {"total_pages": 1}, "data": [{"page": page, "token": token}]})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(state):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_concurrent_get_token_logs_in_once():
+    state = AuthState()
+    server, url = serve(state)
+    try:
+        auth = AuthClient(f"{url}/login", "user", "pass", logging.getLogger("test_auth"))
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            tokens = set(pool.map(lambda _: auth.get_token(), range(32)))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert tokens == {"token-1"}
+    assert state.logins == 1
+
+
+def test_background_refresh_renews_before_expiry():
+    state = AuthState(expires_in=0.5)
+    server, url = serve(state)
+    try:
+        auth = AuthClient(
+            f"{url}/login", "user", "pass", logging.getLogger("test_auth"),
+            background_refresh=True, refresh_fraction=0.5
+        )
+        time.sleep(0.6)
+        auth.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert state.logins >= 2
+    assert auth.refresh_count == state.logins
+
+
+
+def test_background_refresh_survives_malformed_login_responses(caplog):
+    state = AuthState(expires_in=0.4)
+    server, url = serve(state)
+    try:
+        auth = AuthClient(
+            f"{url}/login", "user", "pass", logging.getLogger("test_auth"), refresh_fraction=0.25, retry_interval=0.05
+        )
+        auth.get_token()
+        state.malformed_logins = 2
+        with caplog.at_level(logging.WARNING, logger="test_auth"):
+            auth.start_background_refresh()
+            time.sleep(0.5)
+            alive = auth._refresh_thread.is_alive()
+            auth.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert alive
+    assert state.malformed_logins == 0 and state.logins >= 2
+    assert "Background token refresh failed (KeyError('access_token'))" in caplog.text
+
+
+def test_401_reauthenticates_and_retries_once():
+    state = AuthState()
+    server, url = serve(state)
+    logger = logging.getLogger("test_auth")
+    try:
+        auth = AuthClient(f"{url}/login", "user", "pass", logger)
+        client = UnstableAPIClient(f"{url}/data", auth, logger, max_retries=0)
+
+        assert auth.get_token() == "token-1"
+        state.revoked.add("token-1")
+        result = client.fetch_page(3)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert result["data"] == [{"page": 3, "token": "token-2"}]
+    assert state.logins == 2
+    assert client.retry_count == 0
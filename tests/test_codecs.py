@@ -0,0 +1,91 @@
+import logging
+
+import pandas as pd
+import pytest
+
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.codecs import Codec, CsvCodec, JsonCodec, ParquetCodec
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+FORMATS = ["csv", "csv.gz", "json", "ndjson", "ndjson.gz", "parquet", "parquet.zstd", "feather", "arrow"]
+
+
+def sample_df():
+    return pd.DataFrame({
+        "name": ["Alice", "Bob", "Charlie", None],
+        "age": [25, 30, 35, 40],
+        "score": [1.5, None, 3.25, 4.0],
+    })
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+@pytest.mark.parametrize("format", FORMATS)
+def test_codec_round_trip(format):
+    fmt = DataFormatService()
+    df = sample_df()
+
+    result = fmt.decode(fmt.encode(df, format), format)
+
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_streamed_encoding_matches_whole_frame(format):
+    fmt = DataFormatService()
+    df = sample_df()
+
+    data = b"".join(fmt.iter_bytes([df.iloc[:2], df.iloc[2:]], format))
+
+    pd.testing.assert_frame_equal(fmt.decode(data, format), df, check_dtype=False)
+
+
+def test_upload_sets_content_type_and_encoding():
+    logger = logging.getLogger("test_codecs")
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("data")
+    storage = StorageDataService(client, DataFormatService(), logger)
+
+    storage.upload_df(sample_df(), bucket="data", key="a.parquet", format="parquet")
+    storage.upload_df(sample_df(), bucket="data", key="a.csv.gz", format="csv.gz")
+    storage.upload_df(sample_df(), bucket="data", key="b.csv", format="csv", compression="gzip")
+
+    objects = client.s3.buckets["data"]
+    assert objects["a.parquet"]["ContentType"] == "application/vnd.apache.parquet"
+    assert "ContentEncoding" not in objects["a.parquet"]
+    assert objects["a.csv.gz"]["ContentEncoding"] == "gzip"
+    assert objects["b.csv"]["ContentType"] == "text/csv"
+    assert objects["b.csv"]["ContentEncoding"] == "gzip"
+    pd.testing.assert_frame_equal(storage.download_df("data", "b.csv", format="csv"), sample_df())
+
+
+def test_register_custom_codec():
+    fmt = DataFormatService(codecs=[ParquetCodec(name="parquet-raw", compression="none", use_dictionary=False)])
+
+    assert "parquet-raw" in fmt.codecs
+    assert len(fmt.encode(sample_df(), "parquet-raw")) > 0
+    with pytest.raises(ValueError):
+        fmt.get_codec("xml")
+
+
+def test_csv_bytes_match_pandas_text_output():
+    df = sample_df()
+    assert CsvCodec().encode(df) == df.to_csv(index=False).encode("utf-8")
+
+
+def test_fixed_format_helpers_work_on_the_class():
+    df = sample_df()
+
+    assert DataFormatService.df_to_csv_bytes(df) == DataFormatService().encode(df, "csv")
+    pd.testing.assert_frame_equal(DataFormatService.json_bytes_to_df(DataFormatService.df_to_json_bytes(df)), df)
+    data = b"".join(DataFormatService.iter_parquet_bytes([df.iloc[:2], df.iloc[2:]]))
+    pd.testing.assert_frame_equal(DataFormatService.parquet_bytes_to_df(data), df)
+
+
+def test_codec_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        Codec()
+    with pytest.raises(ValueError, match="json.br"):
+        JsonCodec(name="json.br", compression="br")
@@ -0,0 +1,89 @@
+import logging
+
+import pandas as pd
+
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+def make_service():
+    client = InMemoryS3Client(logging.getLogger("test_column_index"))
+    client.ensure_bucket("lake")
+    return StorageDataService(client, DataFormatService(), logging.getLogger("test_column_index"), maintain_index=True)
+
+
+def write_months(service):
+    for month in range(1, 7):
+        df = pd.DataFrame({
+            "day": pd.date_range(f"2024-{month:02d}-01", periods=3, freq="D"),
+            "amount": [month * 100.0 + i for i in range(3)],
+            "note": ["a", None, "c"],
+        })
+        service.upload_df(df, "lake", f"sales/2024-{month:02d}.parquet", format="parquet")
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_upload_df_maintains_index():
+    service = make_service()
+    write_months(service)
+
+    index = service.load_index("lake", "sales")
+    entry = index.objects["sales/2024-03.parquet"]
+
+    assert sorted(index.objects) == [f"sales/2024-{m:02d}.parquet" for m in range(1, 7)]
+    assert entry["rows"] == 3
+    assert entry["schema"]["amount"] == "float64"
+    assert entry["columns"]["amount"]["min"] == 300.0
+    assert entry["columns"]["note"]["null_count"] == 1
+
+    service.delete("lake", "sales/2024-03.parquet")
+    assert "sales/2024-03.parquet" not in service.load_index("lake", "sales").objects
+
+
+def test_query_prunes_objects_before_any_get():
+    service = make_service()
+    write_months(service)
+    gets = []
+    get_object = service.storage.s3.get_object
+    service.storage.s3.get_object = lambda **kwargs: gets.append(kwargs["Key"]) or get_object(**kwargs)
+
+    df = service.query("lake", "sales", filters=[("day", ">=", pd.Timestamp("2024-05-02"))], columns=["amount"])
+
+    assert df["amount"].tolist() == [501.0, 502.0, 600.0, 601.0, 602.0]
+    assert service.objects_pruned == 4
+    assert [key for key in gets if not key.endswith("_index.json")][:1] == ["sales/2024-05.parquet"]
+    assert not any(key.endswith(("01.parquet", "02.parquet", "03.parquet", "04.parquet")) for key in gets)
+
+
+def test_index_batch_writes_each_index_once():
+    service = make_service()
+    puts = []
+    put_object = service.storage.s3.put_object
+    service.storage.s3.put_object = lambda **kwargs: puts.append(kwargs["Key"]) or put_object(**kwargs)
+
+    with service.index_batch():
+        write_months(service)
+        assert service.load_index("lake", "sales").objects == {}
+
+    assert puts.count("sales/_index.json") == 1
+    assert len(service.load_index("lake", "sales").objects) == 6
+
+
+def test_stream_and_partitioned_uploads_are_indexed():
+    service = make_service()
+    frames = [pd.DataFrame({"amount": [5.0, None]}), pd.DataFrame({"amount": [1.0, 9.0]})]
+
+    service.upload_df_stream(iter(frames), "lake", "stream/all.parquet", format="parquet")
+    service.upload_partitioned(
+        pd.DataFrame({"region": ["eu", "eu", "us"], "amount": [1.0, 2.0, 3.0]}), "lake", "parts", ["region"]
+    )
+
+    entry = service.load_index("lake", "stream").objects["stream/all.parquet"]
+    assert entry["rows"] == 4
+    assert (entry["columns"]["amount"]["min"], entry["columns"]["amount"]["max"]) == (1.0, 9.0)
+    assert entry["columns"]["amount"]["null_count"] == 1
+    assert service.load_index("lake", "parts/region=eu").objects["parts/region=eu/part-00000.parquet"]["rows"] == 2
+    assert service.query("lake", "stream", filters=[("amount", ">", 8.0)])["amount"].tolist() == [9.0]
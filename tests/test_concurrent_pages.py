@@ -0,0 +1,58 @@
+import logging
+import random
+import time
+
+from src.api.unstable_api_client import UnstableAPIClient
+
+
+# -------------------------------
+# Fake client (no network)
+# -------------------------------
+class FakePagedClient(UnstableAPIClient):
+    """Serves TOTAL_PAGES pages with random latency; FAIL_PAGES return None."""
+
+    TOTAL_PAGES = 20
+    PAGE_SIZE = 3
+    FAIL_PAGES = {7, 13}
+
+    def fetch_page(self, page, limit=1000):
+        time.sleep(random.uniform(0, 0.01))
+        self._increment("retry_count")
+        if page in self.FAIL_PAGES:
+            return None
+        return {
+            "metadata": {"total_pages": self.TOTAL_PAGES},
+            "data": [{"id": f"{page}-{i}"} for i in range(self.PAGE_SIZE)],
+        }
+
+
+def make_client(**kwargs):
+    return FakePagedClient(
+        base_url="http://fake/data",
+        auth_client=None,
+        logger=logging.getLogger("test_concurrent_pages"),
+        **kwargs
+    )
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_concurrent_ordered_pages():
+    client = make_client(max_in_flight=6)
+    pages = [page for page, _ in client.iterate_all_pages(limit=3)]
+
+    assert pages == list(range(1, FakePagedClient.TOTAL_PAGES + 1))
+    assert client.failed_pages == len(FakePagedClient.FAIL_PAGES)
+    assert client.successful_pages == FakePagedClient.TOTAL_PAGES - len(FakePagedClient.FAIL_PAGES)
+    assert client.records_ingested == client.successful_pages * FakePagedClient.PAGE_SIZE
+    assert client.retry_count == FakePagedClient.TOTAL_PAGES
+
+
+def test_concurrent_completion_order_pages():
+    client = make_client()
+    results = dict(client.iterate_all_pages(limit=3, max_in_flight=8, ordered=False))
+
+    assert sorted(results) == list(range(1, FakePagedClient.TOTAL_PAGES + 1))
+    assert all(results[page] is None for page in FakePagedClient.FAIL_PAGES)
+    assert client.records_ingested == client.successful_pages * FakePagedClient.PAGE_SIZE
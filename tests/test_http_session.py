@@ -0,0 +1,47 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.api.http_session import PooledHTTPSession
+
+
+# -------------------------------
+# Local keep-alive server
+# -------------------------------
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"ok": True}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# -------------------------------
+# Test case
+# -------------------------------
+def test_pooled_session_reuses_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/data"
+        with PooledHTTPSession(pool_maxsize=1) as session:
+            for _ in range(5):
+                assert session.get(url, timeout=5).json() == {"ok": True}
+
+            stats = session.connection_stats()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 4
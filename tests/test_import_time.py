@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.import_time_benchmark import DEFERRED, measure_import
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+@pytest.mark.parametrize("module", sorted(DEFERRED))
+def test_cold_import_defers_heavy_packages(module):
+    result = measure_import(module)
+
+    assert not set(DEFERRED[module]) & set(result["imported"])
+
+
+def test_s3_client_is_created_on_first_use():
+    script = (
+        "import logging, sys\n"
+        "from src.storage.clients.minio_client import MinioClient\n"
+        "client = MinioClient(logging.getLogger('t'), access_key='a', secret_key='b', max_workers=32)\n"
+        "assert 'boto3' not in sys.modules\n"
+        "s3 = client.s3\n"
+        "assert 'boto3' in sys.modules and client.s3 is s3\n"
+        "assert s3.meta.endpoint_url == 'http://localhost:9000'\n"
+        "assert s3.meta.config.max_pool_connections == 32\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,76 @@
+import gzip
+import io
+
+import pandas as pd
+import pytest
+
+from src.common import json_backend
+from src.common.json_backend import get_json_backend, set_json_backend
+from src.storage.format.data_format_service import DataFormatService
+
+PAYLOAD = b'{"metadata": {"total_pages": 2}, "data": [{"id": 1, "name": "caf\\u00e9"}, {"id": 2, "name": null}]}'
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_backends_parse_bytes(name):
+    if name == "orjson":
+        pytest.importorskip("orjson")  # optional: the stdlib backend is the fallback
+    backend = get_json_backend(name)
+
+    parsed = backend.loads(PAYLOAD)
+
+    assert parsed["data"][0]["name"] == "café"
+    assert parsed["data"][1] == {"id": 2, "name": None}
+
+
+def test_default_backend_is_pluggable():
+    original = get_json_backend()
+    try:
+        set_json_backend("json")
+        assert json_backend.loads(b"[1, 2]") == [1, 2]
+        assert get_json_backend().name == "json"
+    finally:
+        set_json_backend(original)
+
+    with pytest.raises(ValueError):
+        get_json_backend("simdjson")
+
+
+def test_ndjson_streams_line_by_line():
+    fmt = DataFormatService()
+    codec = fmt.get_codec("ndjson.gz")
+    codec.lines_per_chunk = 7
+    df = pd.DataFrame({"id": range(25), "group": ["a", "b", "c", "d", "e"] * 5})
+
+    chunks = list(fmt.iter_bytes([df], "ndjson.gz"))
+    frames = list(fmt.read_df(io.BytesIO(b"".join(chunks)), "ndjson.gz", columns=["id"],
+                              filters=[("group", "=", "a")], chunksize=10))
+
+    assert len(gzip.decompress(b"".join(chunks)).splitlines()) == 25
+    assert [len(frame) for frame in frames] == [2, 2, 1]
+    assert pd.concat(frames)["id"].tolist() == [0, 5, 10, 15, 20]
+    assert list(frames[0].columns) == ["id"]
+
+
+@pytest.mark.parametrize("format", ["json", "ndjson", "ndjson.gz"])
+def test_json_codecs_round_trip_datetimes(format):
+    fmt = DataFormatService()
+    df = pd.DataFrame({
+        "id": [1, 2],
+        "created_at": pd.to_datetime(["2024-01-01 00:00:00", "2024-02-03 04:05:06"]).as_unit("ms"),
+    })
+    data = fmt.encode(df, format)
+
+    pd.testing.assert_frame_equal(fmt.decode(data, format), df)
+    if format.startswith("ndjson"):
+        frames = list(fmt.read_df(io.BytesIO(data), format, columns=["created_at"], chunksize=1))
+        pd.testing.assert_frame_equal(pd.concat(frames, ignore_index=True), df[["created_at"]])
+
+
+def test_json_codec_decodes_column_oriented_objects():
+    df = DataFormatService().decode(b'{"id": {"0": 1, "1": 2}, "name": {"0": "a", "1": "b"}}', "json")
+
+    assert df.to_dict("list") == {"id": [1, 2], "name": ["a", "b"]}
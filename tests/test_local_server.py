@@ -0,0 +1,62 @@
+import logging
+import threading
+
+import requests
+
+from benchmarks.api_load_test import run_scenario
+from dev.local_server import LocalApiServer
+from dev.unstable_api_simulator import SimulatorSettings
+from src.api.auth_client import AuthClient
+from src.api.unstable_api_client import UnstableAPIClient
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_client_fetches_every_page_through_simulated_failures():
+    settings = SimulatorSettings(total_pages=20, page_size=5, fail_rate_500=0.0, fail_rate_429=0.3)
+    logger = logging.getLogger("test_local_server")
+
+    with LocalApiServer(settings, retry_after=0.01) as server:
+        auth = AuthClient(server.auth_url, "test_user", "test_password", logger)
+        client = UnstableAPIClient(server.data_url, auth, logger, max_retries=20, max_in_flight=4)
+        pages = dict(client.iterate_all_pages(limit=5))
+        stats = server.stats()
+
+    assert sorted(pages) == list(range(1, 21))
+    assert all(len(result["data"]) == 5 for result in pages.values())
+    assert stats["requests"] == 20 + client.retry_count
+    assert stats["status_counts"].get(429, 0) == client.retry_count
+
+
+def test_connection_cap_rejects_with_retry_after():
+    settings = SimulatorSettings(total_pages=1, fail_rate_500=0.0, fail_rate_429=0.0)
+    with LocalApiServer(settings, latency=0.2, retry_after=1.5, max_connections=1) as server:
+        responses = []
+
+        def fetch():
+            responses.append(requests.get(server.data_url, headers={"Authorization": "Bearer t"}, params={"page": 1}))
+
+        threads = [threading.Thread(target=fetch) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200, 503, 503]
+    assert all(r.headers["Retry-After"] == "1.5" for r in responses if r.status_code == 503)
+    assert server.rejected == 2 and server.peak_connections == 1
+
+
+def test_load_test_reports_throughput_latency_and_waste():
+    result = run_scenario(
+        "throttled", {"fail_rate_429": 0.2, "retry_after": 0.01}, pages=10, page_size=10, latency=0.0,
+        max_in_flight=2,
+    )
+
+    assert result["rows"] == 100
+    assert result["pages_per_sec"] > 0
+    assert result["p50_ms"] <= result["p99_ms"]
+    assert result["wasted_requests"] == result["retries"]
+    assert result["peak_mb"] > 0
@@ -0,0 +1,127 @@
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from src.api.unstable_api_client import UnstableAPIClient
+from src.common.metrics import InMemorySink, JsonLinesSink, Metrics, PrometheusTextSink
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+# -------------------------------
+# Fakes
+# -------------------------------
+class StaticAuth:
+    def get_token(self):
+        return "token"
+
+
+def serve(responses):
+    """Serve the given (status, headers) responses in order, then 200s."""
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            with lock:
+                status, headers = responses.pop(0) if responses else (200, {})
+            body = json.dumps({"metadata": {"total_pages": 1}, "data": [{"id": 1}]}).encode("utf-8")
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_nested_spans_share_trace_and_feed_histograms():
+    sink = InMemorySink()
+    metrics = Metrics(sinks=[sink])
+
+    with metrics.span("ingest", attributes={"key": "a.csv"}) as outer:
+        with metrics.span("encode", format="csv"):
+            pass
+
+    encode, ingest = sink.events
+    assert ingest["name"] == "ingest" and ingest["parent_id"] is None
+    assert encode["trace_id"] == outer.trace_id
+    assert encode["parent_id"] == outer.span_id
+    assert encode["labels"] == {"format": "csv"}
+    assert metrics.histogram("encode_seconds", format="csv").count == 1
+
+
+def test_prometheus_and_json_lines_sinks(tmp_path):
+    metrics = Metrics(buckets=(0.1, 1.0))
+    prom = metrics.add_sink(PrometheusTextSink(tmp_path / "metrics.prom", prefix="de_"))
+    lines = metrics.add_sink(JsonLinesSink(tmp_path / "spans.jsonl"))
+
+    metrics.increment("http_retries_total", reason="429")
+    metrics.increment("http_retries_total", reason="429")
+    metrics.observe("s3_request_seconds", 0.5, operation="put_object")
+    with metrics.span("upload"):
+        pass
+    metrics.flush()
+    lines.close()
+
+    text = (tmp_path / "metrics.prom").read_text()
+    assert "# TYPE de_http_retries_total counter" in text
+    assert 'de_http_retries_total{reason="429"} 2' in text
+    assert 'de_s3_request_seconds_bucket{operation="put_object",le="0.1"} 0' in text
+    assert 'de_s3_request_seconds_bucket{operation="put_object",le="1.0"} 1' in text
+    assert 'de_s3_request_seconds_count{operation="put_object"} 1' in text
+    assert prom.path.exists()
+
+    events = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert [event["type"] for event in events] == ["span", "snapshot"]
+    assert events[0]["name"] == "upload"
+
+
+def test_client_records_retries_backoff_and_latency():
+    server, url = serve([(429, {"Retry-After": "0.05"}), (503, {"Retry-After": "0.05"})])
+    metrics = Metrics(sinks=[InMemorySink()])
+    try:
+        client = UnstableAPIClient(url, StaticAuth(), logging.getLogger("test_metrics"), metrics=metrics)
+        result = client.fetch_page(1)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert result["data"] == [{"id": 1}]
+    assert metrics.counter_value("http_retries_total", client="api", reason="429") == 1
+    assert metrics.counter_value("http_retries_total", client="api", reason="503") == 1
+    assert abs(metrics.counter_value("backoff_sleep_seconds_total", client="api") - 0.1) < 1e-9
+    assert metrics.histogram("http_request_seconds", client="api", status=200).count == 1
+    assert metrics.histogram("page_fetch_seconds").count == 1
+
+
+def test_storage_round_trip_records_spans_and_bytes():
+    logger = logging.getLogger("test_metrics")
+    metrics = Metrics()
+    client = InMemoryS3Client(logger, metrics=metrics)
+    client.ensure_bucket("bucket")
+    service = StorageDataService(client, DataFormatService(metrics=metrics), logger, metrics=metrics)
+
+    service.upload_df(pd.DataFrame({"a": [1, 2, 3]}), "bucket", "data.csv", format="csv")
+    service.download_df("bucket", "data.csv", format="csv")
+
+    assert metrics.histogram("encode_seconds", format="csv").count == 1
+    assert metrics.histogram("upload_seconds").count == 1
+    assert metrics.histogram("decode_seconds", format="csv").count == 1
+    assert metrics.histogram("s3_request_seconds", operation="put_object").count == 1
+    uploaded = metrics.counter_value("s3_bytes_uploaded_total")
+    assert uploaded > 0 and metrics.counter_value("s3_bytes_downloaded_total") == uploaded
@@ -0,0 +1,56 @@
+import logging
+
+import pandas as pd
+
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+def make_service():
+    client = InMemoryS3Client(logging.getLogger("test_multi_object_reads"))
+    client.ensure_bucket("lake")
+    return StorageDataService(client, DataFormatService(), logging.getLogger("test_multi_object_reads"))
+
+
+def write_parts(service, parts=12, rows=5):
+    for part in range(parts):
+        df = pd.DataFrame({"part": [part] * rows, "value": range(part * rows, (part + 1) * rows)})
+        service.upload_df(df, "lake", f"events/part-{part:04d}.parquet", format="parquet")
+    service.upload_df(pd.DataFrame({"x": [1]}), "lake", "other/part-0000.parquet", format="parquet")
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_list_objects_follows_continuation_tokens():
+    service = make_service()
+    write_parts(service)
+
+    keys = [obj["Key"] for obj in service.storage.list_objects("lake", "events/", page_size=5)]
+
+    assert keys == [f"events/part-{part:04d}.parquet" for part in range(12)]
+
+
+def test_read_prefix_concatenates_in_key_order():
+    service = make_service()
+    write_parts(service)
+
+    df = service.read_prefix("lake", "events/", format="parquet", download_workers=4, decode_workers=2)
+
+    assert len(df) == 60
+    assert df["value"].tolist() == list(range(60))
+
+
+def test_download_many_lazy_with_pruning():
+    service = make_service()
+    write_parts(service, parts=4)
+    keys = [f"events/part-{part:04d}.parquet" for part in range(4)]
+
+    frames = service.download_many("lake", keys, format="parquet", columns=["value"],
+                                   filters=[("value", ">=", 12)], lazy=True)
+    results = list(frames)
+
+    assert [key for key, _ in results] == keys
+    assert list(results[3][1].columns) == ["value"]
+    assert pd.concat([df for _, df in results])["value"].tolist() == list(range(12, 20))
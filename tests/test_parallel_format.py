@@ -0,0 +1,113 @@
+import io
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.common.metrics import Metrics
+from src.storage.format.codecs import line_ranges
+from src.storage.format.data_format_service import DataFormatService
+
+FORMATS = ["csv", "csv.gz", "json", "ndjson", "ndjson.gz", "parquet", "feather"]
+# Identical bytes to a single-process encode (gzip output is several members)
+SAME_BYTES = ["csv", "json", "ndjson"]
+
+
+def sample_df(rows=3000):
+    return pd.DataFrame({
+        "id": range(rows),
+        "name": [f"user-{i}" if i % 11 else None for i in range(rows)],
+        "score": [i / 4 for i in range(rows)],
+        # quoted fields with commas, quotes and newlines must not be split
+        "note": ['said "hi",\nthen left' if i % 7 == 0 else "plain" for i in range(rows)],
+    })
+
+
+@pytest.fixture(scope="module")
+def parallel():
+    fmt = DataFormatService(processes=3, parallel_min_rows=100, parallel_min_bytes=1024, metrics=Metrics())
+    yield fmt
+    fmt.close()
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+@pytest.mark.parametrize("format", FORMATS)
+def test_parallel_round_trip_matches_serial(parallel, format):
+    serial = DataFormatService()
+    df = sample_df()
+
+    data = parallel.encode(df, format)
+
+    if format in SAME_BYTES:
+        assert data == serial.encode(df, format)
+    pd.testing.assert_frame_equal(parallel.decode(data, format), serial.decode(serial.encode(df, format), format))
+
+
+def test_slices_are_counted(parallel):
+    before = parallel.metrics.counter_value("format_slices_total", operation="decode", format="csv")
+
+    parallel.decode(parallel.encode(sample_df(), "csv"), "csv")
+
+    assert parallel.metrics.counter_value("format_slices_total", operation="encode", format="csv") >= 3
+    assert parallel.metrics.counter_value("format_slices_total", operation="decode", format="csv") == before + 3
+
+
+def test_parquet_slices_become_row_groups(parallel):
+    data = parallel.encode(sample_df(), "parquet")
+
+    assert pq.ParquetFile(io.BytesIO(data)).metadata.num_row_groups == 3
+
+
+
+@pytest.mark.parametrize("format", ["parquet", "feather"])
+def test_columnar_slices_share_one_schema(parallel, format):
+    df = pd.DataFrame({"v": [None] * 150 + [1] * 150}, dtype=object)
+
+    data = parallel.encode(df, format)
+
+    pd.testing.assert_frame_equal(parallel.decode(data, format), DataFormatService().decode(
+        DataFormatService().encode(df, format), format))
+    if format == "parquet":
+        assert pq.ParquetFile(io.BytesIO(data)).metadata.num_row_groups == 3
+
+def test_small_inputs_stay_in_process():
+    fmt = DataFormatService(processes=2, metrics=Metrics())
+
+    fmt.decode(fmt.encode(sample_df(50), "csv"), "csv")
+
+    assert fmt.slices._pool is None
+    assert fmt.metrics.counter_value("format_slices_total", operation="encode", format="csv") == 0
+
+
+def test_mixed_object_columns_fall_back_to_pickle(parallel):
+    df = pd.DataFrame({"value": [1, "a", 2.5, None] * 100})
+
+    data = parallel.encode(df, "json")
+
+    assert data == DataFormatService().encode(df, "json")
+
+
+
+def test_parallel_decode_matches_serial_when_slices_infer_different_dtypes(parallel):
+    df = pd.DataFrame({
+        "zip": ["01234"] * 299 + ["A1234"],         # int64 slices, then a str slice
+        "code": ["X1"] + ["00042"] * 299,           # str slice, then int64 slices
+        "amount": [1] * 299 + [None],               # int64 slices, then float64
+    })
+    data = DataFormatService().encode(df, "csv")
+
+    result = parallel.decode(data, "csv")
+
+    pd.testing.assert_frame_equal(result, DataFormatService().decode(data, "csv"))
+    assert result["zip"].iloc[0] == "01234" and result["code"].iloc[-1] == "00042"
+    assert parallel.metrics.counter_value("format_slice_reparses_total", operation="decode", format="csv") >= 1
+
+def test_line_ranges_respect_quoted_newlines():
+    data = b'a,b\n1,"x\ny"\n2,"p""\nq"\n3,z\n'
+
+    ranges = line_ranges(data, 4, 8, quote=b'"')
+
+    assert b"".join(data[start:stop] for start, stop in ranges) == data[4:]
+    assert [data[start:stop] for start, stop in ranges] == [b'1,"x\ny"\n', b'2,"p""\nq"\n', b"3,z\n"]
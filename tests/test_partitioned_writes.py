@@ -0,0 +1,77 @@
+import logging
+
+import pandas as pd
+
+from src.common.metrics import Metrics
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+def make_service():
+    client = InMemoryS3Client(logging.getLogger("test_partitioned_writes"))
+    client.ensure_bucket("lake")
+    return StorageDataService(client, DataFormatService(), logging.getLogger("test_partitioned_writes"))
+
+
+def make_frame():
+    return pd.DataFrame({
+        "country": ["US", "US", "CA", "CA", "US", "FR"] * 5,
+        "year": [2023, 2024, 2023, 2024, 2024, 2024] * 5,
+        "amount": [float(i) for i in range(30)],
+    })
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_upload_partitioned_writes_hive_layout_and_manifest():
+    service = make_service()
+    manifest = service.upload_partitioned(
+        make_frame(), "lake", "sales", ["country", "year"], format="parquet", max_rows_per_file=4
+    )
+
+    keys = [entry["key"] for entry in manifest["files"]]
+    assert "sales/country=US/year=2024/part-00000.parquet" in keys
+    assert "sales/country=US/year=2024/part-00002.parquet" in keys  # 10 rows, 4 per file
+    assert sum(entry["rows"] for entry in manifest["files"]) == 30
+    assert set(service.storage.s3.buckets["lake"]) == set(keys) | {"sales/_manifest.json"}
+
+    first = service.download_df("lake", keys[0], format="parquet")
+    assert list(first.columns) == ["amount"]
+    assert service.read_manifest("lake", "sales") == manifest
+
+
+def test_read_partitioned_skips_files_that_cannot_match():
+    service = make_service()
+    service.upload_partitioned(make_frame(), "lake", "sales", ["country"], format="csv", max_rows_per_file=5)
+    gets = []
+    get_object = service.storage.s3.get_object
+    service.storage.s3.get_object = lambda **kwargs: gets.append(kwargs["Key"]) or get_object(**kwargs)
+
+    df = service.read_partitioned(
+        "lake", "sales", columns=["country", "amount"],
+        filters=[("country", "=", "US"), ("amount", ">=", 20)]
+    )
+
+    expected = make_frame().query("country == 'US' and amount >= 20")
+    assert df["amount"].tolist() == expected["amount"].tolist()
+    assert set(df["country"]) == {"US"}
+    # manifest + the one US file whose amount range reaches 20 (of 7 files)
+    assert gets == ["sales/_manifest.json", "sales/country=US/part-00002.csv"]
+
+
+def test_upload_partitioned_encodes_through_the_format_service():
+    client = InMemoryS3Client(logging.getLogger("test_partitioned_writes"))
+    client.ensure_bucket("lake")
+    metrics = Metrics()
+    fmt = DataFormatService(processes=2, parallel_min_rows=5, parallel_min_bytes=1024, metrics=metrics)
+    service = StorageDataService(client, fmt, logging.getLogger("test_partitioned_writes"), metrics=metrics)
+    try:
+        manifest = service.upload_partitioned(make_frame(), "lake", "sales", ["country"], format="csv")
+    finally:
+        fmt.close()
+
+    assert metrics.histogram("encode_seconds", format="csv").count == len(manifest["files"]) == 3
+    assert metrics.histogram("upload_seconds").count == 3
+    assert metrics.counter_value("format_slices_total", operation="encode", format="csv") == 6
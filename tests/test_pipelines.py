@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from src.common.metrics import Metrics
+from src.pipelines.api_to_storage import ApiToStoragePipeline
+from src.pipelines.pipeline import Pipeline, Stage
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+logger = logging.getLogger("test_pipelines")
+
+
+# -------------------------------
+# Fake API client (no network)
+# -------------------------------
+class FakeApiClient:
+    def __init__(self, total_pages=12, page_size=50, failing=(), delay=0.0):
+        self.total_pages = total_pages
+        self.page_size = page_size
+        self.failing = set(failing)
+        self.delay = delay
+
+    def fetch_page(self, page, limit=1000):
+        time.sleep(self.delay)
+        if page in self.failing:
+            return None
+        data = [{"id": f"{page}-{i}", "page": page, "value": i} for i in range(self.page_size)]
+        return {"metadata": {"total_pages": self.total_pages}, "data": data}
+
+
+def sleeper(seconds, func=lambda item: item):
+    def run(item):
+        time.sleep(seconds)
+        return func(item)
+    return run
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_stages_transform_drop_and_fan_out():
+    pipeline = Pipeline([
+        Stage("double", lambda x: x * 2, workers=3),
+        Stage("odd_tens", lambda x: None if x % 20 == 0 else x, workers=2),
+        Stage("split", lambda x: [x, -x], workers=2, fan_out=True),
+    ], logger)
+
+    results = sorted(pipeline.run(range(1, 21)))
+
+    expected = [x * 2 for x in range(1, 21) if (x * 2) % 20 != 0]
+    assert results == sorted(expected + [-x for x in expected])
+    stats = {s["stage"]: s for s in pipeline.stats()}
+    assert stats["double"]["items_in"] == 20
+    assert stats["odd_tens"]["dropped"] == 2
+    assert stats["split"]["items_out"] == 36
+
+
+def test_stages_overlap():
+    pipeline = Pipeline([
+        Stage("fetch", sleeper(0.05), workers=4),
+        Stage("upload", sleeper(0.05), workers=4),
+    ], logger)
+
+    assert len(list(pipeline.run(range(16)))) == 16
+
+    # uploads start while later items are still being fetched
+    fetch, upload = pipeline.stats()
+    assert 0 < upload["first_item_at"] < fetch["last_item_at"] < upload["last_item_at"]
+
+
+def test_backpressure_bounds_buffering_and_reveals_bottleneck():
+    produced = []
+    in_flight = []
+    lock = threading.Lock()
+
+    def source():
+        for i in range(30):
+            with lock:
+                produced.append(i)
+            yield i
+
+    def slow(item):
+        with lock:
+            in_flight.append(len(produced) - item)
+        time.sleep(0.01)
+        return item
+
+    pipeline = Pipeline([
+        Stage("fast", lambda x: x, workers=2, queue_size=2),
+        Stage("slow", slow, workers=1, queue_size=2),
+    ], logger, sample_interval=0.005)
+    assert len(list(pipeline.run(source()))) == 30
+
+    stats = {s["stage"]: s for s in pipeline.stats()}
+    # queues (2 + 2) + fast workers (2) + the item being fed
+    assert max(in_flight) <= 8
+    assert pipeline.bottleneck() == "slow"
+    assert stats["slow"]["queue_max"] == 2
+    assert stats["fast"]["blocked_seconds"] > stats["slow"]["blocked_seconds"]
+
+
+def test_stage_error_stops_pipeline_and_is_raised():
+    def fail(item):
+        if item == 5:
+            raise RuntimeError("bad item")
+        return item
+
+    pipeline = Pipeline([Stage("fail", fail, workers=2), Stage("sink", sleeper(0.01))], logger)
+
+    with pytest.raises(RuntimeError, match="bad item"):
+        list(pipeline.run(range(1000)))
+    assert pipeline.stats()[1]["items_in"] < 1000
+
+
+def test_api_to_storage_pipeline_writes_one_part_per_page():
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("raw")
+    storage = StorageDataService(client, DataFormatService(), logger)
+    ingest = ApiToStoragePipeline(FakeApiClient(failing={7}, delay=0.01), storage, logger, queue_size=4)
+
+    keys = ingest.run("raw", "events", format="parquet", limit=50)
+
+    assert len(keys) == 11 and keys[0] == "events/part-000001.parquet"
+    assert ingest.failed_pages == [7]
+    df = storage.read_prefix("raw", "events", format="parquet")
+    assert len(df) == 11 * 50
+    assert sorted(df["page"].unique()) == [p for p in range(1, 13) if p != 7]
+    assert [s["stage"] for s in ingest.stats()] == ["fetch", "transform", "upload"]
+
+
+def test_api_to_storage_pipeline_uploads_through_the_storage_service():
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("raw")
+    metrics = Metrics()
+    storage = StorageDataService(client, DataFormatService(), logger, maintain_index=True, metrics=metrics)
+    index_puts = []
+    upload_bytes = client.upload_bytes
+
+    def counting_upload_bytes(bucket, key, data, **kwargs):
+        if key.endswith("_index.json"):
+            index_puts.append(key)
+        return upload_bytes(bucket, key, data, **kwargs)
+
+    client.upload_bytes = counting_upload_bytes
+    keys = ApiToStoragePipeline(FakeApiClient(total_pages=5), storage, logger).run("raw", "events", format="parquet")
+
+    assert index_puts == ["events/_index.json"]
+    assert sorted(storage.load_index("raw", "events").objects) == keys
+    assert metrics.histogram("upload_seconds").count == 5
@@ -0,0 +1,189 @@
+import csv
+import io
+import logging
+import threading
+from contextlib import contextmanager
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.loaders.postgres_loader import PostgresLoader, pg_type, upsert_sql
+from src.storage.services.storage_data_service import StorageDataService
+
+
+# -------------------------------
+# Fake psycopg pool (records statements and COPY payloads)
+# -------------------------------
+class FakeCopy:
+    def __init__(self, sql):
+        self.sql = sql
+        self.types = None
+        self.data = b""
+        self.rows = []
+
+    def set_types(self, types):
+        self.types = types
+
+    def write(self, data):
+        self.data += data
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+        self.statements = []
+        self.copies = []
+        self.description = None
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        if sql.startswith("CREATE TEMP TABLE"):
+            # staging tables take the target table's column types
+            staging, target = sql.split(" ")[3], sql.split(" ")[5]
+            self.pool.staged[staging.strip('"')] = target.strip('"')
+        elif sql.endswith(" LIMIT 0"):
+            select, table = sql[len("SELECT "):-len(" LIMIT 0")].split(" FROM ")
+            table = table.strip('"')
+            types = self.pool.tables.get(self.pool.staged.get(table, table), {})
+            names = [name.strip('"') for name in select.split(", ")]
+            self.description = [SimpleNamespace(name=name, type_code=types.get(name, 20)) for name in names]
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    @contextmanager
+    def copy(self, sql):
+        copy = FakeCopy(sql)
+        self.copies.append(copy)
+        yield copy
+
+
+class FakePool:
+    def __init__(self, tables=None):
+        self.tables = tables or {}   # table -> {column: type OID}, int8 (20) otherwise
+        self.staged = {}
+        self.lock = threading.Lock()
+        self.connections = []
+        self.active = 0
+        self.peak = 0
+
+    @contextmanager
+    def connection(self):
+        conn = FakeConnection(self)
+        with self.lock:
+            self.connections.append(conn)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            yield conn
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def make_loader(tables=None, **kwargs):
+    pool = FakePool(tables)
+    return pool, PostgresLoader(logging.getLogger("test_postgres_loader"), pool=pool, **kwargs)
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_csv_copy_streams_chunks_with_null_marker():
+    pool, loader = make_loader(chunk_rows=2)
+    frames = [pd.DataFrame({"id": [1, 2, 3], "name": ["a", "", None]}), pd.DataFrame({"id": [4], "name": ["d"]})]
+
+    rows = loader.load(iter(frames), "public.users", format="csv")
+
+    (conn,) = pool.connections
+    (copy,) = conn.copies
+    assert rows == 4 and loader.rows_loaded == 4
+    assert copy.sql == 'COPY "public"."users" ("id", "name") FROM STDIN (FORMAT CSV, NULL \'\\N\')'
+    assert list(csv.reader(io.StringIO(copy.data.decode()))) == [["1", "a"], ["2", ""], ["3", "\\N"], ["4", "d"]]
+
+
+def test_binary_copy_sends_typed_rows_with_nulls():
+    pool, loader = make_loader({"sales": {"id": 20, "amount": 701, "day": 1114, "code": 25}})
+    df = pd.DataFrame({
+        "id": pd.array([1, None], dtype="Int64"),
+        "amount": [1.5, float("nan")],
+        "day": pd.to_datetime(["2024-01-01", None]),
+        "code": [7, "x"],
+    })
+
+    loader.load(df, "sales")
+
+    (copy,) = pool.connections[0].copies
+    assert copy.types == [20, 701, 1114, 25]
+    assert copy.rows[0] == (1, 1.5, pd.Timestamp("2024-01-01"), "7")
+    assert copy.rows[1] == (None, None, None, "x")
+
+
+def test_upsert_stages_then_merges_in_one_transaction():
+    pool, loader = make_loader()
+
+    loader.load(pd.DataFrame({"id": [1], "name": ["a"]}), "users", upsert_keys=["id"])
+
+    (conn,) = pool.connections
+    create, probe, merge = conn.statements
+    staging = conn.copies[0].sql.split('"')[1]
+    assert create == f'CREATE TEMP TABLE "{staging}" (LIKE "users" INCLUDING DEFAULTS) ON COMMIT DROP'
+    assert probe == f'SELECT "id", "name" FROM "{staging}" LIMIT 0'
+    assert merge == upsert_sql("users", staging, ["id", "name"], ["id"])
+    assert 'SELECT DISTINCT ON ("id") "id", "name"' in merge
+    assert 'ORDER BY "id", ctid DESC' in merge
+    assert merge.endswith('ON CONFLICT ("id") DO UPDATE SET "name" = EXCLUDED."name"')
+
+
+def test_binary_copy_types_come_from_the_target_table():
+    pool, loader = make_loader({"users": {"id": 23, "zip": 1043}})
+
+    loader.load(pd.DataFrame({"id": [1, 2], "zip": [1234, 5678]}), "users", upsert_keys=["id"])
+
+    (copy,) = pool.connections[0].copies
+    assert copy.types == [23, 1043]
+    assert copy.rows == [(1, "1234"), (2, "5678")]
+
+
+def test_partitions_load_in_parallel_on_separate_connections():
+    pool, loader = make_loader(max_connections=3)
+    df = pd.DataFrame({"region": ["eu", "us", "eu", "ap"], "value": [1, 2, 3, 4]})
+
+    loaded = loader.load_partitioned(df, "facts", ["region"])
+
+    assert loaded == {("ap",): 1, ("eu",): 2, ("us",): 1}
+    assert len(pool.connections) == 3
+    assert sum(len(copy.rows) for conn in pool.connections for copy in conn.copies) == 4
+
+
+def test_load_objects_streams_stored_chunks():
+    logger = logging.getLogger("test_postgres_loader")
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("raw")
+    storage = StorageDataService(client, DataFormatService(), logger)
+    for i in range(2):
+        storage.upload_df(pd.DataFrame({"id": range(i * 5, i * 5 + 5)}), "raw", f"ids/part-{i}.csv", format="csv")
+    pool, loader = make_loader()
+
+    loaded = loader.load_objects(storage, "raw", ["ids/part-0.csv", "ids/part-1.csv"], "ids", chunksize=2)
+
+    assert loaded == {"ids/part-0.csv": 5, "ids/part-1.csv": 5}
+    assert sorted(row[0] for conn in pool.connections for row in conn.copies[0].rows) == list(range(10))
+
+
+def test_pg_type_and_format_validation():
+    assert pg_type(pd.Series([1], dtype="uint32").dtype) == "int8"
+    assert pg_type(pd.Series([1], dtype="int16").dtype) == "int2"
+    assert pg_type(pd.Series([True]).dtype) == "bool"
+    assert pg_type(pd.to_datetime(["2024-01-01"]).tz_localize("UTC").dtype) == "timestamptz"
+    _, loader = make_loader()
+    with pytest.raises(ValueError, match="Unsupported COPY format"):
+        loader.load(pd.DataFrame({"a": [1]}), "t", format="text")
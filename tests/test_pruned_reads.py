@@ -0,0 +1,83 @@
+import io
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+def make_storage():
+    logger = logging.getLogger("test_pruned_reads")
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("data")
+    return client, StorageDataService(client, DataFormatService(), logger)
+
+
+def wide_frame(rows=20000, width=20):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"c{i}": rng.random(rows) for i in range(width)})
+    df.insert(0, "id", np.arange(rows))
+    return df
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_parquet_reads_only_needed_row_groups_and_columns():
+    client, storage = make_storage()
+    df = wide_frame()
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer, row_group_size=2000)
+    client.upload_bytes("data", "wide.parquet", buffer.getvalue())
+
+    filters = [("id", ">=", 18000)]
+    result = storage.download_df("data", "wide.parquet", format="parquet", columns=["id", "c3"], filters=filters)
+
+    expected = df[df["id"] >= 18000][["id", "c3"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+    reader = client.open_ranged("data", "wide.parquet")
+    DataFormatService.read_parquet(reader, columns=["id", "c3"], filters=filters)
+    assert reader.bytes_fetched < reader.size / 4
+
+
+def test_parquet_chunks():
+    client, storage = make_storage()
+    df = wide_frame(rows=5000, width=3)
+    client.upload_bytes("data", "small.parquet", DataFormatService.df_to_parquet_bytes(df))
+
+    chunks = list(storage.download_df("data", "small.parquet", format="parquet", chunksize=1000))
+
+    assert len(chunks) == 5
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+
+def test_csv_lazy_chunks_with_columns_and_filters():
+    client, storage = make_storage()
+    df = wide_frame(rows=5000, width=5)
+    storage.upload_df(df, bucket="data", key="wide.csv", format="csv")
+
+    chunks = storage.download_df(
+        "data", "wide.csv", format="csv", columns=["c1"], filters=[("id", "<", 2500)], chunksize=1000
+    )
+    result = pd.concat(chunks, ignore_index=True)
+
+    assert list(result.columns) == ["c1"]
+    assert len(result) == 2500
+
+
+def test_json_columns_and_or_filters():
+    client, storage = make_storage()
+    df = pd.DataFrame({"name": ["a", "b", "c", "d"], "age": [10, 20, 30, 40]})
+    storage.upload_df(df, bucket="data", key="people.json", format="json")
+
+    result = storage.download_df(
+        "data", "people.json", format="json", columns=["name"], filters=[[("age", "<", 15)], [("age", ">", 35)]]
+    )
+
+    assert result["name"].tolist() == ["a", "d"]
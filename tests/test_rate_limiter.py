@@ -0,0 +1,58 @@
+import threading
+import time
+
+from src.api.rate_limiter import AdaptiveRateLimiter, get_shared_limiter, parse_retry_after
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_token_bucket_paces_requests():
+    limiter = AdaptiveRateLimiter(rate=50, burst=1)
+
+    start = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.18
+    assert limiter.acquired == 11
+
+
+def test_aimd_adjusts_rate():
+    limiter = AdaptiveRateLimiter(rate=20, cooldown=60)
+
+    limiter.on_throttle()
+    limiter.on_throttle()  # same congestion event: only one decrease
+    assert limiter.current_rate == 10
+
+    for _ in range(10):
+        limiter.on_success()
+    assert 10 < limiter.current_rate < 12
+
+
+def test_retry_after_pauses_all_callers():
+    limiter = AdaptiveRateLimiter(rate=1000)
+    limiter.on_throttle(retry_after=0.2)
+    waits = []
+
+    def worker():
+        waits.append(limiter.acquire())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    assert limiter.queue_depth == 4
+    for thread in threads:
+        thread.join()
+
+    assert min(waits) >= 0.1
+    assert limiter.queue_depth == 0
+
+
+def test_shared_limiter_and_retry_after_parsing():
+    assert get_shared_limiter("api.example.com", rate=5) is get_shared_limiter("api.example.com")
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after(None) is None
@@ -0,0 +1,117 @@
+import logging
+
+import pandas as pd
+
+from src.api.api_data_service import ApiDataService
+from src.api.checkpoint_store import LocalCheckpointStore, S3CheckpointStore
+from src.api.unstable_api_client import UnstableAPIClient
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+# -------------------------------
+# Fake client (no network)
+# -------------------------------
+class FlakyPagedClient(UnstableAPIClient):
+    """Serves TOTAL_PAGES pages; pages in fail_pages return None (retries exhausted)."""
+
+    TOTAL_PAGES = 12
+
+    def __init__(self, fail_pages=(), **kwargs):
+        super().__init__(base_url="http://fake/data", auth_client=None, logger=logging.getLogger("test"), **kwargs)
+        self.fail_pages = set(fail_pages)
+        self.requested = []
+
+    def fetch_page(self, page, limit=1000):
+        self.requested.append(page)
+        if page in self.fail_pages:
+            return None
+        return {
+            "metadata": {"total_pages": self.TOTAL_PAGES},
+            "data": [{"id": page * 100 + i, "page": page} for i in range(limit)],
+        }
+
+
+def make_service(api_client, client):
+    storage = StorageDataService(client, DataFormatService(), client.logger)
+    return ApiDataService(api_client, storage, client.logger)
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_rerun_only_fetches_missing_pages(tmp_path):
+    client = InMemoryS3Client(logging.getLogger("test_resumable_ingestion"))
+    client.ensure_bucket("raw")
+    store = LocalCheckpointStore(tmp_path / "checkpoint.json")
+
+    first_client = FlakyPagedClient(fail_pages={4, 9}, max_in_flight=4)
+    checkpoint = make_service(first_client, client).fetch_all_to_storage_resumable(
+        "raw", "events.parquet", store, limit=5
+    )
+    assert checkpoint.failed == {4, 9}
+    assert not checkpoint.compacted
+    assert not client.exists("raw", "events.parquet")
+
+    second_client = FlakyPagedClient()
+    checkpoint = make_service(second_client, client).fetch_all_to_storage_resumable(
+        "raw", "events.parquet", store, limit=5
+    )
+    assert sorted(second_client.requested) == [4, 9]
+    assert checkpoint.compacted
+
+    df = StorageDataService(client, DataFormatService(), client.logger).download_df(
+        "raw", "events.parquet", format="parquet"
+    )
+    assert df["page"].tolist() == [page for page in range(1, 13) for _ in range(5)]
+    assert not any(key.startswith("events.parquet.parts/") for key in client.s3.buckets["raw"])
+
+
+def test_s3_checkpoint_store_round_trip():
+    client = InMemoryS3Client(logging.getLogger("test_resumable_ingestion"))
+    client.ensure_bucket("raw")
+    store = S3CheckpointStore(client, "raw", "_checkpoints/events.json")
+
+    checkpoint = store.load()
+    checkpoint.total_pages = 3
+    checkpoint.mark_completed(1, "events.parts/page-000001.csv")
+    checkpoint.mark_failed(2)
+    store.save(checkpoint)
+
+    loaded = store.load()
+    assert loaded.missing_pages() == [2, 3]
+    assert loaded.failed == {2}
+
+    store.clear()
+    assert store.load().total_pages is None
+
+
+class DriftingPagedClient(FlakyPagedClient):
+    """"score" is int on odd pages and float on even ones; "note" starts on page 7."""
+
+    def fetch_page(self, page, limit=1000):
+        result = super().fetch_page(page, limit)
+        for i, record in enumerate(result["data"]):
+            record["score"] = i if page % 2 else i + 0.5
+            if page >= 7:
+                record["note"] = f"p{page}"
+        return result
+
+
+def test_compaction_promotes_drifting_chunk_dtypes(tmp_path):
+    client = InMemoryS3Client(logging.getLogger("test_resumable_ingestion"))
+    client.ensure_bucket("raw")
+    storage = StorageDataService(client, DataFormatService(), client.logger)
+
+    for format in ("parquet", "csv"):
+        store = LocalCheckpointStore(tmp_path / f"{format}.json")
+        checkpoint = make_service(DriftingPagedClient(), client).fetch_all_to_storage_resumable(
+            "raw", f"events.{format}", store, format=format, limit=2
+        )
+
+        assert checkpoint.compacted
+        df = storage.download_df("raw", f"events.{format}", format=format)
+        assert str(df["score"].dtype) == "float64"
+        assert df["score"].tolist()[:4] == [0.0, 1.0, 0.5, 1.5]
+        assert df["note"].isna().sum() == 12 and df["note"].iloc[-1] == "p12"
@@ -0,0 +1,73 @@
+import io
+import logging
+import os
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.storage.clients.base_s3_client import MIN_PART_SIZE
+from src.storage.clients.memory_client import InMemoryS3Client
+
+
+def make_client():
+    client = InMemoryS3Client(logging.getLogger("test_s3_transfers"))
+    client.configure_transfers(part_size=MIN_PART_SIZE, max_workers=4, multipart_threshold=MIN_PART_SIZE)
+    client.ensure_bucket("bench")
+    return client
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_large_bytes_round_trip_multipart_and_ranged():
+    client = make_client()
+    data = os.urandom(3 * MIN_PART_SIZE + 123)
+
+    client.upload_bytes("bench", "blob.bin", data, content_type="application/octet-stream")
+
+    assert client.download_bytes("bench", "blob.bin") == data
+    assert not client.s3.uploads, "multipart upload should be completed"
+
+
+def test_fileobj_and_iterator_inputs():
+    client = make_client()
+    data = os.urandom(2 * MIN_PART_SIZE + 7)
+
+    client.upload_bytes("bench", "from_file.bin", io.BytesIO(data))
+    chunks = (data[i:i + 65536] for i in range(0, len(data), 65536))
+    client.upload_bytes("bench", "from_iter.bin", chunks)
+
+    out = io.BytesIO()
+    assert client.download_fileobj("bench", "from_file.bin", out) == len(data)
+    assert out.getvalue() == data
+    assert client.download_bytes("bench", "from_iter.bin") == data
+
+
+def test_small_and_empty_objects():
+    client = make_client()
+
+    client.upload_bytes("bench", "small.csv", b"a,b\n1,2\n")
+    client.upload_bytes("bench", "empty.csv", b"")
+
+    assert client.download_bytes("bench", "small.csv") == b"a,b\n1,2\n"
+    assert client.download_bytes("bench", "empty.csv") == b""
+
+
+def test_overwrite_during_ranged_download_is_detected():
+    client = make_client()
+    client.upload_bytes("bench", "blob.bin", os.urandom(2 * MIN_PART_SIZE))
+
+    chunks = client.iter_chunks("bench", "blob.bin", max_workers=1)
+    next(chunks)
+    client.upload_bytes("bench", "blob.bin", os.urandom(2 * MIN_PART_SIZE))
+
+    with pytest.raises(ClientError) as error:
+        list(chunks)
+    assert error.value.response["Error"]["Code"] == "PreconditionFailed"
+
+    reader = client.open_ranged("bench", "blob.bin")
+    reader.read(10)
+    client.upload_bytes("bench", "blob.bin", b"new version")
+    reader.seek(MIN_PART_SIZE)
+    with pytest.raises(ClientError):
+        reader.read(10)
@@ -0,0 +1,101 @@
+import logging
+
+import pandas as pd
+
+from src.api.api_data_service import ApiDataService
+from src.api.schema_registry import LocalSchemaStore, SchemaRegistry
+
+
+# -------------------------------
+# Fake API client (no network)
+# -------------------------------
+class DriftingApiClient:
+    """
+    "score" is all-null on page 1 and int/float afterwards, "qty" gains nulls
+    on page 2 and overflows Int8 on page 4, "note" is missing from page 3.
+    """
+
+    base_url = "http://fake/orders"
+
+    def iterate_all_pages(self, limit=1000, max_in_flight=None):
+        pages = {
+            1: [{"status": "open", "qty": 1, "score": None, "note": "a"},
+                {"status": "done", "qty": 2, "score": None, "note": "b"}],
+            2: [{"status": "open", "qty": None, "score": 3, "note": "c"},
+                {"status": "open", "qty": 4, "score": 4, "note": "d"}],
+            3: [{"status": "done", "qty": 5, "score": 0.5},
+                {"status": "open", "qty": 6, "score": 1.5}],
+            4: [{"status": "open", "qty": 1000, "score": 2.5, "note": "e"},
+                {"status": "new", "qty": 7, "score": 3.5, "note": "f"}],
+        }
+        for page, data in pages.items():
+            yield page, {"metadata": {"total_pages": len(pages)}, "data": data}
+
+
+def make_service(registry):
+    return ApiDataService(DriftingApiClient(), None, logging.getLogger("test_schema_registry"),
+                          schema_registry=registry)
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_learned_schema_keeps_compact_dtypes_across_pages(tmp_path):
+    registry = SchemaRegistry(LocalSchemaStore(tmp_path / "schemas.json"), sample_pages=3, narrow_integers=True)
+    df = make_service(registry).fetch_all_to_df()
+
+    assert len(df) == 8
+    assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+    assert set(df["status"].cat.categories) == {"open", "done", "new"}
+    assert str(df["qty"].dtype) == "Int16"  # learned as Int8, widened by page 4
+    assert df["qty"].isna().sum() == 1
+    assert str(df["score"].dtype) == "float64"
+    assert str(df["note"].dtype) == "string"
+    assert df["note"].isna().sum() == 2
+
+    reloaded = SchemaRegistry(LocalSchemaStore(tmp_path / "schemas.json"))
+    assert reloaded.get("http://fake/orders")["qty"] == "Int16"
+
+
+def test_registered_schema_is_used_without_learning():
+    registry = SchemaRegistry(sample_pages=3)
+    registry.register("http://fake/orders", {"status": "string", "qty": "Int64", "score": "float32"})
+
+    df = make_service(registry).fetch_all_to_df()
+
+    assert str(df["status"].dtype) == "string"
+    assert str(df["qty"].dtype) == "Int64"
+    assert str(df["score"].dtype) == "float32"
+    assert registry.get("http://fake/orders") == {"status": "string", "qty": "Int64", "score": "float32"}
+
+
+def test_learned_integers_default_to_int64_so_streamed_parquet_can_widen():
+    from src.storage.clients.memory_client import InMemoryS3Client
+    from src.storage.format.data_format_service import DataFormatService
+    from src.storage.services.storage_data_service import StorageDataService
+
+    logger = logging.getLogger("test_schema_registry")
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("raw")
+    storage = StorageDataService(client, DataFormatService(), logger)
+    registry = SchemaRegistry(sample_pages=3)
+    service = ApiDataService(DriftingApiClient(), storage, logger, schema_registry=registry)
+
+    service.fetch_all_to_storage(bucket="raw", key="orders.parquet", format="parquet", stream=True)
+
+    assert registry.get("http://fake/orders")["qty"] == "Int64"
+    df = storage.download_df("raw", "orders.parquet", format="parquet")
+    assert len(df) == 8
+    assert df["qty"].max() == 1000
+
+
+def test_pages_that_do_not_fit_the_schema_are_counted_and_logged(caplog):
+    registry = SchemaRegistry(sample_pages=3, logger=logging.getLogger("test_schema_registry"))
+    registry.register("http://fake/orders", {"status": "Int64"})
+
+    with caplog.at_level(logging.WARNING, logger="test_schema_registry"):
+        df = make_service(registry).fetch_all_to_df()
+
+    assert len(df) == 8
+    assert registry.cast_failures == {("http://fake/orders", "status"): 4}
+    assert "does not fit schema dtype Int64" in caplog.text
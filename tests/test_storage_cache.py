@@ -0,0 +1,110 @@
+import logging
+
+import pandas as pd
+
+from src.storage.cache.disk_cache import DiskCache
+from src.storage.cache.frame_cache import FrameCache
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+def make_client(tmp_path, max_bytes=10_000):
+    client = InMemoryS3Client(logging.getLogger("test_storage_cache"), cache=DiskCache(tmp_path, max_bytes=max_bytes))
+    client.ensure_bucket("ref")
+    return client
+
+
+def count_full_gets(client):
+    """Count get_object calls that actually transfer a body (not 304s)."""
+    calls = []
+    get_object = client.s3.get_object
+
+    def counting_get_object(**kwargs):
+        response = get_object(**kwargs)
+        calls.append(kwargs)
+        return response
+
+    client.s3.get_object = counting_get_object
+    return calls
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_disk_cache_serves_unchanged_objects(tmp_path):
+    client = make_client(tmp_path)
+    client.upload_bytes("ref", "countries.csv", b"code\nUS\nCA\n")
+    full_gets = count_full_gets(client)
+
+    assert client.download_bytes("ref", "countries.csv") == b"code\nUS\nCA\n"
+    assert client.download_bytes("ref", "countries.csv") == b"code\nUS\nCA\n"
+
+    assert len(full_gets) == 1
+    assert client.cache.hits == 1
+
+
+def test_disk_cache_revalidates_changed_objects(tmp_path):
+    client = make_client(tmp_path)
+    client.upload_bytes("ref", "countries.csv", b"code\nUS\n")
+    client.download_bytes("ref", "countries.csv")
+
+    client.upload_bytes("ref", "countries.csv", b"code\nUS\nMX\n")
+
+    assert client.download_bytes("ref", "countries.csv") == b"code\nUS\nMX\n"
+    assert client.cache.get("ref", "countries.csv")[1] == b"code\nUS\nMX\n"
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    client = make_client(tmp_path, max_bytes=2500)
+    for name in ("a", "b", "c"):
+        client.upload_bytes("ref", name, name.encode() * 1000)
+        client.download_bytes("ref", name)
+
+    assert client.cache.get("ref", "a") is None
+    assert client.cache.get("ref", "c") is not None
+    assert client.cache.size_bytes() <= 2500
+
+
+def test_frame_cache_skips_download_and_parse(tmp_path):
+    client = make_client(tmp_path)
+    storage = StorageDataService(client, DataFormatService(), client.logger, frame_cache=FrameCache())
+    df = pd.DataFrame({"code": ["US", "CA"], "rank": [1, 2]})
+    storage.upload_df(df, bucket="ref", key="countries.parquet", format="parquet")
+    full_gets = count_full_gets(client)
+
+    first = storage.download_df("ref", "countries.parquet", format="parquet")
+    second = storage.download_df("ref", "countries.parquet", format="parquet")
+
+    pd.testing.assert_frame_equal(first, df)
+    pd.testing.assert_frame_equal(second, df)
+    assert len(full_gets) == 1
+    assert storage.frame_cache.hits == 1
+
+
+def test_frame_cache_keys_on_the_downloaded_version(tmp_path):
+    client = InMemoryS3Client(logging.getLogger("test_storage_cache"))
+    client.ensure_bucket("ref")
+    storage = StorageDataService(client, DataFormatService(), client.logger, frame_cache=FrameCache())
+    old = pd.DataFrame({"code": ["US"]})
+    new = pd.DataFrame({"code": ["CA", "MX"]})
+    storage.upload_df(old, bucket="ref", key="countries.csv", format="csv")
+
+    # The object is overwritten between the ETag HEAD and the GET
+    head_object = client.s3.head_object
+
+    def racing_head_object(**kwargs):
+        response = head_object(**kwargs)
+        client.s3.head_object = head_object
+        storage.upload_df(new, bucket="ref", key="countries.csv", format="csv")
+        return response
+
+    client.s3.head_object = racing_head_object
+    pd.testing.assert_frame_equal(storage.download_df("ref", "countries.csv", format="csv"), new)
+
+    pd.testing.assert_frame_equal(storage.download_df("ref", "countries.csv", format="csv"), new)
+    assert storage.frame_cache.hits == 1
+
+    # Restoring the old content restores its ETag: it must not map to the new frame
+    storage.upload_df(old, bucket="ref", key="countries.csv", format="csv")
+    pd.testing.assert_frame_equal(storage.download_df("ref", "countries.csv", format="csv"), old)
@@ -0,0 +1,165 @@
+import io
+import logging
+
+import pandas as pd
+import pytest
+
+from src.api.api_data_service import STREAM_SCHEMA_SAMPLE_PAGES, ApiDataService
+from src.storage.clients.memory_client import InMemoryS3Client
+from src.storage.format.data_format_service import DataFormatService
+from src.storage.services.storage_data_service import StorageDataService
+
+
+# -------------------------------
+# Fake API client (no network)
+# -------------------------------
+class FakeApiClient:
+    def __init__(self, total_pages=40, page_size=2000):
+        self.total_pages = total_pages
+        self.page_size = page_size
+
+    def iterate_all_pages(self, limit=1000, max_in_flight=None):
+        for page in range(1, self.total_pages + 1):
+            data = [
+                {"id": f"{page}-{i}", "value": page * i, "label": "x" * 80}
+                for i in range(self.page_size)
+            ]
+            yield page, {"metadata": {"total_pages": self.total_pages}, "data": data}
+
+
+def make_service():
+    logger = logging.getLogger("test_streaming_ingestion")
+    client = InMemoryS3Client(logger)
+    client.ensure_bucket("raw")
+    storage = StorageDataService(client, DataFormatService(), logger)
+    return client, storage, ApiDataService(FakeApiClient(), storage, logger)
+
+
+# -------------------------------
+# Test cases
+# -------------------------------
+def test_stream_csv_uses_multipart_and_round_trips():
+    client, storage, service = make_service()
+    part_numbers = []
+    upload_part = client.s3.upload_part
+
+    def counting_upload_part(**kwargs):
+        part_numbers.append(kwargs["PartNumber"])
+        return upload_part(**kwargs)
+
+    client.s3.upload_part = counting_upload_part
+    service.fetch_all_to_storage(
+        bucket="raw", key="data.csv", format="csv", stream=True, part_size=5 * 1024 * 1024
+    )
+
+    assert len(part_numbers) > 1
+
+    expected = service.fetch_all_to_df()
+    df = storage.download_df("raw", "data.csv", format="csv")
+    assert len(df) == 40 * 2000
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_stream_parquet_round_trips():
+    client, storage, service = make_service()
+
+    service.fetch_all_to_storage(bucket="raw", key="data.parquet", format="parquet", stream=True)
+
+    df = storage.download_df("raw", "data.parquet", format="parquet")
+    pd.testing.assert_frame_equal(df, service.fetch_all_to_df())
+
+
+def test_stream_json_round_trips():
+    client, storage, service = make_service()
+
+    service.fetch_all_to_storage(bucket="raw", key="data.json", format="json", stream=True)
+
+    raw = client.download_bytes("raw", "data.json")
+    assert len(pd.read_json(io.BytesIO(raw))) == 40 * 2000
+
+
+class DriftingPagesClient:
+    """Pages whose "score" column is all-null at first, then typed by `later`."""
+
+    def __init__(self, later):
+        self.later = later
+
+    def iterate_all_pages(self, limit=1000, max_in_flight=None):
+        yield 1, {"data": [{"id": i, "score": None} for i in range(3)]}
+        yield 2, {"data": [{"id": i, "score": self.later(i)} for i in range(3, 6)]}
+        yield 3, {"data": [{"id": i, "score": None} for i in range(6, 9)]}
+
+
+def test_stream_parquet_promotes_columns_null_on_the_first_page():
+    client, storage, _ = make_service()
+    service = ApiDataService(DriftingPagesClient(lambda i: i * 1.5), storage, logging.getLogger("test_streaming_ingestion"))
+
+    for engine in ("pandas", "arrow"):
+        service.fetch_all_to_storage(bucket="raw", key=f"{engine}.parquet", format="parquet", stream=True, engine=engine)
+
+        df = storage.download_df("raw", f"{engine}.parquet", format="parquet")
+        assert df["score"].tolist()[3:6] == [4.5, 6.0, 7.5]
+        assert df["score"].isna().sum() == 6
+
+
+def test_stream_schema_conflict_is_logged_and_nothing_is_written(caplog):
+    client, storage, _ = make_service()
+    pages = [{"data": [{"id": 1, "score": 1}]}, {"data": [{"id": 2, "score": "high"}]}]
+
+    class ConflictingClient:
+        def iterate_all_pages(self, limit=1000, max_in_flight=None):
+            yield from enumerate(pages, start=1)
+
+    service = ApiDataService(ConflictingClient(), storage, logging.getLogger("test_streaming_ingestion"))
+    with caplog.at_level(logging.ERROR):
+        service.fetch_all_to_storage(bucket="raw", key="data.parquet", format="parquet", stream=True)
+
+    assert "Failed to stream data to storage" in caplog.text
+    assert "data.parquet" not in client.s3.buckets["raw"]
+    assert not client.s3.uploads
+
+
+class PagesClient:
+    def __init__(self, *pages):
+        self.pages = pages
+
+    def iterate_all_pages(self, limit=1000, max_in_flight=None):
+        for page, data in enumerate(self.pages, start=1):
+            yield page, {"data": data}
+
+
+def test_stream_parquet_promotes_int_then_float_pages_for_both_engines():
+    client, storage, _ = make_service()
+    pages = PagesClient([{"id": 1, "score": 1}], [{"id": 2, "score": 1.5}])
+    service = ApiDataService(pages, storage, logging.getLogger("test_streaming_ingestion"))
+
+    for engine in ("pandas", "arrow"):
+        service.fetch_all_to_storage(bucket="raw", key=f"{engine}.parquet", format="parquet", stream=True, engine=engine)
+
+        df = storage.download_df("raw", f"{engine}.parquet", format="parquet")
+        assert df["score"].tolist() == [1.0, 1.5]
+
+
+@pytest.mark.parametrize("format", ["csv", "parquet"])
+def test_stream_keeps_columns_that_appear_after_the_first_page(format):
+    client, storage, _ = make_service()
+    pages = PagesClient([{"id": 1}], [{"id": 2, "note": "late"}])
+    service = ApiDataService(pages, storage, logging.getLogger("test_streaming_ingestion"))
+
+    service.fetch_all_to_storage(bucket="raw", key=f"data.{format}", format=format, stream=True)
+
+    df = storage.download_df("raw", f"data.{format}", format=format)
+    assert list(df.columns) == ["id", "note"]
+    assert df["note"].isna().tolist() == [True, False]
+
+
+def test_stream_column_after_the_sample_is_an_error_not_dropped(caplog):
+    client, storage, _ = make_service()
+    pages = [[{"id": page}] for page in range(1, STREAM_SCHEMA_SAMPLE_PAGES + 1)] + [[{"id": 0, "note": "late"}]]
+    service = ApiDataService(PagesClient(*pages), storage, logging.getLogger("test_streaming_ingestion"))
+
+    with caplog.at_level(logging.ERROR):
+        service.fetch_all_to_storage(bucket="raw", key="data.csv", format="csv", stream=True)
+
+    assert "Columns ['note'] first appear after" in caplog.text
+    assert "data.csv" not in client.s3.buckets["raw"]